@@ -11,13 +11,19 @@ from .interactive import InteractiveHawcClient
 from .invitro import InvitroClient
 from .literature import LiteratureClient
 from .riskofbias import RiskOfBiasClient
-from .session import HawcSession
+from .session import AsyncHawcSession, HawcSession
 from .study import StudyClient
 from .summary import SummaryClient
 from .vocab import VocabClient
 
 __version__ = "2024.2"
-__all__ = ["BaseClient", "HawcClient", "HawcClientException", "HawcServerException"]
+__all__ = [
+    "AsyncHawcClient",
+    "BaseClient",
+    "HawcClient",
+    "HawcClientException",
+    "HawcServerException",
+]
 
 
 class HawcClient(BaseClient):
@@ -26,6 +32,8 @@ class HawcClient(BaseClient):
 
     Usage:
         client = HawcClient("https://hawcproject.org")
+        # To fetch paginated responses 4 pages at a time...
+        client = HawcClient("https://hawcproject.org", workers=4)
         # If authentication is needed...
         client.authenticate("username","password")
         # To make requests...
@@ -35,8 +43,13 @@ class HawcClient(BaseClient):
         animal, epi, epimeta, invitro, lit, riskofbias, summary
     """
 
-    def __init__(self, root_url: str = "https://hawcproject.org"):
-        super().__init__(HawcSession(root_url))
+    def __init__(
+        self,
+        root_url: str = "https://hawcproject.org",
+        workers: int = 1,
+        session: HawcSession | None = None,
+    ):
+        super().__init__(session or HawcSession(root_url, workers=workers))
 
         self.animal = AnimalClient(self.session)
         self.assessment = AssessmentClient(self.session)
@@ -95,3 +108,45 @@ class HawcClient(BaseClient):
 
         """
         return InteractiveHawcClient(client=self, headless=headless, timeout=timeout)
+
+
+class AsyncHawcClient(HawcClient):
+    """
+    HAWC Client for use with asyncio.
+
+    All namespaces of the `HawcClient` are available; their methods are synchronous, and
+    `call` runs them concurrently in worker threads on a shared connection pool. At most
+    `max_concurrency` requests are in flight at once, and server errors and rate-limited
+    responses are retried with jittered backoff.
+
+    Usage:
+        client = AsyncHawcClient("https://hawcproject.org", max_concurrency=8)
+        await client.async_session.set_authentication_token(token)
+        # To make requests concurrently...
+        references = await asyncio.gather(
+            *(client.call(client.lit.references, assessment_id) for assessment_id in ids)
+        )
+    """
+
+    def __init__(
+        self,
+        root_url: str = "https://hawcproject.org",
+        max_concurrency: int = 8,
+        retries: int = 3,
+    ):
+        self.async_session = AsyncHawcSession(root_url, max_concurrency, retries)
+        super().__init__(root_url, session=self.async_session.sync)
+
+    async def call(self, method, *args, **kwargs):
+        """
+        Call a client method concurrently.
+
+        Args:
+            method: a client method, for example `client.lit.references`
+            *args: positional arguments for the method
+            **kwargs: keyword arguments for the method
+
+        Returns:
+            The method result
+        """
+        return await self.async_session.run(method, *args, **kwargs)
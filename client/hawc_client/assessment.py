@@ -1,8 +1,11 @@
+import time
 from urllib.parse import urlencode
 
+import pandas as pd
 from requests import Response
 
 from .client import BaseClient
+from .exceptions import HawcClientException
 
 
 class AssessmentClient(BaseClient):
@@ -127,3 +130,45 @@ class AssessmentClient(BaseClient):
         if name:
             url += "?" + urlencode({"name": name})
         return self.session.get(url).json()
+
+    def export(
+        self,
+        assessment_id: int,
+        job: str,
+        kwargs: dict | None = None,
+        timeout: float = 600,
+        poll_interval: float = 2,
+    ) -> pd.DataFrame:
+        """Run an export as a background job on the server, and return the result.
+
+        Identical exports requested within a short period of time reuse the same job.
+
+        Args:
+            assessment_id (int): Assessment ID
+            job (str): Export job type; one of ANIMAL_EXPORT, EPI_EXPORT, LITERATURE_EXPORT,
+                or DATA_PIVOT_EXPORT
+            kwargs (dict, optional): Export arguments; `{"published_only": False}` for animal
+                and epi exports of unpublished data, or `{"data_pivot_id": <id>}` for data pivots
+            timeout (float, optional): Seconds to wait for the job to complete; defaults to 600
+            poll_interval (float, optional): Seconds between status checks; defaults to 2
+
+        Raises:
+            HawcClientException: If the job fails or does not complete before the timeout
+
+        Returns:
+            pd.DataFrame: The exported data
+        """
+        url = f"{self.session.root_url}/assessment/api/job/"
+        payload = {"assessment": assessment_id, "job": job, "kwargs": kwargs or {}}
+        data = self.session.post(url, payload).json()
+        detail_url = f"{url}{data['task_id']}/"
+        deadline = time.monotonic() + timeout
+        while data["status"] == "PENDING":
+            if time.monotonic() > deadline:
+                raise HawcClientException(408, f"Job {data['task_id']} did not complete")
+            time.sleep(poll_interval)
+            data = self.session.get(detail_url).json()
+        if data["status"] == "FAILURE":
+            raise HawcClientException(500, data["result"].get("error"))
+        response = self.session.get(f"{detail_url}download/", params={"format": "csv"})
+        return self._csv_to_df(response.text)
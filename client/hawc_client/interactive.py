@@ -1,6 +1,9 @@
+import asyncio
 import time
+from collections.abc import Callable, Iterable
 from io import BytesIO
 from pathlib import Path
+from typing import NamedTuple
 
 from playwright._impl._api_structures import SetCookieParam
 from playwright.async_api import Page, TimeoutError, expect
@@ -57,7 +60,7 @@ async def get_svg_image(page, timeout_ms) -> BytesIO:
         raise ContentUnavailable(400, error_text)
 
     # wait 1 second; the tagtree has startup animations
-    time.sleep(1)
+    await asyncio.sleep(1)
 
     await download_button.click()
     async with page.expect_download() as download_info:
@@ -119,6 +122,19 @@ def write_to_file(data: BytesIO, path: PathLike) -> None:
     path.write_bytes(data.getvalue())
 
 
+class DownloadResult(NamedTuple):
+    """The result of downloading one visual or data pivot in a batch."""
+
+    url: str
+    path: Path
+    seconds: float
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class InteractiveHawcClient:
     """
     A context manager for downloading assessment visuals.
@@ -160,6 +176,17 @@ class InteractiveHawcClient:
         await self.context.close()
         await self.playwright.stop()
 
+    async def _download(self, page: Page, url: str, fn: PathLike = None) -> BytesIO:
+        # ensure response is OK before waiting
+        response = await page.goto(url)
+        if response and not response.ok:
+            raise HawcClientException(response.status, response.status_text)
+        # attempt to fetch PNG
+        page.set_default_timeout(self.timeout)
+        data = await fetch_png(page, self.timeout)
+        write_to_file(data, fn)
+        return data
+
     async def download_visual(self, id: int, fn: PathLike = None) -> BytesIO:
         """Download a PNG visualization given a visual ID
 
@@ -172,14 +199,7 @@ class InteractiveHawcClient:
             BytesIO: the PNG representation of the visual, in bytes.
         """
         url = f"{self.client.session.root_url}/summary/visual/{id}/"
-        # ensure response is OK before waiting
-        response = await self.page.goto(url)
-        if response and not response.ok:
-            raise HawcClientException(response.status, response.status_text)
-        self.page.set_default_timeout(self.timeout)
-        data = await fetch_png(self.page, self.timeout)
-        write_to_file(data, fn)
-        return data
+        return await self._download(self.page, url, fn)
 
     async def download_data_pivot(self, id: int, fn: PathLike = None) -> BytesIO:
         """Download a PNG data pivot given a data pivot ID
@@ -193,12 +213,63 @@ class InteractiveHawcClient:
             BytesIO: the PNG representation of the data pivot, in bytes.
         """
         url = f"{self.client.session.root_url}/summary/data-pivot/{id}/"
-        # ensure response is OK before waiting
-        response = await self.page.goto(url)
-        if response and not response.ok:
-            raise HawcClientException(response.status, response.status_text)
-        # attempt to fetch PNG
-        self.page.set_default_timeout(self.timeout)
-        data = await fetch_png(self.page, self.timeout)
-        write_to_file(data, fn)
-        return data
+        return await self._download(self.page, url, fn)
+
+    async def download_many(
+        self,
+        directory: Path | str,
+        visual_ids: Iterable[int] = (),
+        data_pivot_ids: Iterable[int] = (),
+        concurrency: int = 4,
+        callback: Callable[[DownloadResult], None] | None = None,
+    ) -> list[DownloadResult]:
+        """Download many visuals and data pivots concurrently, writing each PNG as it completes.
+
+        Items are rendered on a pool of browser pages sharing the authenticated session. A
+        failed item is recorded in its result and does not stop the batch.
+
+        Args:
+            directory (Path | str): Directory to write PNGs to, created if needed; files are
+                named `visual-{id}.png` and `data-pivot-{id}.png`.
+            visual_ids (Iterable[int]): Visual IDs to download
+            data_pivot_ids (Iterable[int]): Data pivot IDs to download
+            concurrency (int): Number of browser pages rendering at once; defaults to 4
+            callback (Callable, optional): Called with each result as it completes
+
+        Returns:
+            list[DownloadResult]: results, with visuals then data pivots in the order given
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        root_url = self.client.session.root_url
+        items = [
+            (f"{root_url}/summary/visual/{id}/", directory / f"visual-{id}.png")
+            for id in visual_ids
+        ] + [
+            (f"{root_url}/summary/data-pivot/{id}/", directory / f"data-pivot-{id}.png")
+            for id in data_pivot_ids
+        ]
+        pages: asyncio.Queue[Page] = asyncio.Queue()
+        for _ in range(min(concurrency, len(items))):
+            pages.put_nowait(await self.context.new_page())
+
+        async def download(url: str, path: Path) -> DownloadResult:
+            page = await pages.get()
+            start = time.perf_counter()
+            try:
+                await self._download(page, url, path)
+                result = DownloadResult(url, path, time.perf_counter() - start)
+            except Exception as err:
+                error = f"{type(err).__name__}: {err}"
+                result = DownloadResult(url, path, time.perf_counter() - start, error)
+            finally:
+                pages.put_nowait(page)
+            if callback:
+                callback(result)
+            return result
+
+        try:
+            return await asyncio.gather(*(download(url, path) for url, path in items))
+        finally:
+            while not pages.empty():
+                await pages.get_nowait().close()
@@ -1,23 +1,54 @@
+import asyncio
 import json
 import math
-from collections.abc import Generator
+import random
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
+import pandas as pd
 from requests import Response, Session
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 
 from .exceptions import HawcClientException, HawcServerException
 
+# responses which are retried; only rate-limited requests are retried for POST and PATCH
+RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+NON_IDEMPOTENT_RETRY_STATUS_CODES = frozenset([429])
+
 
 class HawcSession:
     """
     A session that handles HAWC requests and responses.
 
     Allows user authentication and keeps track of root url.
+
+    Paginated responses are fetched `workers` pages at a time; by default, one page at a time.
+    Server errors and rate-limited responses are retried up to `retries` times, with jittered
+    exponential backoff; by default, they are not retried.
     """
 
-    def __init__(self, root_url: str = "https://hawcproject.org"):
+    def __init__(
+        self,
+        root_url: str = "https://hawcproject.org",
+        workers: int = 1,
+        retries: int = 0,
+        backoff: float = 0.5,
+    ):
         self.root_url = root_url
+        self.workers = workers
+        self.retries = retries
+        self.backoff = backoff
         self._session = Session()
+        # pool enough connections for concurrent page requests
+        adapter = HTTPAdapter(pool_maxsize=max(workers, 10))
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def _handle_hawc_response(self, response: Response) -> None:
         """
@@ -39,6 +70,25 @@ class HawcSession:
         elif response.status_code >= 500 and response.status_code < 600:
             raise HawcServerException(response.status_code, "no additional information provided")
 
+    def _get_retry_delay(self, attempt: int, response: Response) -> float:
+        # honor a Retry-After header in seconds; else exponential backoff with full jitter
+        try:
+            return float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            return random.uniform(0, self.backoff * 2**attempt)  # noqa: S311
+
+    def _request(self, method: str, url: str, **kwargs) -> Response:
+        status_codes = (
+            NON_IDEMPOTENT_RETRY_STATUS_CODES if method in ("POST", "PATCH") else RETRY_STATUS_CODES
+        )
+        for attempt in range(self.retries + 1):
+            response = self._session.request(method, url, **kwargs)
+            if response.status_code not in status_codes or attempt == self.retries:
+                break
+            time.sleep(self._get_retry_delay(attempt, response))
+        self._handle_hawc_response(response)
+        return response
+
     def get(self, url: str, params: dict | None = None) -> Response:
         """
         Sends a GET request using the session instance
@@ -50,9 +100,7 @@ class HawcSession:
         Returns:
             Response: The response.
         """
-        response = self._session.get(url=url, params=params)
-        self._handle_hawc_response(response)
-        return response
+        return self._request("GET", url, params=params)
 
     def delete(self, url: str, params: dict | None = None) -> Response:
         """
@@ -65,9 +113,7 @@ class HawcSession:
         Returns:
             Response: The response.
         """
-        response = self._session.delete(url=url, params=params)
-        self._handle_hawc_response(response)
-        return response
+        return self._request("DELETE", url, params=params)
 
     def post(self, url: str, data: dict | None = None) -> Response:
         """
@@ -80,9 +126,7 @@ class HawcSession:
         Returns:
             Response: The response.
         """
-        response = self._session.post(url=url, json=data)
-        self._handle_hawc_response(response)
-        return response
+        return self._request("POST", url, json=data)
 
     def patch(self, url: str, data: dict | None = None) -> Response:
         """
@@ -95,9 +139,7 @@ class HawcSession:
         Returns:
             Response: The response.
         """
-        response = self._session.patch(url=url, json=data)
-        self._handle_hawc_response(response)
-        return response
+        return self._request("PATCH", url, json=data)
 
     def authenticate(self, email: str, password: str):
         """
@@ -138,13 +180,21 @@ class HawcSession:
             self._session.headers.pop("Authorization")
         return response["valid"]
 
-    def iter_pages(self, url: str, params: dict | None = None) -> Generator:
+    def iter_pages(
+        self, url: str, params: dict | None = None, workers: int | None = None
+    ) -> Generator:
         """
         Generator that crawls paginated HAWC responses.
 
+        If more than one worker is used, page numbers are computed from the total count on the
+        first page, and the remaining pages are fetched concurrently; pages are always yielded
+        in order.
+
         Args:
             url (str): URL for GET request.
             params (dict, optional): GET parameters to include. Defaults to None.
+            workers (int, optional): Number of pages to fetch concurrently. Defaults to the
+                session `workers`.
 
         Returns:
             Generator: Generator for paginated response
@@ -152,6 +202,8 @@ class HawcSession:
         Yields:
             Generator: Results for a page of response
         """
+        if workers is None:
+            workers = self.workers
         response_json = self.get(url, params).json()
         yield response_json["results"]
         # Prevents divide by zero if there are no results
@@ -159,7 +211,282 @@ class HawcSession:
             return
         num_pages = math.ceil(response_json["count"] / len(response_json["results"]))
         with tqdm(desc="Iterating pages", initial=1, total=num_pages) as progress_bar:
+            if workers > 1:
+                pages = self._iter_pages_concurrent(url, params, num_pages, workers)
+                for results in pages:
+                    progress_bar.update(1)
+                    yield results
+                return
             while response_json["next"] is not None:
                 response_json = self.get(response_json["next"]).json()
                 progress_bar.update(1)
                 yield response_json["results"]
+
+    def _iter_pages_concurrent(
+        self, url: str, params: dict | None, num_pages: int, workers: int
+    ) -> Generator:
+        # fetch pages 2 through num_pages, keeping at most `workers` requests in flight
+        def get_page(page: int) -> list:
+            return self.get(url, {**(params or {}), "page": page}).json()["results"]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pages = iter(range(2, num_pages + 1))
+            futures = deque(executor.submit(get_page, page) for page in islice(pages, workers))
+            while futures:
+                results = futures.popleft().result()
+                if (page := next(pages, None)) is not None:
+                    futures.append(executor.submit(get_page, page))
+                yield results
+
+    def iter_dataframes(
+        self, url: str, params: dict | None = None, workers: int | None = None
+    ) -> Generator[pd.DataFrame, None, None]:
+        """
+        Generator that crawls paginated HAWC responses, yielding a dataframe for each page.
+
+        Args:
+            url (str): URL for GET request.
+            params (dict, optional): GET parameters to include. Defaults to None.
+            workers (int, optional): Number of pages to fetch concurrently. Defaults to the
+                session `workers`.
+
+        Yields:
+            pd.DataFrame: Results for a page of response
+        """
+        for results in self.iter_pages(url, params, workers):
+            if results:
+                yield pd.DataFrame(results)
+
+    def get_dataframe(
+        self, url: str, params: dict | None = None, workers: int | None = None
+    ) -> pd.DataFrame:
+        """
+        Get all results of a paginated HAWC response as a dataframe.
+
+        Each page is converted to a dataframe as it arrives, so the JSON for all pages is not
+        held in memory at once.
+
+        Args:
+            url (str): URL for GET request.
+            params (dict, optional): GET parameters to include. Defaults to None.
+            workers (int, optional): Number of pages to fetch concurrently. Defaults to the
+                session `workers`.
+
+        Returns:
+            pd.DataFrame: All results
+        """
+        dfs = list(self.iter_dataframes(url, params, workers))
+        return pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
+
+    def write_parquet(
+        self, url: str, path: str | Path, params: dict | None = None, workers: int | None = None
+    ) -> Path:
+        """
+        Write all results of a paginated HAWC response to a Parquet file, one page at a time.
+
+        Requires `pyarrow`. Pages are spooled to temporary Arrow files, so the schema can be
+        built from all pages; for example, a field which is null on the first page takes its
+        type from later pages.
+
+        Args:
+            url (str): URL for GET request.
+            path (str | Path): Parquet file path to write.
+            params (dict, optional): GET parameters to include. Defaults to None.
+            workers (int, optional): Number of pages to fetch concurrently. Defaults to the
+                session `workers`.
+
+        Returns:
+            Path: The Parquet file path
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        from pyarrow import feather
+
+        path = Path(path)
+        with TemporaryDirectory() as tmp:
+            pages, schemas = [], []
+            for i, df in enumerate(self.iter_dataframes(url, params, workers)):
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                pages.append(Path(tmp) / f"{i}.arrow")
+                schemas.append(table.schema)
+                feather.write_feather(table, pages[-1], compression="uncompressed")
+            if not pages:
+                pq.write_table(pa.table({}), path)
+                return path
+            schema = pa.unify_schemas(schemas, promote_options="permissive")
+            with pq.ParquetWriter(path, schema) as writer:
+                for page in pages:
+                    table = feather.read_table(page)
+                    columns = [
+                        table[field.name].cast(field.type)
+                        if field.name in table.column_names
+                        else pa.nulls(table.num_rows, field.type)
+                        for field in schema
+                    ]
+                    writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+        return path
+
+
+class AsyncHawcSession:
+    """
+    An asyncio session that handles HAWC requests and responses.
+
+    Mirrors the `HawcSession` interface with coroutines. Requests are sent on a wrapped
+    `HawcSession`, in worker threads, over one pooled keep-alive connection pool; at most
+    `max_concurrency` requests are in flight at once. Server errors and rate-limited responses
+    are retried with jittered exponential backoff.
+
+    Synchronous sub-clients (for example, `LiteratureClient`) can be used concurrently on top of
+    this session using `run`, or by using an `AsyncHawcClient`.
+    """
+
+    def __init__(
+        self,
+        root_url: str = "https://hawcproject.org",
+        max_concurrency: int = 8,
+        retries: int = 3,
+        backoff: float = 0.5,
+    ):
+        # pages are fetched one at a time within each call, so that `max_concurrency` bounds
+        # the requests in flight across all calls
+        self.sync = HawcSession(root_url, workers=1, retries=retries, backoff=backoff)
+        adapter = HTTPAdapter(pool_maxsize=max(max_concurrency, 10))
+        self.sync._session.mount("http://", adapter)
+        self.sync._session.mount("https://", adapter)
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @property
+    def root_url(self) -> str:
+        return self.sync.root_url
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """
+        Run a synchronous function in a worker thread, counting against the concurrency limit.
+
+        Args:
+            func (Callable): function to run, for example a sub-client method
+            *args: positional arguments for the function
+            **kwargs: keyword arguments for the function
+
+        Returns:
+            The function result
+        """
+        async with self._semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def get(self, url: str, params: dict | None = None) -> Response:
+        """
+        Sends a GET request using the session instance
+
+        Args:
+            url (str): URL for request.
+            params (dict, optional): Additional parameters to include. Defaults to None.
+
+        Returns:
+            Response: The response.
+        """
+        return await self.run(self.sync.get, url, params)
+
+    async def delete(self, url: str, params: dict | None = None) -> Response:
+        """
+        Sends a DELETE request using the session instance
+
+        Args:
+            url (str): URL for request.
+            params (dict, optional): Additional parameters to include. Defaults to None.
+
+        Returns:
+            Response: The response.
+        """
+        return await self.run(self.sync.delete, url, params)
+
+    async def post(self, url: str, data: dict | None = None) -> Response:
+        """
+        Sends a POST request using the session instance
+
+        Args:
+            url (str): URL for request.
+            data (dict, optional): Payload for the request.
+
+        Returns:
+            Response: The response.
+        """
+        return await self.run(self.sync.post, url, data)
+
+    async def patch(self, url: str, data: dict | None = None) -> Response:
+        """
+        Sends a PATCH request using the session instance
+
+        Args:
+            url (str): URL for request.
+            data (dict, optional): Payload for the request.
+
+        Returns:
+            Response: The response.
+        """
+        return await self.run(self.sync.patch, url, data)
+
+    async def authenticate(self, email: str, password: str):
+        """
+        Authenticate a user session
+
+        Args:
+            email (str): email to authenticate
+            password (str): password to authenticate
+        """
+        await self.run(self.sync.authenticate, email, password)
+
+    async def set_authentication_token(self, token: str, login: bool = False) -> bool:
+        """
+        Set authentication token for hawc client session.
+
+        Args:
+            token (str): authentication token from your user profile
+            login (bool, default False): if True, creates a django cookie-based session;
+                see `HawcSession.set_authentication_token`.
+
+        Returns
+            bool: Returns true if session is valid
+        """
+        return await self.run(self.sync.set_authentication_token, token, login)
+
+    async def iter_pages(self, url: str, params: dict | None = None) -> AsyncGenerator:
+        """
+        Asynchronous generator that crawls paginated HAWC responses.
+
+        Page numbers are computed from the total count on the first page, and the remaining
+        pages are fetched concurrently; pages are always yielded in order.
+
+        Args:
+            url (str): URL for GET request.
+            params (dict, optional): GET parameters to include. Defaults to None.
+
+        Yields:
+            list: Results for a page of response
+        """
+        response_json = (await self.get(url, params)).json()
+        yield response_json["results"]
+        # Prevents divide by zero if there are no results
+        if len(response_json["results"]) == 0:
+            return
+        num_pages = math.ceil(response_json["count"] / len(response_json["results"]))
+
+        async def get_page(page: int) -> list:
+            response = await self.get(url, {**(params or {}), "page": page})
+            return response.json()["results"]
+
+        # keep at most `max_concurrency` pages in flight, to bound memory use
+        pages = iter(range(2, num_pages + 1))
+        tasks = deque(
+            asyncio.create_task(get_page(page)) for page in islice(pages, self.max_concurrency)
+        )
+        try:
+            while tasks:
+                results = await tasks.popleft()
+                if (page := next(pages, None)) is not None:
+                    tasks.append(asyncio.create_task(get_page(page)))
+                yield results
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -14,7 +14,7 @@ from ..assessment.api import (
 )
 from ..assessment.constants import AssessmentViewSetPermissions
 from ..common.api.utils import get_published_only
-from ..common.helper import FlatExport, cacheable
+from ..common.helper import FlatExport, assessment_cache_key, cacheable
 from ..common.renderers import PandasRenderers
 from ..common.serializers import ExportQuerySerializer, UnusedSerializer
 from ..common.views import create_object_log
@@ -90,7 +90,9 @@ class AnimalAssessmentViewSet(BaseAssessmentViewSet):
         ser = ExportQuerySerializer(data=request.query_params)
         ser.is_valid(raise_exception=True)
         published_only = get_published_only(self.assessment, request)
-        key = f"assessment-{self.assessment.id}-bioassay-study-heatmap-unpublished-{not published_only}"
+        key = assessment_cache_key(
+            self.assessment.id, f"bioassay-study-heatmap-unpublished-{not published_only}"
+        )
 
         def func() -> pd.DataFrame:
             return models.Endpoint.heatmap_study_df(self.assessment, published_only=published_only)
@@ -115,7 +117,9 @@ class AnimalAssessmentViewSet(BaseAssessmentViewSet):
         ser = ExportQuerySerializer(data=request.query_params)
         ser.is_valid(raise_exception=True)
         published_only = get_published_only(self.assessment, request)
-        key = f"assessment-{self.assessment.id}-bioassay-endpoint-heatmap-unpublished-{not published_only}"
+        key = assessment_cache_key(
+            self.assessment.id, f"bioassay-endpoint-heatmap-unpublished-{not published_only}"
+        )
 
         def df_func() -> pd.DataFrame:
             return models.Endpoint.heatmap_df(self.assessment.id, published_only=published_only)
@@ -140,7 +144,9 @@ class AnimalAssessmentViewSet(BaseAssessmentViewSet):
         ser = ExportQuerySerializer(data=request.query_params)
         ser.is_valid(raise_exception=True)
         published_only = get_published_only(self.assessment, request)
-        key = f"assessment-{self.assessment.id}-bioassay-endpoint-doses-heatmap-unpublished-{not published_only}"
+        key = assessment_cache_key(
+            self.assessment.id, f"bioassay-endpoint-doses-heatmap-unpublished-{not published_only}"
+        )
 
         def df_func() -> pd.DataFrame:
             return models.Endpoint.heatmap_doses_df(self.assessment, published_only=published_only)
@@ -160,7 +166,9 @@ class AnimalAssessmentViewSet(BaseAssessmentViewSet):
         ser = ExportQuerySerializer(data=request.query_params)
         ser.is_valid(raise_exception=True)
         published_only = get_published_only(self.assessment, request)
-        key = f"assessment-{self.assessment.id}-bioassay-endpoint-list-unpublished-{not published_only}"
+        key = assessment_cache_key(
+            self.assessment.id, f"bioassay-endpoint-list-unpublished-{not published_only}"
+        )
 
         def df_func() -> pd.DataFrame:
             return models.Endpoint.objects.endpoint_df(
@@ -3,6 +3,7 @@ from collections import defaultdict
 
 import numpy as np
 import pandas as pd
+from django.conf import settings
 from django.db.models import CharField, F
 from django.db.models.functions import Cast
 from django.db.models.lookups import Exact
@@ -66,6 +67,68 @@ def percent_control(n_1, mu_1, sd_1, n_2, mu_2, sd_2):
     return mean, low, high
 
 
+def _t_ppf(dof: np.ndarray) -> np.ndarray:
+    # t-distribution quantiles, computed once per distinct degrees of freedom
+    unique, inverse = np.unique(dof, return_inverse=True)
+    return stats.t.ppf(0.975, unique)[inverse]
+
+
+def cont_ci_array(
+    stdev: np.ndarray, n: np.ndarray, response: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized `cont_ci`; returns arrays of lower and upper confidence intervals.
+    """
+    stdev, n, response = (np.asarray(arr, dtype=float) for arr in (stdev, n, response))
+    se = stdev / np.sqrt(n)
+    change = _t_ppf(np.maximum(n - 1, 1)) * se
+    return response - change, response + change
+
+
+def dich_ci_array(incidence: np.ndarray, n: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized `dich_ci`; returns arrays of lower and upper confidence intervals.
+    """
+    incidence, n = (np.asarray(arr, dtype=float) for arr in (incidence, n))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = incidence / n
+        z = stats.norm.ppf(1 - 0.05 / 2)
+        z2 = z * z
+        q = 1.0 - p
+        tmp1 = 2 * n * p + z2
+        lower_ci = ((tmp1 - 1) - z * np.sqrt(z2 - (2 + 1 / n) + 4 * p * (n * q + 1))) / (
+            2 * (n + z2)
+        )
+        upper_ci = ((tmp1 + 1) + z * np.sqrt(z2 + (2 + 1 / n) + 4 * p * (n * q - 1))) / (
+            2 * (n + z2)
+        )
+    return lower_ci, upper_ci
+
+
+def percent_control_array(
+    n_1: np.ndarray,
+    mu_1: np.ndarray,
+    sd_1: np.ndarray,
+    n_2: np.ndarray,
+    mu_2: np.ndarray,
+    sd_2: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized `percent_control`; returns arrays of mean, low, and high, where values which
+    cannot be calculated are NaN.
+    """
+    n_1, mu_1, sd_1, n_2, mu_2, sd_2 = (
+        np.asarray(arr, dtype=float) for arr in (n_1, mu_1, sd_1, n_2, mu_2, sd_2)
+    )
+    has_mean = (mu_1 > 0) & (mu_2 > 0)
+    has_ci = has_mean & (sd_1 != 0) & (sd_2 != 0) & (n_1 != 0) & (n_2 != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(has_mean, (mu_2 - mu_1) / mu_1 * 100.0, np.nan)
+        sd = np.sqrt(mu_1**-2 * ((sd_2**2 / n_2) + (mu_2**2 * sd_1**2) / (n_1 * mu_1**2)))
+        ci = np.where(has_ci, (1.96 * sd) * 100, np.nan)
+    return mean, mean - ci, mean + ci
+
+
 def maximum_percent_control_change(changes: list):
     """
     For each endpoint, return the maximum absolute-change percent control
@@ -82,6 +145,55 @@ def maximum_percent_control_change(changes: list):
     return val
 
 
+def _float(series: pd.Series) -> pd.Series:
+    # cast nullable object columns to float, where None is NaN
+    return pd.to_numeric(series, errors="coerce").astype(float)
+
+
+def add_stdev(df: pd.DataFrame) -> pd.DataFrame:
+    """Add endpoint-group standard deviation; vectorized form of EndpointGroup.stdev()."""
+    variance_type = df["endpoint-variance_type"]
+    variance = _float(df["endpoint_group-variance"])
+    n = _float(df["endpoint_group-n"])
+    df["endpoint_group-stdev"] = np.where(
+        variance_type == constants.VarianceType.SD,
+        variance,
+        np.where(variance_type == constants.VarianceType.SE, variance * np.sqrt(n), np.nan),
+    )
+    return df
+
+
+def add_confidence_intervals(df: pd.DataFrame) -> pd.DataFrame:
+    """Add confidence intervals to endpoint-groups where they were not reported.
+
+    Vectorized form of EndpointGroup.getConfidenceIntervals().
+    """
+    data_type = df["endpoint-data_type"]
+    lower_ci = _float(df["endpoint_group-lower_ci"])
+    upper_ci = _float(df["endpoint_group-upper_ci"])
+    n = _float(df["endpoint_group-n"])
+    response = _float(df["endpoint_group-response"])
+    stdev = _float(df["endpoint_group-stdev"])
+    incidence = _float(df["endpoint_group-incidence"])
+
+    needs_ci = lower_ci.isna() & upper_ci.isna() & (n > 0)
+    cont = (
+        needs_ci & (data_type == constants.DataType.CONTINUOUS) & response.notna() & stdev.notna()
+    ).to_numpy()
+    dich = (
+        needs_ci
+        & data_type.isin([constants.DataType.DICHOTOMOUS, constants.DataType.DICHOTOMOUS_CANCER])
+        & incidence.notna()
+    ).to_numpy()
+
+    lower_ci, upper_ci = lower_ci.to_numpy(copy=True), upper_ci.to_numpy(copy=True)
+    lower_ci[cont], upper_ci[cont] = cont_ci_array(stdev[cont], n[cont], response[cont])
+    lower_ci[dich], upper_ci[dich] = dich_ci_array(incidence[dich], n[dich])
+    df["endpoint_group-lower_ci"] = lower_ci
+    df["endpoint_group-upper_ci"] = upper_ci
+    return df
+
+
 class ExperimentExport(ModelExport):
     def get_value_map(self):
         return {
@@ -373,49 +485,10 @@ class EndpointGroupFlatComplete(FlatFileExporter):
         )
 
     def handle_stdev(self, df: pd.DataFrame) -> pd.DataFrame:
-        df["endpoint_group-stdev"] = df.apply(
-            lambda x: models.EndpointGroup.stdev(
-                x["endpoint-variance_type"],
-                x["endpoint_group-variance"],
-                x["endpoint_group-n"],
-            ),
-            axis="columns",
-        )
-        return df.drop(columns=["endpoint-variance_type"])
+        return add_stdev(df).drop(columns=["endpoint-variance_type"])
 
     def handle_ci(self, df: pd.DataFrame) -> pd.DataFrame:
-        def _func(row: pd.Series) -> pd.Series:
-            # logic used from EndpointGroup.getConfidenceIntervals()
-            data_type = row["endpoint-data_type"]
-            lower_ci = row["endpoint_group-lower_ci"]
-            upper_ci = row["endpoint_group-upper_ci"]
-            n = row["endpoint_group-n"]
-
-            response = row["endpoint_group-response"]
-            stdev = row["endpoint_group-stdev"]
-            incidence = row["endpoint_group-incidence"]
-            if lower_ci is not None or upper_ci is not None or n is None or n <= 0:
-                pass
-            elif (
-                data_type == constants.DataType.CONTINUOUS
-                and response is not None
-                and stdev is not None
-            ):
-                (
-                    row["endpoint_group-lower_ci"],
-                    row["endpoint_group-upper_ci"],
-                ) = cont_ci(stdev, n, response)
-            elif (
-                data_type in [constants.DataType.DICHOTOMOUS, constants.DataType.DICHOTOMOUS_CANCER]
-                and incidence is not None
-            ):
-                (
-                    row["endpoint_group-lower_ci"],
-                    row["endpoint_group-upper_ci"],
-                ) = dich_ci(incidence, n)
-            return row
-
-        return df.apply(_func, axis="columns").drop(columns=["endpoint_group-stdev"])
+        return add_confidence_intervals(df).drop(columns=["endpoint_group-stdev"])
 
     def build_df(self) -> pd.DataFrame:
         df = EndpointGroupFlatCompleteExporter().get_df(
@@ -424,7 +497,8 @@ class EndpointGroupFlatComplete(FlatFileExporter):
                 "animal_group__dosing_regime",
             )
             .prefetch_related("groups", "animal_group__dosing_regime__doses")
-            .order_by("id", "groups", "animal_group__dosing_regime__doses")
+            .order_by("id", "groups", "animal_group__dosing_regime__doses"),
+            chunk_size=settings.EXPORT_CHUNK_SIZE,
         )
         df = df[
             pd.isna(df["dose_group-id"])
@@ -566,99 +640,68 @@ class EndpointGroupFlatDataPivot(FlatFileExporter):
         return available_units[0]
 
     def handle_ci(self, df: pd.DataFrame) -> pd.DataFrame:
-        def _func(row: pd.Series) -> pd.Series:
-            # logic used from EndpointGroup.getConfidenceIntervals()
-            data_type = row["endpoint-data_type"]
-            lower_ci = row["endpoint_group-lower_ci"]
-            upper_ci = row["endpoint_group-upper_ci"]
-            n = row["endpoint_group-n"]
-
-            response = row["endpoint_group-response"]
-            stdev = row["endpoint_group-stdev"]
-            incidence = row["endpoint_group-incidence"]
-            if lower_ci is not None or upper_ci is not None or n is None or n <= 0:
-                pass
-            elif (
-                data_type == constants.DataType.CONTINUOUS
-                and response is not None
-                and stdev is not None
-            ):
-                (
-                    row["endpoint_group-lower_ci"],
-                    row["endpoint_group-upper_ci"],
-                ) = cont_ci(stdev, n, response)
-            elif (
-                data_type in [constants.DataType.DICHOTOMOUS, constants.DataType.DICHOTOMOUS_CANCER]
-                and incidence is not None
-            ):
-                (
-                    row["endpoint_group-lower_ci"],
-                    row["endpoint_group-upper_ci"],
-                ) = dich_ci(incidence, n)
-            return row
-
-        return df.apply(_func, axis="columns")
+        return add_confidence_intervals(df)
 
     def handle_stdev(self, df: pd.DataFrame) -> pd.DataFrame:
-        df["endpoint_group-stdev"] = df.apply(
-            lambda x: models.EndpointGroup.stdev(
-                x["endpoint-variance_type"],
-                x["endpoint_group-variance"],
-                x["endpoint_group-n"],
-            ),
-            axis="columns",
-        )
-        return df
+        return add_stdev(df)
 
     def handle_percent_control(self, df: pd.DataFrame) -> pd.DataFrame:
-        def _func(group_df: pd.DataFrame) -> pd.DataFrame:
-            control = group_df.iloc[0]
+        # logic used from EndpointGroup.percentControl(); the first group of each endpoint is
+        # the control
+        df = df.reset_index(drop=True)
+        groups = df.groupby("endpoint-id", sort=False)
+
+        data_type = df["endpoint-data_type"]
+        n = _float(df["endpoint_group-n"])
+        incidence = _float(df["endpoint_group-incidence"])
+        response = _float(df["endpoint_group-response"])
+        stdev = _float(df["endpoint_group-stdev"])
+        control = groups.cumcount().to_numpy() == 0
+        control_index = np.flatnonzero(control)[groups.ngroup().to_numpy()]
+
+        def _control(series: pd.Series) -> np.ndarray:
+            return series.to_numpy()[control_index]
+
+        mean = np.full(df.shape[0], np.nan)
+        low = np.full(df.shape[0], np.nan)
+        high = np.full(df.shape[0], np.nan)
+
+        cont = (data_type == constants.DataType.CONTINUOUS).to_numpy()
+        mean[cont], low[cont], high[cont] = percent_control_array(
+            _control(n)[cont],
+            _control(response)[cont],
+            _control(stdev)[cont],
+            n[cont],
+            response[cont],
+            stdev[cont],
+        )
 
-            data_type = control["endpoint-data_type"]
-            i_1 = control["endpoint_group-incidence"]
-            n_1 = control["endpoint_group-n"]
-            mu_1 = control["endpoint_group-response"]
-            sd_1 = control["endpoint_group-stdev"]
+        pd_ = (data_type == constants.DataType.PERCENT_DIFFERENCE).to_numpy()
+        mean[pd_] = response[pd_]
+        low[pd_] = _float(df["endpoint_group-lower_ci"])[pd_]
+        high[pd_] = _float(df["endpoint_group-upper_ci"])[pd_]
 
-            def __func(row: pd.Series) -> pd.Series:
-                # logic used from EndpointGroup.percentControl()
-                row["percent control mean"] = None
-                row["percent control low"] = None
-                row["percent control high"] = None
-                if data_type == constants.DataType.CONTINUOUS:
-                    n_2 = row["endpoint_group-n"]
-                    mu_2 = row["endpoint_group-response"]
-                    sd_2 = row["endpoint_group-stdev"]
-                    (
-                        row["percent control mean"],
-                        row["percent control low"],
-                        row["percent control high"],
-                    ) = percent_control(n_1, mu_1, sd_1, n_2, mu_2, sd_2)
-                elif data_type == constants.DataType.PERCENT_DIFFERENCE:
-                    row["percent control mean"] = row["endpoint_group-response"]
-                    row["percent control low"] = row["endpoint_group-lower_ci"]
-                    row["percent control high"] = row["endpoint_group-upper_ci"]
-                elif data_type == constants.DataType.DICHOTOMOUS:
-                    if i_1 and n_1:
-                        i_2 = row["endpoint_group-incidence"]
-                        n_2 = row["endpoint_group-n"]
-                        if n_2:
-                            row["percent control mean"] = (
-                                ((i_2 / n_2) - (i_1 / n_1)) / (i_1 / n_1) * 100
-                            )
-                return row
-
-            group_df = group_df.apply(__func, axis="columns")
-            group_df["maximum endpoint change"] = maximum_percent_control_change(
-                group_df["percent control mean"].dropna()
+        i_1, n_1 = _control(incidence), _control(n)
+        dich = (data_type == constants.DataType.DICHOTOMOUS).to_numpy() & (
+            (i_1 != 0) & (n_1 != 0) & (n != 0).to_numpy()
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean[dich] = (
+                ((incidence[dich] / n[dich]) - (i_1[dich] / n_1[dich]))
+                / (i_1[dich] / n_1[dich])
+                * 100
             )
-            return group_df
 
-        return (
-            df.groupby("endpoint-id", group_keys=False, sort=False)
-            .apply(_func)
-            .reset_index(drop=True)
-        )
+        df["percent control mean"] = mean
+        df["percent control low"] = low
+        df["percent control high"] = high
+
+        # maximum absolute change for each endpoint, or 0 if it cannot be calculated
+        means = df.groupby("endpoint-id", sort=False)["percent control mean"]
+        min_, max_ = means.transform("min"), means.transform("max")
+        df["maximum endpoint change"] = np.where(min_.abs() > max_.abs(), min_, max_)
+        df["maximum endpoint change"] = df["maximum endpoint change"].fillna(0)
+        return df
 
     def handle_animal_description(self, df: pd.DataFrame):
         def _func(group_df: pd.DataFrame) -> pd.Series:
@@ -797,7 +840,8 @@ class EndpointGroupFlatDataPivot(FlatFileExporter):
                 "animal_group__dosing_regime",
             )
             .prefetch_related("groups", "animal_group__dosing_regime__doses")
-            .order_by("id", "groups", "animal_group__dosing_regime__doses")
+            .order_by("id", "groups", "animal_group__dosing_regime__doses"),
+            chunk_size=settings.EXPORT_CHUNK_SIZE,
         )
         df = df[
             pd.isna(df["dose_group-id"])
@@ -1090,7 +1134,8 @@ class EndpointFlatDataPivot(EndpointGroupFlatDataPivot):
                 "animal_group__dosing_regime",
             )
             .prefetch_related("groups", "animal_group__dosing_regime__doses")
-            .order_by("id", "groups", "animal_group__dosing_regime__doses")
+            .order_by("id", "groups", "animal_group__dosing_regime__doses"),
+            chunk_size=settings.EXPORT_CHUNK_SIZE,
         )
         df = df[
             pd.isna(df["endpoint_group-id"])
@@ -1433,7 +1478,8 @@ class EndpointSummary(EndpointGroupFlatDataPivot):
                 "animal_group__dosing_regime",
             )
             .prefetch_related("groups", "animal_group__dosing_regime__doses")
-            .order_by("id", "groups", "animal_group__dosing_regime__doses")
+            .order_by("id", "groups", "animal_group__dosing_regime__doses"),
+            chunk_size=settings.EXPORT_CHUNK_SIZE,
         )
 
         df = df[
@@ -227,7 +227,7 @@ class JobAdmin(admin.ModelAdmin):
     )
     search_fields = ("task_id",)
     list_filter = ("status",)
-    readonly_fields = ("result",)
+    readonly_fields = ("result", "output")
 
 
 @admin.register(models.Communication)
@@ -6,7 +6,7 @@ from rest_framework import exceptions, permissions
 from rest_framework.request import Request
 
 from ...assessment.constants import AssessmentViewSetPermissions
-from ...assessment.models import Assessment
+from ...assessment.models import Assessment, Job
 from .helper import get_assessment_from_query
 
 logger = logging.getLogger(__name__)
@@ -124,13 +124,17 @@ class JobPermissions(permissions.BasePermission):
     """
     Requires admin permissions where jobs have no associated assessment
     or when part of a list, and assessment level permissions when jobs
-    have an associated assessment.
+    have an associated assessment. Export jobs may be created by any user
+    who can view the assessment; exports which include unpublished data
+    require team member permissions to create or view.
     """
 
     def has_object_permission(self, request, view, obj):
         if obj.assessment is None:
             return bool(request.user and request.user.is_staff)
         elif request.method in permissions.SAFE_METHODS:
+            if obj.requires_team_member():
+                return obj.assessment.user_is_team_member_or_higher(request.user)
             return obj.assessment.user_can_view_object(request.user)
         else:
             return obj.assessment.user_can_edit_object(request.user)
@@ -144,6 +148,8 @@ class JobPermissions(permissions.BasePermission):
             assessment = serializer.validated_data.get("assessment")
             if assessment is None:
                 return bool(request.user and request.user.is_staff)
+            elif serializer.validated_data["job"] in Job.EXPORT_JOBS:
+                return assessment.user_can_view_object(request.user)
             else:
                 return assessment.user_can_edit_object(request.user)
         else:
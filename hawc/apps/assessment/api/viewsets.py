@@ -7,7 +7,7 @@ from django.db.models import Count, Model
 from django.http import Http404
 from django.urls import reverse
 from django_filters.rest_framework.backends import DjangoFilterBackend
-from rest_framework import mixins, permissions, viewsets
+from rest_framework import mixins, permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.request import Request
@@ -20,11 +20,16 @@ from ...common.renderers import PandasRenderers
 from ...common.views import bulk_create_object_log, create_object_log
 from .. import models, serializers
 from ..actions.audit import AssessmentAuditSerializer
-from ..constants import AssessmentViewSetPermissions
+from ..constants import AssessmentViewSetPermissions, JobStatus
 from ..filterset import EffectTagFilterSet, GlobalChemicalsFilterSet
 from .filters import InAssessmentFilter
 from .helper import get_assessment_from_query
-from .permissions import AssessmentLevelPermissions, CleanupFieldsPermissions, user_can_edit_object
+from .permissions import (
+    AssessmentLevelPermissions,
+    CleanupFieldsPermissions,
+    JobPermissions,
+    user_can_edit_object,
+)
 
 # all http methods except PUT
 METHODS_NO_PUT = ["get", "post", "patch", "delete", "head", "options", "trace"]
@@ -581,3 +586,38 @@ class StrainViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
     pagination_class = None
     filter_backends = (DjangoFilterBackend,)
     filterset_fields = ("species",)
+
+
+class JobViewSet(
+    mixins.CreateModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.ListModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    Run a long-running task, such as a large export, in the background.
+
+    Create a job and poll its detail endpoint until the status is no longer pending; exports
+    which succeed can then be downloaded in any tabular format. Export jobs are reused for
+    identical requests until they expire.
+    """
+
+    permission_classes = (JobPermissions,)
+    serializer_class = serializers.JobSerializer
+    queryset = models.Job.objects.select_related("assessment")
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        code = status.HTTP_201_CREATED if serializer.created else status.HTTP_200_OK
+        return Response(serializer.data, status=code)
+
+    @action(detail=True, renderer_classes=PandasRenderers)
+    def download(self, request, pk: str):
+        job = self.get_object()
+        if job.status == JobStatus.PENDING:
+            raise ValidationError("Job has not completed.")
+        if not job.output:
+            raise Http404()
+        return Response(job.get_export())
@@ -62,6 +62,10 @@ class JobStatus(models.IntegerChoices):
 
 class JobType(models.IntegerChoices):
     TEST = 1, "TEST"
+    ANIMAL_EXPORT = 2, "ANIMAL_EXPORT"
+    EPI_EXPORT = 3, "EPI_EXPORT"
+    LITERATURE_EXPORT = 4, "LITERATURE_EXPORT"
+    DATA_PIVOT_EXPORT = 5, "DATA_PIVOT_EXPORT"
 
 
 class EpiVersion(models.IntegerChoices):
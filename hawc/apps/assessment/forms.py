@@ -653,7 +653,7 @@ class DatasetForm(forms.ModelForm):
         """
         instance = super().save(commit=commit)
         if self.cleaned_data.get("revision_data"):
-            models.DatasetRevision.objects.create(
+            revision = models.DatasetRevision.objects.create(
                 dataset=instance,
                 version=instance.get_new_version_value(),
                 data=self.cleaned_data["revision_data"],
@@ -661,6 +661,7 @@ class DatasetForm(forms.ModelForm):
                 excel_worksheet_name=self.cleaned_data["revision_excel_worksheet_name"],
                 notes=self.cleaned_data["revision_notes"],
             )
+            revision.write_columnar(self.revision_df)
         return instance
 
     class Meta:
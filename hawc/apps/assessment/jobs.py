@@ -1,4 +1,62 @@
+from django.apps import apps
+
+from ..common.helper import FlatExport
+
+
 def test(fail=False):
     if fail:
         raise Exception("FAILURE")
     return "SUCCESS"
+
+
+def animal_export(assessment_id: int, published_only: bool = True) -> FlatExport:
+    from ..animal.exports import EndpointGroupFlatComplete
+
+    assessment = apps.get_model("assessment", "Assessment").objects.get(id=assessment_id)
+    qs = (
+        apps.get_model("animal", "Endpoint")
+        .objects.get_qs(assessment)
+        .published_only(published_only)
+    )
+    exporter = EndpointGroupFlatComplete(
+        qs, filename=f"{assessment}-bioassay-complete", assessment=assessment
+    )
+    return exporter.build_export()
+
+
+def epi_export(assessment_id: int, published_only: bool = True) -> FlatExport:
+    from ..epi.exports import OutcomeComplete
+
+    assessment = apps.get_model("assessment", "Assessment").objects.get(id=assessment_id)
+    Outcome = apps.get_model("epi", "Outcome")
+    if published_only:
+        qs = Outcome.objects.published(assessment)
+    else:
+        qs = Outcome.objects.get_qs(assessment)
+    exporter = OutcomeComplete(qs, filename=f"{assessment}-epi")
+    return exporter.build_export()
+
+
+def literature_export(assessment_id: int) -> FlatExport:
+    from ..lit.exports import ReferenceFlatComplete
+
+    assessment = apps.get_model("assessment", "Assessment").objects.get(id=assessment_id)
+    qs = (
+        apps.get_model("lit", "Reference")
+        .objects.get_qs(assessment)
+        .prefetch_related("identifiers")
+        .order_by("id")
+    )
+    tags = apps.get_model("lit", "ReferenceFilterTag").get_all_tags(assessment.id)
+    exporter = ReferenceFlatComplete(
+        queryset=qs, filename=f"references-{assessment.name}", assessment=assessment, tags=tags
+    )
+    return exporter.build_export()
+
+
+def data_pivot_export(assessment_id: int, data_pivot_id: int) -> FlatExport:
+    DataPivot = apps.get_model("summary", "DataPivot")
+    data_pivot = DataPivot.objects.select_related("datapivotquery", "datapivotupload").get(
+        id=data_pivot_id, assessment_id=assessment_id
+    )
+    return data_pivot.get_dataset()
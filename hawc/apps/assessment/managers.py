@@ -6,6 +6,7 @@ import pandas as pd
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import Case, Exists, OuterRef, Q, QuerySet, Value, When
+from django.utils import timezone
 from reversion.models import Version
 
 from ..common.helper import HAWCDjangoJSONEncoder, map_enum
@@ -255,6 +256,35 @@ class AssessmentDetailManager(BaseManager):
     assessment_relation = "assessment"
 
 
+class JobManager(BaseManager):
+    assessment_relation = "assessment"
+
+    def get_or_create_job(self, job: int, assessment=None, kwargs: dict | None = None):
+        """Return a new job, or a recent matching export job which has not failed.
+
+        Export jobs are deduplicated on job type, assessment, and keyword arguments; repeated
+        requests reuse a pending or completed export until it is older than `EXPORT_MAX_AGE`.
+
+        Returns:
+            tuple[Job, bool]: the job, and whether it was created
+        """
+        kwargs = kwargs or {}
+        if job in self.model.EXPORT_JOBS:
+            existing = (
+                self.filter(
+                    job=job,
+                    assessment=assessment,
+                    kwargs=kwargs,
+                    created__gte=timezone.now() - self.model.EXPORT_MAX_AGE,
+                )
+                .exclude(status=constants.JobStatus.FAILURE)
+                .first()
+            )
+            if existing:
+                return existing, False
+        return self.create(job=job, assessment=assessment, kwargs=kwargs), True
+
+
 class Event(NamedTuple):
     """A potentially collapsed changed event between Logs and Reversions"""
 
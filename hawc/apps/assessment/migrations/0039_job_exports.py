@@ -0,0 +1,38 @@
+# Generated by Django 5.0.6 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+import hawc.apps.common.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("assessment", "0038_alter_assessmentdetail_qa_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="output",
+            field=models.FileField(
+                blank=True,
+                editable=False,
+                storage=hawc.apps.common.models.get_private_data_storage(),
+                upload_to="assessment/job",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="job",
+            name="job",
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (1, "TEST"),
+                    (2, "ANIMAL_EXPORT"),
+                    (3, "EPI_EXPORT"),
+                    (4, "LITERATURE_EXPORT"),
+                    (5, "DATA_PIVOT_EXPORT"),
+                ],
+                default=1,
+            ),
+        ),
+    ]
@@ -2,30 +2,44 @@ import json
 import logging
 import uuid
 from collections import namedtuple
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
 from typing import Any, NamedTuple
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from django.apps import apps
 from django.conf import settings
 from django.contrib.contenttypes import fields
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
-from django.db import models
+from django.core.files.base import ContentFile
+from django.db import models, transaction
 from django.http import HttpRequest
 from django.template import RequestContext, Template
 from django.template.defaultfilters import truncatewords
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.functional import cached_property
+from pyarrow import feather
 from pydantic import BaseModel as PydanticModel
 from reversion import revisions as reversion
 
 from hawc.services.epa.dsstox import DssSubstance
 
 from ..common.exceptions import AssessmentNotFound
-from ..common.helper import HAWCDjangoJSONEncoder, SerializerHelper, cacheable, new_window_a
+from ..common.helper import (
+    FlatExport,
+    HAWCDjangoJSONEncoder,
+    SerializerHelper,
+    assessment_cache_key,
+    bust_assessment_cache,
+    cacheable,
+    new_window_a,
+)
 from ..common.models import get_private_data_storage
 from ..common.validators import FlatJSON, validate_hyperlink
 from ..materialized.models import refresh_all_mvs
@@ -406,12 +420,15 @@ class Assessment(models.Model):
 
     def bust_cache(self):
         """
-        Delete the cache for all objects in an assessment; look for all cases
-        where `SerializerHelper.get_serialized` is used.
+        Delete the cache for all objects in an assessment.
+
+        Cache keys namespaced by the assessment's cache generation, including serialized objects
+        with an assessment foreign key, are invalidated by incrementing the generation. Serialized
+        objects without an assessment foreign key are deleted explicitly.
         """
+        bust_assessment_cache(self.id)
+
         for Model, filters in [
-            (apps.get_model("animal", "Endpoint"), dict(assessment_id=self.id)),
-            (apps.get_model("epi", "Outcome"), dict(assessment_id=self.id)),
             (
                 apps.get_model("epimeta", "MetaProtocol"),
                 dict(study__assessment_id=self.id),
@@ -420,32 +437,17 @@ class Assessment(models.Model):
                 apps.get_model("epimeta", "MetaResult"),
                 dict(protocol__study__assessment_id=self.id),
             ),
-            (apps.get_model("invitro", "IVEndpoint"), dict(assessment_id=self.id)),
             (apps.get_model("mgmt", "Task"), dict(study__assessment_id=self.id)),
             (
                 apps.get_model("riskofbias", "RiskOfBias"),
                 dict(study__assessment_id=self.id),
             ),
-            (apps.get_model("summary", "Visual"), dict(assessment_id=self.id)),
         ]:
             ids = list(Model.objects.filter(**filters).values_list("id", flat=True))
             SerializerHelper.delete_caches(Model, ids)
 
-        apps.get_model("study", "Study").delete_cache(self.id)
-
-        try:
-            # django-redis can delete by key pattern
-            cache.delete_pattern(f"assessment-{self.id}-*")
-        except AttributeError:
-            if settings.DEBUG or settings.IS_TESTING:
-                # if debug/testing, wipe whole cache
-                cache.clear()
-            else:
-                # in prod, throw exception
-                raise NotImplementedError("Cannot wipe assessment cache using this cache backend")
-
-        # refresh materialized views
-        refresh_all_mvs(force=True)
+        # refresh materialized views for this assessment
+        refresh_all_mvs(assessment_id=self.id)
 
     def pms_and_team_users(self) -> models.QuerySet:
         # return users that are either project managers or team members
@@ -463,51 +465,95 @@ class Assessment(models.Model):
     def set_communications(self, text: str):
         Communication.set_message(self, text)
 
-    def _has_data(self, app: str, model: str, filter: str = "study__assessment") -> bool:
-        """Check if associated model has any data for this assessment in HAWC
+    # model and assessment lookup for each data type reported in `get_data_presence`
+    DATA_PRESENCE_MODELS: dict[str, tuple[str, str]] = {
+        "lit": ("lit.Reference", "assessment"),
+        "rob": ("riskofbias.RiskOfBias", "study__assessment"),
+        "animal": ("animal.Experiment", "study__assessment"),
+        "epiv1": ("epi.StudyPopulation", "study__assessment"),
+        "epiv2": ("epiv2.Design", "study__assessment"),
+        "epimeta": ("epimeta.MetaProtocol", "study__assessment"),
+        "invitro": ("invitro.IVExperiment", "study__assessment"),
+        "eco": ("eco.Design", "study__assessment"),
+    }
+
+    @classmethod
+    def get_data_presence_cache_key(cls, assessment_id: int) -> str:
+        return assessment_cache_key(assessment_id, "data-presence")
+
+    @classmethod
+    def clear_data_presence_cache(cls, assessment_id: int):
+        # clear after commit, so a read before commit can't re-cache stale data presence
+        key = cls.get_data_presence_cache_key(assessment_id)
+        transaction.on_commit(lambda: cache.delete(key))
+
+    @classmethod
+    def get_data_presence(cls, assessment_id: int) -> dict[str, bool]:
+        """Check which types of data exist for an assessment in HAWC.
+
+        All types are checked in a single query using EXISTS subqueries; the result is cached
+        and cleared whenever a model in `DATA_PRESENCE_MODELS` is saved or deleted.
 
         Args:
-            app (str): the application name
-            model (str): the model name
-            filter (str): the filter to apply to check for status
+            assessment_id (int): assessment id
 
         Returns:
-            bool: True if data exists, False otherwise
+            dict[str, bool]: True if data exists, False otherwise, for each data type
         """
-        return apps.get_model(app, model).objects.filter(**{filter: self}).count() > 0
+        key = cls.get_data_presence_cache_key(assessment_id)
+        presence = cache.get(key)
+        if presence is None:
+            presence = (
+                cls.objects.filter(id=assessment_id)
+                .values(
+                    **{
+                        name: models.Exists(
+                            apps.get_model(model).objects.filter(**{filter: models.OuterRef("id")})
+                        )
+                        for name, (model, filter) in cls.DATA_PRESENCE_MODELS.items()
+                    }
+                )
+                .first()
+            ) or dict.fromkeys(cls.DATA_PRESENCE_MODELS, False)
+            cache.set(key, presence)
+        return presence
+
+    @cached_property
+    def data_presence(self) -> dict[str, bool]:
+        return self.get_data_presence(self.id)
 
     @property
     def has_lit_data(self) -> bool:
-        return self._has_data("lit", "Reference", filter="assessment")
+        return self.data_presence["lit"]
 
     @property
     def has_rob_data(self) -> bool:
-        return self._has_data("riskofbias", "RiskOfBias")
+        return self.data_presence["rob"]
 
     @property
     def has_animal_data(self) -> bool:
-        return self._has_data("animal", "Experiment")
+        return self.data_presence["animal"]
 
     @property
     def has_epi_data(self) -> bool:
         if self.epi_version == constants.EpiVersion.V1:
-            return self._has_data("epi", "StudyPopulation")
+            return self.data_presence["epiv1"]
         elif self.epi_version == constants.EpiVersion.V2:
-            return self._has_data("epiv2", "Design")
+            return self.data_presence["epiv2"]
         else:
             raise ValueError("Unknown epi version")
 
     @property
     def has_epimeta_data(self) -> bool:
-        return self._has_data("epimeta", "MetaProtocol")
+        return self.data_presence["epimeta"]
 
     @property
     def has_invitro_data(self) -> bool:
-        return self._has_data("invitro", "IVExperiment")
+        return self.data_presence["invitro"]
 
     @property
     def has_eco_data(self) -> bool:
-        return self._has_data("eco", "Design")
+        return self.data_presence["eco"]
 
 
 class AssessmentDetail(models.Model):
@@ -1086,8 +1132,48 @@ class DatasetRevision(models.Model):
     def get_api_data_url(self) -> str:
         return reverse("assessment:api:dataset-version", args=(self.dataset_id, self.version))
 
-    def get_df(self) -> pd.DataFrame:
-        return self.try_read_df(self.data, self.metadata["extension"], self.excel_worksheet_name)
+    def get_columnar_path(self) -> Path:
+        return Path(f"{self.data.path}.arrow")
+
+    def write_columnar(self, df: pd.DataFrame) -> bool:
+        """Save an uncompressed Arrow (Feather) copy of the revision dataframe.
+
+        Args:
+            df (pd.DataFrame): the revision dataframe
+
+        Returns:
+            bool: True if written; dataframes which Arrow cannot represent, such as columns with
+                mixed types, are not written and are parsed from the uploaded file on each read.
+        """
+        path = self.get_columnar_path()
+        tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            feather.write_feather(df, str(tmp), compression="uncompressed")
+        except (pa.ArrowException, ValueError) as err:
+            logger.warning(f"DatasetRevision {self.id} not saved as Arrow: {err}")
+            tmp.unlink(missing_ok=True)
+            return False
+        tmp.replace(path)
+        return True
+
+    def get_df(self, columns: list[str] | None = None) -> pd.DataFrame:
+        """Return the revision dataframe.
+
+        Revisions cannot be edited, so the uploaded file is parsed once and saved in a columnar
+        format; later reads are memory-mapped from the columnar copy.
+
+        Args:
+            columns (list[str], optional): Only return these columns
+
+        Returns:
+            pd.DataFrame: the revision dataframe
+        """
+        path = self.get_columnar_path()
+        if path.exists():
+            return feather.read_table(str(path), columns=columns, memory_map=True).to_pandas()
+        df = self.try_read_df(self.data, self.metadata["extension"], self.excel_worksheet_name)
+        self.write_columnar(df)
+        return df[columns] if columns is not None else df
 
     def data_exists(self) -> bool:
         try:
@@ -1137,9 +1223,20 @@ class DatasetRevision(models.Model):
 
 
 class Job(models.Model):
+    objects = managers.JobManager()
+
+    EXPORT_JOBS = {
+        constants.JobType.ANIMAL_EXPORT: jobs.animal_export,
+        constants.JobType.EPI_EXPORT: jobs.epi_export,
+        constants.JobType.LITERATURE_EXPORT: jobs.literature_export,
+        constants.JobType.DATA_PIVOT_EXPORT: jobs.data_pivot_export,
+    }
     JOB_TO_FUNC = {
         constants.JobType.TEST: jobs.test,
+        **EXPORT_JOBS,
     }
+    EXPORT_MAX_AGE = timedelta(hours=1)
+    EXPORT_METADATA_KEY = b"hawc:metadata"
 
     task_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     assessment = models.ForeignKey(
@@ -1154,6 +1251,12 @@ class Job(models.Model):
 
     kwargs = models.JSONField(default=dict, blank=True, null=True)
     result = models.JSONField(default=dict, editable=False)
+    output = models.FileField(
+        upload_to="assessment/job",
+        storage=get_private_data_storage(),
+        blank=True,
+        editable=False,
+    )
 
     created = models.DateTimeField(auto_now_add=True)
     last_updated = models.DateTimeField(auto_now=True)
@@ -1161,6 +1264,9 @@ class Job(models.Model):
     class Meta:
         ordering = ("-created",)
 
+    def get_download_url(self) -> str:
+        return reverse("assessment:api:job-download", args=(self.task_id,))
+
     def execute(self) -> Any:
         """
         Executes the job. Function and kwargs are determined
@@ -1171,8 +1277,72 @@ class Job(models.Model):
             {"data" : <return_value>} MUST be JSON serializable.
         """
         func = self.JOB_TO_FUNC[self.job]
+        if self.job in self.EXPORT_JOBS:
+            export = func(assessment_id=self.assessment_id, **self.kwargs)
+            return self.save_export(export)
         return func(**self.kwargs)
 
+    def save_export(self, export: FlatExport) -> dict:
+        """
+        Saves an export to the job's output file in Arrow (Feather) format, so it can be
+        downloaded in any format once the job is complete. Columns with mixed types, which
+        Arrow cannot represent, are saved as text.
+
+        Args:
+            export (FlatExport): The export to save
+
+        Returns:
+            dict: A JSON serializable summary of the export
+        """
+        try:
+            table = pa.Table.from_pandas(export.df, preserve_index=False)
+        except (pa.ArrowException, ValueError):
+            df = export.df.copy()
+            for column in df.columns[df.dtypes == object]:
+                df[column] = df[column].astype(str).where(df[column].notna(), None)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        if export.metadata is not None:
+            metadata = export.metadata.to_json(orient="split", index=False)
+            table = table.replace_schema_metadata(
+                {**(table.schema.metadata or {}), self.EXPORT_METADATA_KEY: metadata}
+            )
+        sink = pa.BufferOutputStream()
+        feather.write_feather(table, sink, compression="uncompressed")
+        content = ContentFile(sink.getvalue().to_pybytes())
+        self.output.save(f"{self.task_id}.arrow", content, save=False)
+        return {"filename": export.filename, "rows": export.df.shape[0]}
+
+    def get_export(self) -> FlatExport:
+        """
+        Returns the export saved by a completed export job.
+        """
+        with self.output.open("rb") as f:
+            table = feather.read_table(pa.py_buffer(f.read()))
+        metadata = (table.schema.metadata or {}).get(self.EXPORT_METADATA_KEY)
+        return FlatExport(
+            df=table.to_pandas(),
+            filename=self.result["data"]["filename"],
+            metadata=(
+                pd.read_json(StringIO(metadata.decode()), orient="split", dtype=False)
+                if metadata
+                else None
+            ),
+        )
+
+    def requires_team_member(self) -> bool:
+        """
+        Whether viewing the job requires team member permissions; exports which include
+        unpublished data may only be viewed by the team, as when they are created.
+        """
+        if self.kwargs.get("published_only") is False:
+            return True
+        if self.job == constants.JobType.DATA_PIVOT_EXPORT:
+            DataPivot = apps.get_model("summary", "DataPivot")
+            return not DataPivot.objects.filter(
+                id=self.kwargs.get("data_pivot_id"), published=True
+            ).exists()
+        return False
+
     def set_success(self, data):
         """
         Sets the status of the job to SUCCESS and sets the
@@ -4,7 +4,7 @@ import plotly.graph_objects as go
 from django.apps import apps
 from django.core.exceptions import ObjectDoesNotExist
 from plotly.subplots import make_subplots
-from rest_framework import serializers
+from rest_framework import exceptions, serializers
 
 from ...services.epa.dsstox import DssSubstance
 from ..common.serializers import FlexibleChoiceField
@@ -211,3 +211,80 @@ class StrainSerializer(serializers.ModelSerializer):
     class Meta:
         model = models.Strain
         fields = "__all__"
+
+
+class JobSerializer(serializers.ModelSerializer):
+    job = FlexibleChoiceField(choices=constants.JobType.choices, default=constants.JobType.TEST)
+    status = FlexibleChoiceField(choices=constants.JobStatus.choices, read_only=True)
+    download_url = serializers.SerializerMethodField()
+
+    EXPORT_KWARGS = {
+        constants.JobType.ANIMAL_EXPORT: {"published_only"},
+        constants.JobType.EPI_EXPORT: {"published_only"},
+        constants.JobType.LITERATURE_EXPORT: set(),
+        constants.JobType.DATA_PIVOT_EXPORT: {"data_pivot_id"},
+    }
+
+    class Meta:
+        model = models.Job
+        fields = (
+            "task_id",
+            "assessment",
+            "job",
+            "kwargs",
+            "status",
+            "result",
+            "download_url",
+            "created",
+            "last_updated",
+        )
+
+    def get_download_url(self, obj) -> str | None:
+        return obj.get_download_url() if obj.output else None
+
+    def validate(self, data):
+        job = data.get("job", constants.JobType.TEST)
+        if job in self.EXPORT_KWARGS:
+            assessment = data.get("assessment")
+            if assessment is None:
+                raise serializers.ValidationError({"assessment": "Required for export jobs."})
+            data["kwargs"] = self._validate_export_kwargs(job, assessment, data.get("kwargs") or {})
+        return data
+
+    def _validate_export_kwargs(self, job: int, assessment, kwargs: dict) -> dict:
+        # normalize kwargs so equivalent exports are deduplicated
+        if extra := set(kwargs) - self.EXPORT_KWARGS[job]:
+            raise serializers.ValidationError({"kwargs": f"Unexpected keys: {sorted(extra)}"})
+        request = self.context.get("request")
+        is_team_member = request is not None and assessment.user_is_team_member_or_higher(
+            request.user
+        )
+        if "published_only" in self.EXPORT_KWARGS[job]:
+            published_only = kwargs.get("published_only", True)
+            if not isinstance(published_only, bool):
+                raise serializers.ValidationError({"kwargs": "`published_only` must be a boolean."})
+            if request is not None and not published_only and not is_team_member:
+                raise exceptions.PermissionDenied(
+                    "You must be part of the team to view unpublished data"
+                )
+            kwargs = {"published_only": published_only}
+        if job == constants.JobType.DATA_PIVOT_EXPORT:
+            DataPivot = apps.get_model("summary", "DataPivot")
+            data_pivot_id = kwargs.get("data_pivot_id")
+            data_pivot = (
+                DataPivot.objects.filter(id=data_pivot_id, assessment=assessment).first()
+                if isinstance(data_pivot_id, int)
+                else None
+            )
+            if data_pivot is None:
+                raise serializers.ValidationError(
+                    {"kwargs": "`data_pivot_id` must be a data pivot in this assessment."}
+                )
+            if request is not None and not data_pivot.published and not is_team_member:
+                raise exceptions.PermissionDenied()
+            kwargs = {"data_pivot_id": data_pivot.id}
+        return kwargs
+
+    def create(self, validated_data):
+        instance, self.created = models.Job.objects.get_or_create_job(**validated_data)
+        return instance
@@ -1,7 +1,8 @@
 import logging
 
 from django.apps import apps
-from django.db.models.signals import post_save, pre_save
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
 from ..common.helper import SerializerHelper
@@ -47,6 +48,36 @@ def invalidate_endpoint_cache(sender, instance, **kwargs):
     )
 
 
+@receiver(pre_delete, sender="study.Study")
+@receiver(post_save, sender="lit.Reference")
+@receiver(pre_delete, sender="lit.Reference")
+@receiver(post_save, sender="riskofbias.RiskOfBias")
+@receiver(pre_delete, sender="riskofbias.RiskOfBias")
+@receiver(post_save, sender="animal.Experiment")
+@receiver(pre_delete, sender="animal.Experiment")
+@receiver(post_save, sender="epi.StudyPopulation")
+@receiver(pre_delete, sender="epi.StudyPopulation")
+@receiver(post_save, sender="epiv2.Design")
+@receiver(pre_delete, sender="epiv2.Design")
+@receiver(post_save, sender="epimeta.MetaProtocol")
+@receiver(pre_delete, sender="epimeta.MetaProtocol")
+@receiver(post_save, sender="invitro.IVExperiment")
+@receiver(pre_delete, sender="invitro.IVExperiment")
+@receiver(post_save, sender="eco.Design")
+@receiver(pre_delete, sender="eco.Design")
+def invalidate_data_presence_cache(sender, instance, origin=None, **kwargs):
+    # rows deleted in cascade from an assessment or study are cleared once, by the study
+    Study = apps.get_model("study", "Study")
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if origin_model in (models.Assessment, Study) and not isinstance(instance, origin_model):
+        return
+    if hasattr(instance, "assessment_id"):
+        assessment_id = instance.assessment_id
+    else:
+        assessment_id = instance.study.assessment_id
+    models.Assessment.clear_data_presence_cache(assessment_id)
+
+
 @receiver(pre_save, sender=models.Job)
 def null_to_dict(sender, instance, **kwargs):
     """
@@ -65,3 +96,9 @@ def null_to_dict(sender, instance, **kwargs):
 def run_task(sender, instance, created, **kwargs):
     if created:
         run_job.apply_async(task_id=instance.task_id)
+
+
+@receiver(post_delete, sender=models.Job)
+def delete_job_output(sender, instance, **kwargs):
+    if instance.output:
+        instance.output.delete(save=False)
@@ -12,9 +12,13 @@ logger = get_task_logger(__name__)
 
 @shared_task
 def delete_old_jobs():
-    # delete jobs where "last_updated" > 1 week old
-    week_old = timezone.now() - timedelta(weeks=1)
+    # delete jobs where "last_updated" > 1 week old, and export jobs which can no longer be reused
+    now = timezone.now()
+    week_old = now - timedelta(weeks=1)
     models.Job.objects.filter(last_updated__lte=week_old).delete()
+    models.Job.objects.filter(
+        job__in=models.Job.EXPORT_JOBS, created__lt=now - models.Job.EXPORT_MAX_AGE
+    ).delete()
 
 
 @shared_task
@@ -43,7 +43,6 @@ from ..common.views import (
     create_object_log,
     get_referrer,
 )
-from ..materialized.models import refresh_all_mvs
 from ..mgmt.analytics.overall import compute_object_counts
 from . import constants, filterset, forms, models, serializers
 
@@ -91,7 +90,11 @@ class About(TemplateView):
         context.update(
             HAWC_FLAVOR=settings.HAWC_FLAVOR,
             rob_name=self.get_rob_name(),
-            counts=cacheable(lambda: compute_object_counts(), "assessment.views.about:counts"),
+            counts=cacheable(
+                lambda: compute_object_counts(),
+                "assessment.views.about:counts",
+                stale_duration=settings.CACHE_1_HR,
+            ),
         )
         context["page"] = models.Content.rendered_page(
             models.ContentTypeChoices.ABOUT, self.request, context
@@ -344,7 +347,6 @@ class AssessmentClearCache(MessageMixin, View):
             raise PermissionDenied()
 
         assessment.bust_cache()
-        refresh_all_mvs(force=True)
 
         self.send_message()
         return HttpResponseRedirect(url)
@@ -1,13 +1,96 @@
+from collections.abc import Iterator
+from itertools import batched
+
 import pandas as pd
-from django.db.models import QuerySet
+from django.conf import settings
+from django.core.exceptions import FieldError
+from django.db.models import ForeignKey, IntegerField, QuerySet
 from django.utils import timezone
 
-from .helper import FlatExport
+from .helper import FlatExport, StreamingFlatExport
+
+
+def iter_values(qs: QuerySet, columns: list[str], chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Iterate over a values_list queryset as dataframes, using a server-side cursor.
+
+    Args:
+        qs (QuerySet): a values_list queryset
+        columns (list[str]): column names for each value
+        chunk_size (int): maximum rows per dataframe
+
+    Yields:
+        pd.DataFrame: dataframes of at most chunk_size rows; at least one, which may be empty
+    """
+    empty = True
+    for rows in batched(qs.iterator(chunk_size=chunk_size), chunk_size):
+        empty = False
+        yield pd.DataFrame(data=rows, columns=columns)
+    if empty:
+        yield pd.DataFrame(data=[], columns=columns)
+
+
+def integer_columns(qs: QuerySet, columns: list[str]) -> list[str]:
+    """Return columns of a values_list queryset which are integer model fields.
+
+    Integer columns with nulls are read by pandas as floats; the dtype depends on the rows in
+    a dataframe, so chunks of the same export may be formatted differently.
+
+    Args:
+        qs (QuerySet): a values_list queryset
+        columns (list[str]): column names for each value
+
+    Returns:
+        list[str]: column names which are integer fields, or foreign keys to them
+    """
+    query = qs.query
+    select, _, _ = query.get_compiler(qs.db).get_select()
+    names = [*query.extra_select, *query.values_select, *query.annotation_select]
+    fields = {}
+    for (expression, _, _), name in zip(select, names, strict=True):
+        try:
+            fields[name] = expression.output_field
+        except FieldError:
+            continue
+    integers = []
+    for name, column in zip(qs._fields, columns, strict=True):
+        field = fields.get(name)
+        if isinstance(field, ForeignKey):
+            field = field.target_field
+        if isinstance(field, IntegerField):
+            integers.append(column)
+    return integers
+
+
+def to_nullable_integers(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """Cast numeric columns with integer values to a nullable integer dtype, inplace.
+
+    Columns which were changed by `ModelExport.prepare_df` to a non-integer type are skipped.
+
+    Args:
+        df (pd.DataFrame): a dataframe
+        columns (list[str]): columns to cast
+
+    Returns:
+        pd.DataFrame: the dataframe
+    """
+    for column in columns:
+        if column not in df.columns:
+            continue
+        series = df[column]
+        if pd.api.types.is_bool_dtype(series) or not pd.api.types.is_numeric_dtype(series):
+            continue
+        if pd.api.types.is_float_dtype(series) and not (series.dropna() % 1 == 0).all():
+            continue
+        df[column] = series.astype("Int64")
+    return df
 
 
 class ModelExport:
     """Model level export module for use in Exporter class."""
 
+    # prepare_df only uses values within each row, so it can be applied to chunks of rows
+    chunk_safe: bool = True
+
     def __init__(
         self,
         key_prefix: str = "",
@@ -155,19 +238,23 @@ class ModelExport:
                 df[key] = df[key].dt.tz_convert(tz).dt.strftime("%Y-%m-%dT%H:%M:%S.%f%z")
         return df
 
-    def get_df(self, qs: QuerySet) -> pd.DataFrame:
+    def get_df(self, qs: QuerySet, chunk_size: int | None = None) -> pd.DataFrame:
         """Get dataframe export from queryset.
 
         Args:
             qs (QuerySet): Queryset
+            chunk_size (int, optional): if set, rows are read using a server-side cursor and
+                prepared in chunks of this size, if chunk_safe
 
         Returns:
             pd.DataFrame: Dataframe
         """
-        qs = self.prepare_qs(qs)
-        df = pd.DataFrame(
-            data=qs.values_list(*self.value_map.values()), columns=list(self.value_map.keys())
-        )
+        qs = self.prepare_qs(qs).values_list(*self.value_map.values())
+        columns = list(self.value_map.keys())
+        if chunk_size and self.chunk_safe:
+            chunks = iter_values(qs, columns, chunk_size)
+            return pd.concat([self.prepare_df(df) for df in chunks], ignore_index=True)
+        df = pd.DataFrame(data=qs, columns=columns)
         return self.prepare_df(df)
 
 
@@ -191,35 +278,110 @@ class Exporter:
         """
         raise NotImplementedError()
 
-    def get_df(self, qs: QuerySet) -> pd.DataFrame:
+    def _values_list(self, qs: QuerySet) -> tuple[QuerySet, list[str]]:
+        # build modules and return a values_list queryset and its column names
+        self._modules = self.build_modules()
+        for module in self._modules:
+            qs = module.prepare_qs(qs)
+        values = [value for module in self._modules for value in module.value_map.values()]
+        keys = [key for module in self._modules for key in module.value_map.keys()]
+        qs = qs.values_list(*values)
+        self._integer_columns = integer_columns(qs, keys)
+        return qs, keys
+
+    def _split_modules(self) -> tuple[list[ModelExport], list[ModelExport]]:
+        # modules before the first which is not chunk-safe can prepare each chunk; the rest
+        # prepare the concatenated dataframe, so prepare_df always runs in module order
+        n = next((i for i, m in enumerate(self._modules) if not m.chunk_safe), len(self._modules))
+        return self._modules[:n], self._modules[n:]
+
+    def _prepare_chunks(
+        self, chunks: Iterator[pd.DataFrame], modules: list[ModelExport]
+    ) -> Iterator[pd.DataFrame]:
+        # apply prepare_df for chunk-safe modules to each chunk
+        for df in chunks:
+            for module in modules:
+                df = module.prepare_df(df)
+            yield df
+
+    def get_df(self, qs: QuerySet, chunk_size: int | None = None) -> pd.DataFrame:
         """Get dataframe export from queryset.
 
         Args:
             qs (QuerySet): Queryset
+            chunk_size (int, optional): if set, rows are read using a server-side cursor in
+                chunks of this size; chunk-safe modules prepare each chunk before they are
+                concatenated, and modules from the first which is not chunk-safe onwards
+                prepare the concatenated dataframe.
 
         Returns:
             pd.DataFrame: Dataframe
         """
-        self._modules = self.build_modules()
-        for module in self._modules:
-            qs = module.prepare_qs(qs)
-        values = [value for module in self._modules for value in module.value_map.values()]
-        keys = [key for module in self._modules for key in module.value_map.keys()]
-        df = pd.DataFrame(data=qs.values_list(*values), columns=keys)
-        for module in self._modules:
+        qs, keys = self._values_list(qs)
+        if chunk_size:
+            chunked, modules = self._split_modules()
+            chunks = self._prepare_chunks(iter_values(qs, keys, chunk_size), chunked)
+            df = pd.concat(chunks, ignore_index=True)
+        else:
+            df = pd.DataFrame(data=qs, columns=keys)
+            modules = self._modules
+        for module in modules:
             df = module.prepare_df(df)
-        return df
+        return to_nullable_integers(df, self._integer_columns)
+
+    def iter_df(self, qs: QuerySet, chunk_size: int | None = None) -> Iterator[pd.DataFrame]:
+        """Get dataframe export from queryset, in chunks.
+
+        Rows are read using a server-side cursor, and each chunk is prepared independently,
+        so memory is bounded by the chunk size instead of the size of the export. Integer
+        fields are cast to a nullable integer dtype, so chunks with and without nulls are
+        formatted alike, as in `get_df`. At least one
+        chunk is returned, which may be empty. If any module is not chunk-safe, the complete
+        dataframe is returned as a single chunk.
+
+        Args:
+            qs (QuerySet): Queryset
+            chunk_size (int, optional): rows per chunk; defaults to settings.EXPORT_CHUNK_SIZE
+
+        Yields:
+            pd.DataFrame: Dataframe chunks
+        """
+        chunk_size = chunk_size or settings.EXPORT_CHUNK_SIZE
+        if not all(module.chunk_safe for module in self.build_modules()):
+            yield self.get_df(qs, chunk_size)
+            return
+        qs, keys = self._values_list(qs)
+        for df in self._prepare_chunks(iter_values(qs, keys, chunk_size), self._modules):
+            yield to_nullable_integers(df, self._integer_columns)
 
     @classmethod
     def build_metadata(cls, df: pd.DataFrame) -> pd.DataFrame | None:
         return None
 
     @classmethod
-    def flat_export(cls, qs: QuerySet, filename: str) -> FlatExport:
+    def flat_export(cls, qs: QuerySet, filename: str, chunk_size: int | None = None) -> FlatExport:
         """Return an instance of a FlatExport.
         Args:
             qs (QuerySet): the initial QuerySet
             filename (str): the filename for the export
+            chunk_size (int, optional): if set, build the dataframe in chunks of this size
         """
-        df = cls().get_df(qs)
+        df = cls().get_df(qs, chunk_size)
         return FlatExport(df=df, filename=filename, metadata=cls.build_metadata(df))
+
+    @classmethod
+    def streaming_export(
+        cls, qs: QuerySet, filename: str, chunk_size: int | None = None
+    ) -> StreamingFlatExport:
+        """Return an instance of a StreamingFlatExport; chunks are generated lazily.
+
+        Args:
+            qs (QuerySet): the initial QuerySet
+            filename (str): the filename for the export
+            chunk_size (int, optional): rows per chunk; defaults to settings.EXPORT_CHUNK_SIZE
+        """
+        return StreamingFlatExport(
+            chunks=cls().iter_df(qs, chunk_size),
+            filename=filename,
+            build_metadata=cls.build_metadata,
+        )
@@ -1,8 +1,12 @@
 import decimal
 import logging
 import re
-from collections import defaultdict
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
 from collections.abc import Callable, Iterable
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import timedelta
 from itertools import chain
 from math import inf
@@ -233,35 +237,283 @@ class HAWCDjangoJSONEncoder(DjangoJSONEncoder):
             return super().default(o)
 
 
+class LocalCache:
+    """
+    Per-process least-recently-used cache, where entries expire after `ttl` seconds.
+
+    Used as a short-lived tier in front of the shared cache; a `maxsize` of 0 disables it.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        if self.maxsize <= 0:
+            return {}
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for key in keys:
+                if (item := self._data.get(key)) is None:
+                    continue
+                if item[0] < now:
+                    del self._data[key]
+                    continue
+                self._data.move_to_end(key)
+                found[key] = item[1]
+        return found
+
+    def set_many(self, data: dict[str, Any]):
+        if self.maxsize <= 0:
+            return
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            for key, value in data.items():
+                self._data[key] = (expires, value)
+                self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete_many(self, keys: Iterable[str]):
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+def _get_generation_key(assessment_id: int) -> str:
+    return f"assessment-{assessment_id}-generation"
+
+
+# generations read within a `cache_generation_scope`, by assessment id
+_generations: ContextVar[dict[int, int] | None] = ContextVar("cache_generations", default=None)
+
+
+@contextmanager
+def cache_generation_scope():
+    """Memoize assessment cache generations within a block, such as a request.
+
+    Each assessment's generation is read from the cache at most once within the block;
+    `bust_assessment_cache` updates the memoized generation.
+    """
+    token = _generations.set({})
+    try:
+        yield
+    finally:
+        _generations.reset(token)
+
+
+def get_cache_generations(assessment_ids: Iterable[int]) -> dict[int, int]:
+    """Get the current cache generation for each assessment, using at most one cache lookup.
+
+    A missing generation is started from the current time rather than zero, so that if the
+    generation key is evicted, keys from an earlier generation are not reused. Within a
+    `cache_generation_scope`, generations which were already read are not read again.
+
+    Args:
+        assessment_ids (Iterable[int]): assessment ids
+
+    Returns:
+        dict[int, int]: generation for each assessment id
+    """
+    memo = _generations.get()
+    generations = {}
+    keys = {}
+    for assessment_id in assessment_ids:
+        if memo and assessment_id in memo:
+            generations[assessment_id] = memo[assessment_id]
+        else:
+            keys[assessment_id] = _get_generation_key(assessment_id)
+    if not keys:
+        return generations
+    found = cache.get_many(keys.values())
+    for assessment_id, key in keys.items():
+        if (generation := found.get(key)) is None:
+            cache.add(key, time.time_ns(), None)
+            generation = cache.get(key, time.time_ns())
+        generations[assessment_id] = generation
+    if memo is not None:
+        memo.update(generations)
+    return generations
+
+
+def get_assessment_cache_prefix(assessment_id: int, generation: int | None = None) -> str:
+    """Get the prefix for cache keys namespaced by an assessment's current cache generation.
+
+    Args:
+        assessment_id (int): assessment id
+        generation (int | None): the current generation, if already known
+    """
+    if generation is None:
+        generation = get_cache_generations([assessment_id])[assessment_id]
+    return f"assessment-{assessment_id}-{generation}-"
+
+
+def assessment_cache_key(assessment_id: int, key: str) -> str:
+    """Get a cache key namespaced by an assessment's current cache generation.
+
+    All keys created with this function are invalidated by `bust_assessment_cache`.
+
+    Args:
+        assessment_id (int): assessment id
+        key (str): the key, unique within the assessment
+    """
+    return f"{get_assessment_cache_prefix(assessment_id)}{key}"
+
+
+def bust_assessment_cache(assessment_id: int) -> int:
+    """Invalidate all generation-namespaced cache keys for an assessment.
+
+    The generation is incremented; keys from earlier generations are no longer read, and
+    are removed when their timeout expires.
+
+    Args:
+        assessment_id (int): assessment id
+
+    Returns:
+        int: the new generation
+    """
+    key = _get_generation_key(assessment_id)
+    try:
+        generation = cache.incr(key)
+    except ValueError:
+        generation = time.time_ns()
+        cache.set(key, generation, None)
+    if (memo := _generations.get()) is not None:
+        memo[assessment_id] = generation
+    return generation
+
+
 class SerializerHelper:
     """
     HAWC helper-object for getting serialized objects and setting cache.
     Sets cache names based on django models and primary keys automatically.
     Sets a cache using the serialized object, and also a JSON object.
+
+    Lookups check a per-process `LocalCache` tier (if enabled), then the shared cache. Hit
+    counts and time spent in cache lookups and serialization are tracked in `stats`.
+
+    For models with an `assessment` foreign key, cache names are namespaced by the assessment's
+    cache generation, so they are invalidated by `bust_assessment_cache`.
     """
 
     serializers = {}
+    local_cache = LocalCache(
+        settings.SERIALIZER_LOCAL_CACHE_SIZE, settings.SERIALIZER_LOCAL_CACHE_TIMEOUT
+    )
+    stats = Counter()
+    stats_lock = threading.Lock()
 
     @classmethod
-    def _get_cache_name(cls, model, id, json=True):
-        name = f"{model.__module__}.{model.__name__}.{id}"
+    def _get_cache_name(cls, model, id, json=True, prefix=""):
+        name = f"{prefix}{model.__module__}.{model.__name__}.{id}"
         if json:
             name += ".json"
         return name
 
+    @classmethod
+    def _get_cache_prefixes(
+        cls, model, ids: list[int], objs: dict, assessment_id: int | None = None
+    ) -> dict[int, str]:
+        # cache name prefix for each id; generation-namespaced if the model has an assessment
+        if not any(field.attname == "assessment_id" for field in model._meta.concrete_fields):
+            return {id: "" for id in ids}
+        if assessment_id is not None:
+            prefix = get_assessment_cache_prefix(assessment_id)
+            return {id: prefix for id in ids}
+        assessment_ids = {id: obj.assessment_id for id, obj in objs.items()}
+        if missing := [id for id in ids if id not in assessment_ids]:
+            assessment_ids.update(
+                model.objects.filter(id__in=missing).values_list("id", "assessment_id")
+            )
+        generations = get_cache_generations(set(assessment_ids.values()))
+        return {
+            id: get_assessment_cache_prefix(assessment_id, generations[assessment_id])
+            for id, assessment_id in assessment_ids.items()
+        }
+
     @classmethod
     def get_serialized(cls, obj, json=True, from_cache=True):
         if from_cache:
-            name = cls._get_cache_name(obj.__class__, obj.id, json)
-            cached = cache.get(name)
-            if cached:
-                logger.debug(f"using cache: {name}")
-            else:
-                cached = cls._serialize_and_cache(obj, json=json)
-            return cached
+            return cls.get_serialized_many(obj.__class__, [obj], json=json)[0]
         else:
             return cls._serialize(obj, json=json)
 
+    @classmethod
+    def get_serialized_many(
+        cls, model, items: Iterable, json=True, assessment_id: int | None = None
+    ) -> list:
+        """Get serialized content for many objects, using one cache lookup for content.
+
+        For models with an assessment, cache names include the assessment cache generation;
+        generations are read first, unless already read in this `cache_generation_scope`.
+
+        Cache misses are serialized together; if the model defines `serialization_prefetch`,
+        misses are fetched in a single query with those relations prefetched. Newly serialized
+        content is written to cache in one call.
+
+        Args:
+            model: the model class
+            items (Iterable): model instances or primary keys
+            json (bool): return JSON strings if True, else serialized data
+            assessment_id (int, optional): the assessment of all items, if known; saves a query
+                when items are primary keys
+
+        Returns:
+            list: serialized content, in the same order as items
+        """
+        objs = {}
+        ids = []
+        for item in items:
+            if isinstance(item, model):
+                objs[item.id] = item
+                ids.append(item.id)
+            else:
+                ids.append(int(item))
+        prefixes = cls._get_cache_prefixes(model, ids, objs, assessment_id)
+        names = {id: cls._get_cache_name(model, id, json, prefixes.get(id, "")) for id in ids}
+
+        start = time.perf_counter()
+        cached = cls.local_cache.get_many(names.values())
+        stats = Counter(local_hits=len(cached))
+        if remaining := [name for name in names.values() if name not in cached]:
+            found = cache.get_many(remaining)
+            stats["hits"] = len(found)
+            cls.local_cache.set_many(found)
+            cached.update(found)
+        stats["get_seconds"] = time.perf_counter() - start
+
+        if missing := [id for id, name in names.items() if not cached.get(name)]:
+            stats["misses"] = len(missing)
+            start = time.perf_counter()
+            for id, (serialized, json_str) in cls._serialize_and_cache_many(
+                model, missing, objs, prefixes
+            ).items():
+                cached[names[id]] = json_str if json else serialized
+            stats["serialize_seconds"] = time.perf_counter() - start
+
+        with cls.stats_lock:
+            cls.stats.update(stats)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"serializer cache {model.__name__}: {cls.get_stats()}")
+        return [cached[names[id]] for id in ids]
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        """Return cache statistics for this process."""
+        with cls.stats_lock:
+            stats = dict(cls.stats)
+        total = sum(stats.get(key, 0) for key in ["local_hits", "hits", "misses"])
+        hits = stats.get("local_hits", 0) + stats.get("hits", 0)
+        stats["hit_ratio"] = hits / total if total else 0.0
+        return stats
+
     @classmethod
     def _serialize(cls, obj, json=False):
         serializer = cls.serializers.get(obj.__class__)
@@ -271,24 +523,33 @@ class SerializerHelper:
         return serialized
 
     @classmethod
-    def _serialize_and_cache(cls, obj, json):
-        # get expected object names
-        name = cls._get_cache_name(obj.__class__, obj.id, json=False)
-        json_name = cls._get_cache_name(obj.__class__, obj.id, json=True)
-
-        # serialize data and get json-representation
-        if hasattr(obj, "optimized_for_serialization"):
-            obj = obj.optimized_for_serialization()
-        serialized = cls._serialize(obj, json=False)
-        json_str = JSONRenderer().render(serialized).decode("utf8")
-
-        logger.debug(f"setting cache: {name}")
-        cache.set_many({name: serialized, json_name: json_str})
-
-        if json:
-            return json_str
-        else:
-            return serialized
+    def _serialize_and_cache_many(
+        cls, model, ids: list[int], objs: dict, prefixes: dict[int, str]
+    ) -> dict:
+        # fetch objects optimized for serialization, where possible
+        if prefetch := getattr(model, "serialization_prefetch", None):
+            objs = model.objects.filter(id__in=ids).prefetch_related(*prefetch).in_bulk()
+        elif missing := [id for id in ids if id not in objs]:
+            objs = {**objs, **model.objects.in_bulk(missing)}
+
+        content = {}
+        to_cache = {}
+        for id in ids:
+            if (obj := objs.get(id)) is None:
+                raise model.DoesNotExist(f"{model.__name__} {id} does not exist")
+            if not prefetch and hasattr(obj, "optimized_for_serialization"):
+                obj = obj.optimized_for_serialization()
+            serialized = cls._serialize(obj, json=False)
+            json_str = JSONRenderer().render(serialized).decode("utf8")
+            content[id] = (serialized, json_str)
+            prefix = prefixes.get(id, "")
+            to_cache[cls._get_cache_name(model, id, json=False, prefix=prefix)] = serialized
+            to_cache[cls._get_cache_name(model, id, json=True, prefix=prefix)] = json_str
+
+        logger.debug(f"setting cache: {model.__name__} {ids}")
+        cache.set_many(to_cache)
+        cls.local_cache.set_many(to_cache)
+        return content
 
     @classmethod
     def add_serializer(cls, model, serializer):
@@ -296,10 +557,15 @@ class SerializerHelper:
 
     @classmethod
     def delete_caches(cls, model, ids):
-        names = [cls._get_cache_name(model, id, json=False) for id in ids]
-        names.extend([cls._get_cache_name(model, id, json=True) for id in ids])
+        prefixes = cls._get_cache_prefixes(model, list(ids), {})
+        names = [
+            cls._get_cache_name(model, id, json=json, prefix=prefix)
+            for id, prefix in prefixes.items()
+            for json in [False, True]
+        ]
         logger.debug(f"Removing caches: {', '.join(names)}")
         cache.delete_many(names)
+        cls.local_cache.delete_many(names)
 
     @classmethod
     def clear_cache(cls, Model, filters):
@@ -333,6 +599,24 @@ class FlatExport(NamedTuple):
         return Response(export)
 
 
+class StreamingFlatExport(NamedTuple):
+    """
+    Response class of an exporter method, where data are generated in chunks.
+
+    Renderers which support streaming write each chunk as it is generated; others render the
+    concatenated dataframe via `to_flat_export`.
+    """
+
+    chunks: Iterable[pd.DataFrame]
+    filename: str
+    build_metadata: Callable[[pd.DataFrame], pd.DataFrame | None] | None = None
+
+    def to_flat_export(self) -> FlatExport:
+        df = pd.concat(self.chunks, ignore_index=True)
+        metadata = self.build_metadata(df) if self.build_metadata else None
+        return FlatExport(df=df, filename=self.filename, metadata=metadata)
+
+
 class FlatFileExporter:
     """
     Base class used to generate tabular dataset exports.
@@ -547,9 +831,68 @@ class PydanticToDjangoError:
 
 T = TypeVar("T")
 
+# process-level counters for `cacheable`
+cacheable_stats: Counter = Counter()
+
+
+def _count_cacheable(key: str):
+    with SerializerHelper.stats_lock:
+        cacheable_stats[key] += 1
+
+
+class CachedValue(NamedTuple):
+    """A cached value with a freshness deadline, used by `cacheable` for stale-while-revalidate."""
+
+    value: Any
+    expires: float
+
+
+def _cacheable_set(
+    callable: Callable[..., T], cache_key: str, cache_duration: int, stale_duration: int, kw: dict
+) -> T:
+    result = callable(**kw)
+    _count_cacheable("recomputes")
+    if stale_duration > 0:
+        value = CachedValue(result, time.time() + cache_duration)
+        cache.set(cache_key, value, cache_duration + stale_duration)
+    else:
+        cache.set(cache_key, result, cache_duration)
+    return result
+
+
+def _cacheable_locked_set(
+    callable: Callable[..., T], cache_key: str, cache_duration: int, stale_duration: int, kw: dict
+) -> T:
+    # recompute while holding a distributed lock; other callers briefly wait for the result
+    lock_key = f"{cache_key}-lock"
+    if cache.add(lock_key, True, settings.CACHEABLE_LOCK_TIMEOUT):
+        try:
+            return _cacheable_set(callable, cache_key, cache_duration, stale_duration, kw)
+        finally:
+            cache.delete(lock_key)
+
+    _count_cacheable("lock_waits")
+    deadline = time.monotonic() + settings.CACHEABLE_LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(0.1)
+        if (result := cache.get(cache_key)) is not None:
+            return result.value if isinstance(result, CachedValue) else result
+        if cache.get(lock_key) is None:
+            break  # lock released or expired without a result; compute locally
+
+    logger.warning(f"cacheable lock wait expired: {cache_key}")
+    return _cacheable_set(callable, cache_key, cache_duration, stale_duration, kw)
+
 
 def cacheable(
-    callable: Callable[..., T], cache_key: str, flush: bool = False, cache_duration: int = -1, **kw
+    callable: Callable[..., T],
+    cache_key: str,
+    flush: bool = False,
+    cache_duration: int = -1,
+    lock: bool = False,
+    stale_duration: int = 0,
+    revalidate: Callable[[], Any] | None = None,
+    **kw,
 ) -> T:
     """Get the result from cache or call method to recreate and cache.
 
@@ -558,20 +901,51 @@ def cacheable(
         cache_key (str): the cache key to get/set
         flush (bool, default False): Force flush the cache and re-evaluate.
         cache_duration (int, default -1): cache key duration; if negative, use settings.CACHE_1_HR.
+        lock (bool, default False): if True, only one caller recomputes a missing result while
+            holding a distributed lock; concurrent callers wait for it for up to
+            settings.CACHEABLE_LOCK_WAIT seconds, then recompute.
+        stale_duration (int, default 0): if positive, an expired result is served for up to this
+            many seconds after cache_duration while a single caller revalidates it; implies lock.
+        revalidate (Callable, optional): if given with stale_duration, called instead of
+            recomputing inline when a stale result is served; for example, to queue a celery task
+            which calls `cacheable` with flush=True.
         **kw: keyword arguments passed to callable
 
     Returns:
         The result from the callable, either from cache or regenerated.
     """
+    if cache_duration < 0:
+        cache_duration = settings.CACHE_1_HR
     if flush:
-        cache.delete(cache_key)
+        return _cacheable_set(callable, cache_key, cache_duration, stale_duration, kw)
+
     result = cache.get(cache_key)
-    if result is None:
-        result = callable(**kw)
-        if cache_duration < 0:
-            cache_duration = settings.CACHE_1_HR
-        cache.set(cache_key, result, cache_duration)
-    return result
+    if stale_duration > 0 and result is not None:
+        if not isinstance(result, CachedValue):
+            result = None
+        elif result.expires > time.time():
+            _count_cacheable("hits")
+            return result.value
+        else:
+            _count_cacheable("stale_hits")
+            if cache.add(f"{cache_key}-lock", True, settings.CACHEABLE_LOCK_TIMEOUT):
+                if revalidate is not None:
+                    revalidate()  # lock expires on its own, to avoid queueing repeatedly
+                    return result.value
+                try:
+                    return _cacheable_set(callable, cache_key, cache_duration, stale_duration, kw)
+                finally:
+                    cache.delete(f"{cache_key}-lock")
+            return result.value
+
+    if result is not None:
+        _count_cacheable("hits")
+        return result
+
+    _count_cacheable("misses")
+    if lock or stale_duration > 0:
+        return _cacheable_locked_set(callable, cache_key, cache_duration, stale_duration, kw)
+    return _cacheable_set(callable, cache_key, cache_duration, stale_duration, kw)
 
 
 def flatten(lst: Iterable[Iterable]) -> Iterable:
@@ -1,14 +1,72 @@
 import logging
 import re
 import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from urllib.parse import urlparse
 
+from django.db import connection
 from django.http import HttpRequest, HttpResponse
 from django.utils.http import is_same_domain
+from django_redis.client import DefaultClient
 
 logger = logging.getLogger("hawc.request")
 
 
+@dataclass
+class RequestStats:
+    """Database and cache activity for the current request."""
+
+    sql_count: int = 0
+    sql_time: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_sets: int = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        # a database `execute_wrapper`; times each query
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_time += time.perf_counter() - start
+            self.sql_count += 1
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+_missing = object()
+
+
+class InstrumentedRedisClient(DefaultClient):
+    """A django-redis client which records cache hits, misses, and sets for request logging."""
+
+    def get(self, key, default=None, *args, **kwargs):
+        value = super().get(key, _missing, *args, **kwargs)
+        if stats := _request_stats.get():
+            if value is _missing:
+                stats.cache_misses += 1
+            else:
+                stats.cache_hits += 1
+        return default if value is _missing else value
+
+    def get_many(self, keys, *args, **kwargs):
+        keys = list(keys)
+        values = super().get_many(keys, *args, **kwargs)
+        if stats := _request_stats.get():
+            stats.cache_hits += len(values)
+            stats.cache_misses += len(keys) - len(values)
+        return values
+
+    def set(self, *args, **kwargs):
+        if stats := _request_stats.get():
+            stats.cache_sets += 1
+        return super().set(*args, **kwargs)
+
+
 def get_assessment_id(response: HttpResponse) -> int:
     try:
         # TODO  - refactor DRF viewset to add assessment id
@@ -22,22 +80,87 @@ def get_user_id(user) -> int:
 
 
 class RequestLogMiddleware:
+    """Log each request with its duration and database and cache activity.
+
+    For streaming responses, activity while the body is generated is included; the request is
+    logged when the body is closed.
+    """
+
     def __init__(self, get_response):
         self.get_response = get_response
 
+    @staticmethod
+    @contextmanager
+    def track(stats: RequestStats):
+        token = _request_stats.set(stats)
+        try:
+            with connection.execute_wrapper(stats):
+                yield
+        finally:
+            _request_stats.reset(token)
+
     def __call__(self, request: HttpRequest):
-        response = self.get_response(request)
-        message = "{} {} {} {} ip-{} user-{} assess-{}".format(
+        stats = RequestStats()
+        start = time.perf_counter()
+        with self.track(stats):
+            response = self.get_response(request)
+        if response.streaming and not getattr(response, "is_async", False):
+            response.streaming_content = self.stream(request, response, stats, start)
+        else:
+            self.log(request, response, stats, start, len(getattr(response, "content", "")))
+        return response
+
+    def stream(self, request, response, stats: RequestStats, start: float) -> Iterator[bytes]:
+        # generate the body with tracking active for each chunk; log once it's closed
+        content = iter(response.streaming_content)
+        size = 0
+        try:
+            while True:
+                with self.track(stats):
+                    chunk = next(content, _missing)
+                if chunk is _missing:
+                    break
+                size += len(chunk)
+                yield chunk
+        finally:
+            self.log(request, response, stats, start, size)
+
+    def log(self, request, response, stats: RequestStats, start: float, size: int):
+        duration = time.perf_counter() - start
+        message = (
+            "{} {} {} {} ip-{} user-{} assess-{} ms-{:.1f} sql-{} sqlms-{:.1f} "
+            "cache-hit-{} cache-miss-{} cache-set-{}"
+        ).format(
             request.method,
             request.path,
             response.status_code,
-            len(getattr(response, "content", "")),
+            size,
             request.META["REMOTE_ADDR"],
             get_user_id(request.user),
             get_assessment_id(response),
+            duration * 1000,
+            stats.sql_count,
+            stats.sql_time * 1000,
+            stats.cache_hits,
+            stats.cache_misses,
+            stats.cache_sets,
         )
         logger.info(message)
-        return response
+
+
+class CacheGenerationMiddleware:
+    """Read each assessment's cache generation at most once per request."""
+
+    def __init__(self, get_response):
+        # imported here; `helper` imports this module
+        from .helper import cache_generation_scope
+
+        self.get_response = get_response
+        self.cache_generation_scope = cache_generation_scope
+
+    def __call__(self, request: HttpRequest):
+        with self.cache_generation_scope():
+            return self.get_response(request)
 
 
 class MicrosoftOfficeLinkMiddleware:
@@ -3,6 +3,7 @@ import math
 import re
 from collections.abc import Iterable, Iterator
 from html import unescape
+from typing import NamedTuple
 
 import pandas as pd
 from django.apps import apps
@@ -136,6 +137,41 @@ class NonUniqueTagBase(models.Model):
         return slug
 
 
+class TagClosure(NamedTuple):
+    """
+    Descendant relations for all tags in an assessment tree, including the root.
+    """
+
+    # tag id: ids of the tag and all of its descendants, in tree order
+    descendants: dict[int, list[int]]
+
+    @classmethod
+    def from_tags(cls, tags: list[dict]) -> "TagClosure":
+        """
+        Build a closure from a tag tree.
+
+        Args:
+            tags (list[dict]): a tag tree in dump_bulk format
+
+        Returns:
+            TagClosure: the closure
+        """
+        descendants = {}
+
+        def recurse(tag: dict, parents: list[int]):
+            id = tag["id"]
+            for parent in parents:
+                descendants[parent].append(id)
+            descendants[id] = [id]
+            for child in tag.get("children", []):
+                recurse(child, [*parents, id])
+
+        for tag in tags:
+            recurse(tag, [])
+
+        return cls(descendants=descendants)
+
+
 class AssessmentRootMixin:
     cache_template_taglist = NotImplementedAttribute
     cache_template_tagtree = NotImplementedAttribute
@@ -257,11 +293,33 @@ class AssessmentRootMixin:
             logger.info(f"cache set: {key}")
         return descendants
 
+    @classmethod
+    def get_closure_cache_key(cls, assessment_id) -> str:
+        # versioned with the TagClosure fields, since closures are pickled in the cache
+        return f"{cls.cache_template_tagtree.format(assessment_id)}-closure-v2"
+
+    @classmethod
+    def get_closure(cls, assessment_id) -> TagClosure:
+        """
+        Get descendant relations for all tags in an assessment; cached with the tag tree and
+        cleared whenever the tree is cleared.
+        """
+        key = cls.get_closure_cache_key(assessment_id)
+        closure = cache.get(key)
+        if closure:
+            logger.info(f"cache used: {key}")
+        else:
+            closure = TagClosure.from_tags(cls.get_all_tags(assessment_id))
+            cache.set(key, closure)
+            logger.info(f"cache set: {key}")
+        return closure
+
     @classmethod
     def clear_cache(cls, assessment_id):
         keys = (
             cls.cache_template_taglist.format(assessment_id),
             cls.cache_template_tagtree.format(assessment_id),
+            cls.get_closure_cache_key(assessment_id),
         )
         logger.info(f"removing cache: {', '.join(keys)}")
         cache.delete_many(keys)
@@ -374,6 +432,25 @@ class AssessmentRootMixin:
         _match_nodes(src, dest)
         return mapping
 
+    def get_descendant_ids(
+        self, assessment_id: int | None = None, closure: TagClosure | None = None
+    ) -> list[int]:
+        """
+        Get ids of this tag and all of its descendants from the cached assessment closure.
+
+        Args:
+            assessment_id (int | None): the tag's assessment, if known; saves a query
+            closure (TagClosure | None): the assessment closure, if already fetched
+        """
+        if closure is None:
+            if assessment_id is None:
+                assessment_id = self.get_assessment_id()
+            closure = self.get_closure(assessment_id)
+        if ids := closure.descendants.get(self.id):
+            return ids
+        # tag is missing from a stale closure; read from the database
+        return list(self.get_tree(self).values_list("pk", flat=True))
+
     def get_assessment_id(self) -> int:
         name = self.name if self.is_root() else self.get_ancestors()[0].name
         return int(name[name.find("-") + 1 :])
@@ -1,9 +1,11 @@
 import json
+from collections.abc import Iterable, Iterator
 from io import BytesIO, StringIO
 
 import matplotlib.pyplot as plt
 import pandas as pd
 from django.conf import settings
+from django.http import HttpResponseBase, StreamingHttpResponse
 from django.utils.text import slugify
 from matplotlib.axes import Axes
 from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
@@ -12,9 +14,10 @@ from openpyxl.utils import get_column_letter
 from openpyxl.utils.exceptions import IllegalCharacterError
 from rest_framework import status
 from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer
+from rest_framework.request import Request
 from rest_framework.response import Response
 
-from .helper import FlatExport, ReportExport, rename_duplicate_columns
+from .helper import FlatExport, ReportExport, StreamingFlatExport, rename_duplicate_columns
 
 
 class DocxRenderer(BaseRenderer):
@@ -80,6 +83,18 @@ class PandasBaseRenderer(BaseRenderer):
         return self.render_dataframe(data, renderer_context["response"])
 
 
+class PandasStreamingRenderer(PandasBaseRenderer):
+    """
+    Renderer which can also write dataframe chunks incrementally; see `streaming_response`.
+    """
+
+    def render_dataframe(self, export: FlatExport, response: Response) -> str:
+        return "".join(self.stream_dataframes([export.df]))
+
+    def stream_dataframes(self, chunks: Iterable[pd.DataFrame]) -> Iterator[str]:
+        raise NotImplementedError()
+
+
 class PandasHtmlRenderer(PandasBaseRenderer):
     """
     Renders dataframe as Html
@@ -93,33 +108,32 @@ class PandasHtmlRenderer(PandasBaseRenderer):
             return export.df.fillna("-").to_html(index=False)
 
 
-class PandasCsvRenderer(PandasBaseRenderer):
+class PandasCsvRenderer(PandasStreamingRenderer):
     """
     Renders dataframe as CSV
     """
 
     media_type = "text/csv"
     format = "csv"
+    sep = ","
 
-    def render_dataframe(self, export: FlatExport, response: Response) -> str:
-        # set line terminator to keep consistent on windows too
-        return export.df.to_csv(index=False, lineterminator="\n")
+    def stream_dataframes(self, chunks: Iterable[pd.DataFrame]) -> Iterator[str]:
+        for i, df in enumerate(chunks):
+            # set line terminator to keep consistent on windows too
+            yield df.to_csv(index=False, header=i == 0, sep=self.sep, lineterminator="\n")
 
 
-class PandasTsvRenderer(PandasBaseRenderer):
+class PandasTsvRenderer(PandasCsvRenderer):
     """
     Renders dataframe as TSV
     """
 
     media_type = "text/tab-separated-values"
     format = "tsv"
+    sep = "\t"
 
-    def render_dataframe(self, export: FlatExport, response: Response) -> str:
-        # set line terminator to keep consistent on windows too
-        return export.df.to_csv(index=False, sep="\t", lineterminator="\n")
 
-
-class PandasJsonRenderer(PandasBaseRenderer):
+class PandasJsonRenderer(PandasStreamingRenderer):
     """
     Renders dataframe as JSON
     """
@@ -127,10 +141,19 @@ class PandasJsonRenderer(PandasBaseRenderer):
     media_type = "application/json"
     format = "json"
 
-    def render_dataframe(self, export: FlatExport, response: Response) -> str:
-        if export.df.columns.has_duplicates:
-            rename_duplicate_columns(export.df)
-        return export.df.to_json(orient="records")
+    def stream_dataframes(self, chunks: Iterable[pd.DataFrame]) -> Iterator[str]:
+        # write a single array of records; each chunk is written without its enclosing brackets
+        yield "["
+        first = True
+        for df in chunks:
+            if df.shape[0] == 0:
+                continue
+            if df.columns.has_duplicates:
+                rename_duplicate_columns(df)
+            records = df.to_json(orient="records")[1:-1]
+            yield records if first else f",{records}"
+            first = False
+        yield "]"
 
 
 class PandasBrowsableAPIRenderer(BrowsableAPIRenderer):
@@ -213,6 +236,29 @@ class PandasXlsxRenderer(PandasBaseRenderer):
         return f.getvalue()
 
 
+def streaming_response(request: Request, export: StreamingFlatExport) -> HttpResponseBase:
+    """Return a response for an export generated in chunks.
+
+    If the accepted renderer supports streaming, chunks are written to a streaming response as
+    they are generated, so memory is bounded by the chunk size instead of the export size.
+    Otherwise, chunks are concatenated and rendered as a regular `FlatExport`.
+
+    Args:
+        request (Request): the request, after content negotiation
+        export (StreamingFlatExport): the export
+
+    Returns:
+        HttpResponseBase: a response
+    """
+    renderer = request.accepted_renderer
+    if not isinstance(renderer, PandasStreamingRenderer):
+        return Response(export.to_flat_export())
+    return StreamingHttpResponse(
+        renderer.stream_dataframes(export.chunks),
+        content_type=f"{renderer.media_type}; charset={renderer.charset}",
+    )
+
+
 PandasRenderers = [
     PandasJsonRenderer,
     PandasHtmlRenderer,
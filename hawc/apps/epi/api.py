@@ -16,7 +16,7 @@ from ..assessment.constants import AssessmentViewSetPermissions
 from ..assessment.models import Assessment, DSSTox
 from ..assessment.serializers import AssessmentSerializer
 from ..common.api import ReadWriteSerializerMixin, get_published_only
-from ..common.helper import FlatExport, cacheable
+from ..common.helper import FlatExport, assessment_cache_key, cacheable
 from ..common.renderers import PandasRenderers
 from ..common.serializers import ExportQuerySerializer, UnusedSerializer
 from . import exports, models, serializers
@@ -68,7 +68,9 @@ class EpiAssessmentViewSet(BaseAssessmentViewSet):
         ser = ExportQuerySerializer(data=request.query_params)
         ser.is_valid(raise_exception=True)
         published_only = get_published_only(self.assessment, request)
-        key = f"assessment-{self.assessment.id}-epi-study-heatmap-unpub-{not published_only}"
+        key = assessment_cache_key(
+            self.assessment.id, f"epi-study-heatmap-unpub-{not published_only}"
+        )
         df = cacheable(
             lambda: models.Result.heatmap_study_df(self.assessment, published_only=published_only),
             key,
@@ -92,7 +94,9 @@ class EpiAssessmentViewSet(BaseAssessmentViewSet):
         ser = ExportQuerySerializer(data=request.query_params)
         ser.is_valid(raise_exception=True)
         published_only = get_published_only(self.assessment, request)
-        key = f"assessment-{self.assessment.id}-epi-result-heatmap-unpub-{not published_only}"
+        key = assessment_cache_key(
+            self.assessment.id, f"epi-result-heatmap-unpub-{not published_only}"
+        )
         df = cacheable(
             lambda: models.Result.heatmap_df(self.assessment.id, published_only=published_only),
             key,
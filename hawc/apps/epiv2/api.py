@@ -1,6 +1,5 @@
 from rest_framework import viewsets
 from rest_framework.decorators import action
-from rest_framework.response import Response
 
 from ..assessment.api import (
     AssessmentEditViewSet,
@@ -12,7 +11,7 @@ from ..assessment.constants import AssessmentViewSetPermissions
 from ..assessment.models import Assessment
 from ..common.api.utils import get_published_only
 from ..common.helper import FlatExport
-from ..common.renderers import PandasRenderers
+from ..common.renderers import PandasRenderers, streaming_response
 from ..common.serializers import UnusedSerializer
 from ..study.models import Study
 from . import exports, models, serializers
@@ -40,8 +39,8 @@ class EpiAssessmentViewSet(BaseAssessmentViewSet):
             .published_only(published_only)
             .complete()
         )
-        exporter = exports.EpiV2Exporter.flat_export(qs, filename=f"{assessment}-epi")
-        return Response(exporter)
+        export = exports.EpiV2Exporter.streaming_export(qs, filename=f"{assessment}-epi")
+        return streaming_response(request, export)
 
     @action(
         detail=True,
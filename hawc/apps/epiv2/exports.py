@@ -261,8 +261,8 @@ class EpiV2ExporterWithRob(EpiV2Exporter):
         )
         return df.merge(rob_df, how="left", on="study-id")
 
-    def get_df(self, qs: QuerySet) -> pd.DataFrame:
-        df = super().get_df(qs)
+    def get_df(self, qs: QuerySet, chunk_size: int | None = None) -> pd.DataFrame:
+        df = super().get_df(qs, chunk_size)
         df = self.study_evaluation_data(df)
         return df
 
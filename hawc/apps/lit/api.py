@@ -2,6 +2,7 @@ from zipfile import BadZipFile
 
 import pandas as pd
 import plotly.express as px
+from django.conf import settings
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
 from django.shortcuts import get_object_or_404
@@ -18,7 +19,7 @@ from ..assessment.api import (
 from ..assessment.constants import AssessmentViewSetPermissions
 from ..assessment.models import Assessment
 from ..common.api import OncePerMinuteThrottle, PaginationWithCount
-from ..common.helper import FlatExport, cacheable
+from ..common.helper import FlatExport, assessment_cache_key, cacheable
 from ..common.renderers import PandasRenderers
 from ..common.serializers import UnusedSerializer
 from ..common.views import create_object_log
@@ -193,7 +194,7 @@ class LiteratureAssessmentViewSet(BaseAssessmentViewSet):
         assessment = self.get_object()
         queryset = (
             models.Reference.objects.get_qs(assessment)
-            .prefetch_related("identifiers", "tags")
+            .prefetch_related("identifiers")
             .order_by("id")
         )
         fs = filterset.ReferenceExportFilterSet(
@@ -233,7 +234,7 @@ class LiteratureAssessmentViewSet(BaseAssessmentViewSet):
         qs = (
             models.UserReferenceTag.objects.filter(reference__assessment=assessment.id)
             .select_related("reference", "user")
-            .prefetch_related("tags", "reference__identifiers")
+            .prefetch_related("reference__identifiers")
             .order_by("reference_id", "id")
         )
         exporter = exports.ReferenceFlatComplete(
@@ -256,8 +257,13 @@ class LiteratureAssessmentViewSet(BaseAssessmentViewSet):
         Get tags formatted in a long format desireable for heatmaps.
         """
         instance = self.get_object()
-        key = f"assessment-{instance.id}-lit-tag-heatmap"
-        df = cacheable(lambda: models.Reference.objects.heatmap_dataframe(instance.id), key)
+        key = assessment_cache_key(instance.id, "lit-tag-heatmap")
+        df = cacheable(
+            lambda: models.Reference.objects.heatmap_dataframe(instance.id),
+            key,
+            lock=True,
+            stale_duration=settings.CACHE_1_HR,
+        )
         return FlatExport.api_response(df=df, filename=f"df-{instance.id}")
 
     @transaction.atomic
@@ -0,0 +1,126 @@
+# Cache for reference metadata fetched from remote databases (HERO, PubMed).
+import logging
+from collections.abc import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ...services.epa import hero
+from ...services.nih import pubmed
+from . import constants
+
+logger = logging.getLogger(__name__)
+
+
+class ReferenceMetadataCache:
+    """Local cache of citation metadata fetched from a remote reference database.
+
+    Content is keyed by database and unique ID. Entries expire after `timeout` seconds, after
+    which they are revalidated by fetching from the remote database again. Only cache misses
+    are fetched remotely; hit and miss counters are tracked for each instance.
+    """
+
+    def __init__(self, database: constants.ReferenceDatabase, timeout: int | None = None):
+        self.database = database
+        self.timeout = settings.LIT_METADATA_CACHE_TIMEOUT if timeout is None else timeout
+        self.hits = 0
+        self.misses = 0
+
+    def get_key(self, unique_id: int) -> str:
+        return f"lit-metadata-{self.database}-{unique_id}"
+
+    def get_many(self, ids: list[int]) -> dict[int, dict]:
+        """Return cached content for IDs which exist in cache."""
+        keys = {self.get_key(id_): id_ for id_ in ids}
+        found = cache.get_many(list(keys.keys()))
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return {keys[key]: value for key, value in found.items()}
+
+    def set_many(self, content: dict[int, dict]):
+        cache.set_many({self.get_key(id_): value for id_, value in content.items()}, self.timeout)
+
+    def delete_many(self, ids: list[int]):
+        cache.delete_many([self.get_key(id_) for id_ in ids])
+
+    def fetch(
+        self,
+        ids: list[int],
+        fetch_missing: Callable[[list[int]], list[dict]],
+        id_field: str,
+        refresh: bool = False,
+    ) -> list[dict]:
+        """Return content for the requested IDs, fetching only cache misses.
+
+        Args:
+            ids (list[int]): unique IDs to fetch
+            fetch_missing (Callable): fetches content from the remote database for a list of IDs
+            id_field (str): the key in the fetched content which contains the unique ID
+            refresh (bool, default False): fetch all IDs from the remote database, ignoring
+                cached content; fetched content is still cached
+
+        Returns:
+            list[dict]: content in requested ID order; IDs which could not be fetched are omitted
+        """
+        ids = list(dict.fromkeys(int(id_) for id_ in ids))
+        content = {} if refresh else self.get_many(ids)
+        if missing := [id_ for id_ in ids if id_ not in content]:
+            fetched = {int(item[id_field]): item for item in fetch_missing(missing)}
+            self.set_many(fetched)
+            content.update(fetched)
+        logger.info(f"Metadata cache {self.database.label}: {self.stats}")
+        return [content[id_] for id_ in ids if id_ in content]
+
+    @property
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+
+def _fetch_hero(ids: list[int]) -> list[dict]:
+    return hero.HEROFetch(ids).get_content()["success"]
+
+
+def _fetch_pubmed(ids: list[int]) -> list[dict]:
+    return pubmed.PubMedFetch(ids).get_content()
+
+
+def fetch_hero_content(
+    ids: list[int], metadata_cache: ReferenceMetadataCache | None = None, refresh: bool = False
+) -> dict:
+    """Fetch HERO content, using cached content where available.
+
+    Args:
+        ids (list[int]): HERO IDs
+        metadata_cache (ReferenceMetadataCache, optional): cache; a new instance if None
+        refresh (bool, default False): fetch the latest content, ignoring cached content
+
+    Returns:
+        dict: {"success": list[dict], "failure": list[int]}, consistent with HEROFetch
+    """
+    metadata_cache = metadata_cache or ReferenceMetadataCache(constants.ReferenceDatabase.HERO)
+    success = metadata_cache.fetch(ids, _fetch_hero, "HEROID", refresh=refresh)
+    found = {item["HEROID"] for item in success}
+    failure = sorted({int(id_) for id_ in ids} - found)
+    return dict(success=success, failure=failure)
+
+
+def fetch_pubmed_content(
+    ids: list[int], metadata_cache: ReferenceMetadataCache | None = None, refresh: bool = False
+) -> list[dict]:
+    """Fetch PubMed content, using cached content where available.
+
+    Args:
+        ids (list[int]): PubMed IDs
+        metadata_cache (ReferenceMetadataCache, optional): cache; a new instance if None
+        refresh (bool, default False): fetch the latest content, ignoring cached content
+
+    Returns:
+        list[dict]: PubMed content, consistent with PubMedFetch
+    """
+    metadata_cache = metadata_cache or ReferenceMetadataCache(constants.ReferenceDatabase.PUBMED)
+    return metadata_cache.fetch(ids, _fetch_pubmed, "PMID", refresh=refresh)
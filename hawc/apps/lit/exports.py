@@ -1,9 +1,62 @@
+from collections.abc import Iterable
+
+import numpy as np
 from django.utils.html import strip_tags
+from scipy import sparse
 
 from ..common.helper import FlatFileExporter
 from . import models
 
 
+class TagMatrix:
+    """
+    Tag membership for many items at once. An item is a member of a tag if it has been tagged
+    with the tag or any of its descendants.
+
+    Tags are mapped to column positions in the order of the tag tree; membership is computed
+    as a single sparse matrix product of applied tags by tag descendants.
+    """
+
+    def __init__(self, tag_tree: models.ReferenceFilterTag.TreeDescendantType):
+        self.columns = {tag_id: i for i, tag_id in enumerate(tag_tree)}
+        rows, cols = [], []
+        for col, tag_set in enumerate(tag_tree.values()):
+            for tag_id in tag_set:
+                rows.append(self.columns[tag_id])
+                cols.append(col)
+        n = len(self.columns)
+        # descendants[i, j] is nonzero if tag i is tag j or one of its descendants
+        self.descendants = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)), shape=(n, n)
+        )
+
+    def get_membership(
+        self, item_ids: list[int], item_tags: Iterable[tuple[int, int]]
+    ) -> np.ndarray:
+        """
+        Return a boolean matrix of items by tags.
+
+        Args:
+            item_ids (list[int]): Item ids, in the row order of the output
+            item_tags (Iterable[tuple[int, int]]): (item_id, tag_id) pairs of applied tags;
+                pairs for other items or tags are ignored
+
+        Returns:
+            np.ndarray: boolean array of shape (len(item_ids), number of tags)
+        """
+        index = {item_id: i for i, item_id in enumerate(item_ids)}
+        rows, cols = [], []
+        for item_id, tag_id in item_tags:
+            if item_id in index and tag_id in self.columns:
+                rows.append(index[item_id])
+                cols.append(self.columns[tag_id])
+        applied = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(len(index), len(self.columns)),
+        )
+        return (applied @ self.descendants).toarray() > 0
+
+
 class ReferenceFlatComplete(FlatFileExporter):
     """
     Returns an export of both references and reference tags
@@ -69,23 +122,32 @@ class ReferenceFlatComplete(FlatFileExporter):
     def _get_reference_rows(
         self, tag_tree: models.ReferenceFilterTag.TreeDescendantType
     ) -> list[list]:
-        rows = []
-        for ref in self.queryset:
-            row = self._get_reference_data(ref)
-            reference_tags = set(tag.id for tag in ref.tags.all())
-            # for each tag in tree, check to see if this item has been tagged with this
-            # tag or its descendants
-            row.extend(
-                [any(tag in tag_set for tag in reference_tags) for tag_set in tag_tree.values()]
-            )
-            rows.append(row)
-        return rows
+        refs = list(self.queryset)
+        item_tags = models.ReferenceTags.objects.filter(
+            content_object__in=self.queryset.values("id")
+        ).values_list("content_object_id", "tag_id")
+        # for each tag in tree, check to see if this item has been tagged with this
+        # tag or its descendants
+        membership = TagMatrix(tag_tree).get_membership([ref.id for ref in refs], item_tags)
+        return [
+            self._get_reference_data(ref) + tags.tolist()
+            for ref, tags in zip(refs, membership, strict=True)
+        ]
 
     def _get_reference_rows_with_users(
         self, tag_tree: models.ReferenceFilterTag.TreeDescendantType
     ) -> list[list]:
+        user_tags = list(self.queryset)
+        item_tags = models.UserReferenceTags.objects.filter(
+            content_object__in=self.queryset.values("id")
+        ).values_list("content_object_id", "tag_id")
+        # for each tag in tree, check to see if this item has been tagged with this
+        # tag or its descendants
+        membership = TagMatrix(tag_tree).get_membership(
+            [user_tag.id for user_tag in user_tags], item_tags
+        )
         rows = []
-        for user_tag in self.queryset:
+        for user_tag, tags in zip(user_tags, membership, strict=True):
             row = self._get_reference_data(user_tag.reference)
             row.extend(
                 [
@@ -96,12 +158,7 @@ class ReferenceFlatComplete(FlatFileExporter):
                     user_tag.last_updated,
                 ]
             )
-            user_tags_applied = set(tag.id for tag in user_tag.tags.all())
-            # for each tag in tree, check to see if this item has been tagged with this
-            # tag or its descendants
-            row.extend(
-                [any(tag in tag_set for tag in user_tags_applied) for tag_set in tag_tree.values()]
-            )
+            row.extend(tags.tolist())
             rows.append(row)
         return rows
 
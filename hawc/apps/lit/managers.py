@@ -1,5 +1,7 @@
 import json
 import logging
+from collections.abc import Iterable
+from itertools import batched
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -7,10 +9,11 @@ import pandas as pd
 from django.apps import apps
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.search import SearchQuery
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import models, transaction
-from django.db.models import Count, Q, QuerySet
-from django.db.models.functions import Cast
+from django.db import connection, models, transaction
+from django.db.models import Count, OuterRef, Q, QuerySet, Subquery
+from django.db.models.functions import Cast, Coalesce
 from django.utils.timezone import now
 from taggit.managers import TaggableManager, _TaggableManager
 from taggit.utils import require_instance_manager
@@ -18,16 +21,15 @@ from taggit.utils import require_instance_manager
 from hawc.refml import tags as refmltags
 from hawc.services.utils.doi import get_doi_from_identifier
 
-from ...services.epa import hero
-from ...services.nih import pubmed
 from ..assessment.managers import published
 from ..common.helper import flatten
 from ..common.models import BaseManager, replace_null, str_m2m
 from ..study.managers import study_df_annotations
 from . import constants
+from .cache import fetch_hero_content, fetch_pubmed_content
 
 if TYPE_CHECKING:
-    from .models import Workflow
+    from .models import Reference, Workflow
 
 
 logger = logging.getLogger(__name__)
@@ -66,6 +68,7 @@ class _ReferenceFilterTagManager(_TaggableManager):
         for tag_id in selected_tags:
             tagrefs.append(self.through(tag_id=tag_id, content_object=self.instance))
         self.through.objects.bulk_create(tagrefs)
+        apps.get_model("lit", "Reference").clear_overview_cache(self.instance.assessment_id)
 
 
 class SearchManager(BaseManager):
@@ -215,10 +218,9 @@ class IdentifiersQuerySet(models.QuerySet):
 
         if create and missing_identifiers:
             # create any missing pubmed identifiers
-            fetcher = pubmed.PubMedFetch(
+            fetched_content = fetch_pubmed_content(
                 [identifier_to_associated_pubmed[identifier] for identifier in missing_identifiers]
             )
-            fetched_content = fetcher.get_content()
             created_pubmed_identifiers = self.model.objects.bulk_create_pubmed_ids(fetched_content)
 
             # add these new pubmed identifiers to the association map
@@ -243,80 +245,95 @@ class IdentifiersManager(BaseManager):
     def get_queryset(self):
         return IdentifiersQuerySet(self.model, using=self._db)
 
-    def get_from_ris(self, search_id, references):
-        # Return a queryset of identifiers for each object in RIS file.
-        # Expensive; requires a maximum of ~5N queries
-        pimdsFetch = []
-        refs = []
-        Identifiers = apps.get_model("lit", "Identifiers")
+    # RIS accession databases which are saved as identifiers
+    RIS_ACCESSION_DATABASES = {
+        "wos": constants.ReferenceDatabase.WOS,
+        "scopus": constants.ReferenceDatabase.SCOPUS,
+        "emb": constants.ReferenceDatabase.EMBASE,
+    }
+
+    def get_from_ris(
+        self, search_id: int, references: list[dict], batch_size: int = 5000
+    ) -> list[list]:
+        """Get or create identifiers for each reference in an RIS file.
+
+        All identifier keys are collected up front; existing identifiers are fetched with one
+        query per database per batch, RIS content is bulk updated, and missing identifiers are
+        bulk created. New PubMed identifiers are queued for a content update.
+
+        Args:
+            search_id (int): the search id, used to namespace RIS identifiers
+            references (list[dict]): references parsed from an RIS file
+            batch_size (int, default 5000): number of identifiers per query
+
+        Returns:
+            list[list[Identifiers]]: identifiers for each reference, in order; the first
+                identifier for each reference is always the RIS identifier.
+        """
+        RIS = constants.ReferenceDatabase.RIS
+        ris_content: dict[str, str] = {}
+        keys: list[list[tuple[int, str]]] = []
         for ref in references:
-            ids = []
+            ref_keys = []
 
             db = ref.get("accession_db")
             if db:
                 db = db.lower()
 
-            # Create Endnote identifier
             # create id based on search_id and id from RIS file.
             id_ = f"s{search_id}-id{ref['id']}"
-            content = json.dumps(ref)
-            ident = self.filter(database=constants.ReferenceDatabase.RIS, unique_id=id_).first()
-            if ident:
-                ident.content = content
-                ident.save()
-            else:
-                ident = self.create(
-                    database=constants.ReferenceDatabase.RIS, unique_id=id_, content=content
-                )
-            ids.append(ident)
+            ris_content[id_] = content = json.dumps(ref)
+            ref_keys.append((RIS, id_))
 
-            # create DOI identifier
-            if doi := get_doi_from_identifier(ident):
-                ident, _ = self.get_or_create(
-                    database=constants.ReferenceDatabase.DOI, unique_id=doi
-                )
-                ids.append(ident)
+            if doi := get_doi_from_identifier(self.model(content=content)):
+                ref_keys.append((constants.ReferenceDatabase.DOI, doi))
 
-            # create PMID identifier
             # (some may include both an accession number and PMID)
             if ref["PMID"] is not None or db == "nlm":
                 id_ = ref["PMID"] or ref["accession_number"]
                 if id_ is not None:
-                    ident = self.filter(
-                        database=constants.ReferenceDatabase.PUBMED, unique_id=str(id_)
-                    ).first()
-                    if not ident:
-                        ident = self.create(
-                            database=constants.ReferenceDatabase.PUBMED,
-                            unique_id=str(id_),
-                            content="",
-                        )
-                        pimdsFetch.append(ident)
-                    ids.append(ident)
-
-            # create other accession identifiers
-            if (
-                db is not None
-                and ref["accession_number"] is not None
-                and ref["accession_number"] != ""
-            ):
-                db_id = None
-                if db == "wos":
-                    db_id = constants.ReferenceDatabase.WOS
-                elif db == "scopus":
-                    db_id = constants.ReferenceDatabase.SCOPUS
-                elif db == "emb":
-                    db_id = constants.ReferenceDatabase.EMBASE
-
-                if db_id:
-                    id_ = ref["accession_number"]
-                    ident, _ = self.get_or_create(database=db_id, unique_id=id_, content="")
-                    ids.append(ident)
-
-            refs.append(ids)
-
-        Identifiers.update_pubmed_content(pimdsFetch)
-        return refs
+                    ref_keys.append((constants.ReferenceDatabase.PUBMED, str(id_)))
+
+            if db and ref["accession_number"] not in (None, ""):
+                if db_id := self.RIS_ACCESSION_DATABASES.get(db):
+                    ref_keys.append((db_id, ref["accession_number"]))
+
+            keys.append(ref_keys)
+
+        # fetch existing identifiers, one query per database per batch
+        unique_ids: dict[int, set[str]] = {}
+        for ref_keys in keys:
+            for database, unique_id in ref_keys:
+                unique_ids.setdefault(database, set()).add(unique_id)
+        identifiers = {}
+        for database, ids in unique_ids.items():
+            for batch in batched(sorted(ids), batch_size):
+                for ident in self.filter(database=database, unique_id__in=batch):
+                    identifiers[(database, ident.unique_id)] = ident
+
+        # update content of existing RIS identifiers
+        updates = [ident for (database, _), ident in identifiers.items() if database == RIS]
+        for ident in updates:
+            ident.content = ris_content[ident.unique_id]
+        self.bulk_update(updates, ["content"], batch_size=batch_size)
+
+        # create missing identifiers
+        creates = [
+            self.model(
+                database=database,
+                unique_id=unique_id,
+                content=ris_content[unique_id] if database == RIS else "",
+            )
+            for database, ids in unique_ids.items()
+            for unique_id in sorted(ids)
+            if (database, unique_id) not in identifiers
+        ]
+        for ident in self.bulk_create(creates, batch_size=batch_size):
+            identifiers[(ident.database, ident.unique_id)] = ident
+
+        if pubmed := [i for i in creates if i.database == constants.ReferenceDatabase.PUBMED]:
+            self.model.update_pubmed_content(pubmed)
+        return [[identifiers[key] for key in ref_keys] for ref_keys in keys]
 
     def validate_hero_ids(self, ids: list[int]) -> dict:
         """Queries HERO to return a valid list HERO content which doesn't already exist in HAWC.
@@ -350,8 +367,7 @@ class IdentifiersManager(BaseManager):
         remaining_ids = list(set(_ids) - set(existing_ids))
 
         # fetch missing ids
-        fetcher = hero.HEROFetch(remaining_ids)
-        fetched_content = fetcher.get_content()
+        fetched_content = fetch_hero_content(remaining_ids)
         if len(fetched_content["failure"]) > 0:
             failed_join = ", ".join(str(el) for el in fetched_content["failure"])
             raise ValidationError(f"The following HERO ID(s) could not be imported: {failed_join}")
@@ -444,8 +460,7 @@ class IdentifiersManager(BaseManager):
         remaining_ids = list(set(_ids) - set(existing_ids))
 
         # fetch missing ids
-        fetcher = pubmed.PubMedFetch(remaining_ids)
-        fetched_content = fetcher.get_content()
+        fetched_content = fetch_pubmed_content(remaining_ids)
         if failed_ids := set(remaining_ids) - {int(item["PMID"]) for item in fetched_content}:
             failed_join = ", ".join(str(id) for id in failed_ids)
             raise ValidationError(
@@ -488,9 +503,8 @@ class ReferenceQuerySet(models.QuerySet):
         return self.annotate(tag_count=models.Count("tags")).filter(tag_count=0)
 
     def with_tag(self, tag, descendants: bool = False):
-        tag_ids = [tag.id]
-        if descendants:
-            tag_ids.extend(list(tag.get_descendants().values_list("pk", flat=True)))
+        # descendants are selected in a subquery, which requires no assessment lookup
+        tag_ids = tag.get_tree(tag).values("pk") if descendants else [tag.id]
         return self.filter(tags__in=tag_ids).distinct("pk")
 
     def require_tags(self, required_tags, intersection: bool = False, descendants: bool = False):
@@ -507,9 +521,10 @@ class ReferenceQuerySet(models.QuerySet):
 
         if descendants:
             # keep tags and their descendants together; needed if intersection is True
-            required_tags = [[tag, *tag.get_descendants()] for tag in required_tags]
+            closure = required_tags[0].get_closure(required_tags[0].get_assessment_id())
+            required_tags = [tag.get_descendant_ids(closure=closure) for tag in required_tags]
         else:
-            required_tags = [[tag] for tag in required_tags]
+            required_tags = [[tag.id] for tag in required_tags]
 
         if intersection:
             query = Q(tags__in=required_tags[0])
@@ -534,20 +549,18 @@ class ReferenceQuerySet(models.QuerySet):
         if not pruned_tags:
             return self
 
+        closure = root_tag.get_closure(root_tag.get_assessment_id())
         if descendants:
-            pruned_tags = [
-                tag
-                for tags in [[tag, *tag.get_descendants()] for tag in pruned_tags]
-                for tag in tags
-            ]
+            pruned_tag_ids = {
+                id for tag in pruned_tags for id in tag.get_descendant_ids(closure=closure)
+            }
+        else:
+            pruned_tag_ids = {tag.id for tag in pruned_tags}
 
-        all_tags = [root_tag, *root_tag.get_descendants()]
-        safe_tags = [
-            tag for tag in all_tags if all([tag.pk != pruned_tag.pk for pruned_tag in pruned_tags])
+        safe_tag_ids = [
+            id for id in root_tag.get_descendant_ids(closure=closure) if id not in pruned_tag_ids
         ]
-        query = Q(tags__in=[tag.pk for tag in pruned_tags]) & ~Q(
-            tags__in=[tag.pk for tag in safe_tags]
-        )
+        query = Q(tags__in=pruned_tag_ids) & ~Q(tags__in=safe_tag_ids)
         return self.exclude(query).distinct("pk")
 
     def unresolved_user_tags(self, user_id: int) -> dict[int, list[int]]:
@@ -718,6 +731,7 @@ class ReferenceQuerySet(models.QuerySet):
                         {queryset.count()} references updated and {updated_user_tag_count} user tags resolved.
                         References updated: {references}.""",
         )
+        self.model.clear_overview_cache(assessment_id)
         message = f"{len(references)} references updated and {updated_user_tag_count} user tags resolved. References updated: {references}"
         return {"merged": True, "queryset": queryset, "message": message}
 
@@ -786,19 +800,70 @@ class ReferenceManager(BaseManager):
     def get_queryset(self):
         return ReferenceQuerySet(self.model, using=self._db)
 
-    def build_ref_ident_m2m(self, objs):
-        # Bulk-create reference-search relationships
-        logger.debug("Starting bulk creation of reference-identifier values")
-        m2m = self.model.identifiers.through
-        objects = [m2m(reference_id=ref_id, identifiers_id=ident_id) for ref_id, ident_id in objs]
-        m2m.objects.bulk_create(objects)
+    def add_search(self, refs: QuerySet, search) -> int:
+        """Associate references with a search using a single INSERT ... SELECT statement.
+
+        Args:
+            refs (QuerySet): references which are not yet associated with the search
+            search (Search): the search
 
-    def build_ref_search_m2m(self, refs, search):
-        # Bulk-create reference-search relationships
-        logger.debug("Starting bulk creation of reference-search values")
+        Returns:
+            int: the number of references associated
+        """
         m2m = self.model.searches.through
-        objects = [m2m(reference_id=ref.id, search_id=search.id) for ref in refs]
-        m2m.objects.bulk_create(objects)
+        sql, params = refs.order_by().values("id").distinct().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {m2m._meta.db_table} (reference_id, search_id) "  # noqa: S608
+                f"SELECT refs.id, %s FROM ({sql}) AS refs",
+                [search.id, *params],
+            )
+            n_added = cursor.rowcount
+        if n_added > 0:
+            self.model.clear_overview_cache(search.assessment_id)
+        return n_added
+
+    def bulk_create_references(
+        self, search, references: Iterable[tuple["Reference", list[int]]], batch_size: int = 5000
+    ) -> int:
+        """Bulk create references and associate each with a search and its identifiers.
+
+        References are created with returned primary keys (INSERT ... RETURNING), so the
+        reference-search and reference-identifier through tables can be bulk inserted without
+        re-querying. Each batch requires three queries, regardless of batch size.
+
+        Args:
+            search (Search): the search to associate with each new reference
+            references (Iterable): pairs of an unsaved reference and its identifier primary keys
+            batch_size (int, default 5000): number of references per batch
+
+        Returns:
+            int: the number of references created
+        """
+        RefSearchM2M = self.model.searches.through
+        RefIdM2M = self.model.identifiers.through
+        n_created = 0
+        for batch in batched(references, batch_size):
+            refs, identifier_ids = zip(*batch, strict=True)
+            refs = self.bulk_create(refs)
+            RefSearchM2M.objects.bulk_create(
+                [RefSearchM2M(reference_id=ref.id, search_id=search.id) for ref in refs]
+            )
+            RefIdM2M.objects.bulk_create(
+                [
+                    RefIdM2M(reference_id=ref.id, identifiers_id=ident_id)
+                    for ref, ident_ids in zip(refs, identifier_ids, strict=True)
+                    for ident_id in ident_ids
+                ]
+            )
+            n_created += len(refs)
+        if n_created > 0:
+            # bulk_create does not send post_save signals
+            apps.get_model("assessment", "Assessment").clear_data_presence_cache(
+                search.assessment_id
+            )
+            self.model.clear_overview_cache(search.assessment_id)
+        return n_created
 
     def tag_pairs(self, qs):
         # get reference tag pairs
@@ -809,60 +874,116 @@ class ReferenceManager(BaseManager):
             .values("reference_id", "tag_id")
         )
 
-    def get_hero_references(self, search, identifiers):
-        """
-        Given a list of Identifiers, return a list of references associated
-        with each of these identifiers.
+    def _get_new_identifiers(self, search, identifiers) -> tuple[list, QuerySet]:
+        """Associate existing references with a search, and find identifiers without references.
+
+        Args:
+            search (Search): the search
+            identifiers (QuerySet): identifiers from the search
+
+        Returns:
+            tuple[list[Reference], QuerySet]: references in the assessment already associated
+                with these identifiers, and the identifiers which have no reference
         """
         # Get references which already existing and are tied to this identifier
         # but are not associated with the current search and save this search
         # as well to this Reference.
-        refs = (
-            self.get_qs(search.assessment)
-            .filter(identifiers__in=identifiers)
-            .exclude(searches=search)
-        )
-        self.build_ref_search_m2m(refs, search)
+        qs = self.get_qs(search.assessment).filter(identifiers__in=identifiers)
+        self.add_search(qs.exclude(searches=search), search)
 
-        # get references associated with these identifiers, and get a subset of
-        # identifiers which have no reference associated with them
-        refs = list(self.get_qs(search.assessment).filter(identifiers__in=identifiers))
+        # Only process identifiers which have no reference
+        refs = list(qs.distinct())
         if refs:
             identifiers = identifiers.exclude(references__in=refs)
+        return refs, identifiers
+
+    def _add_identifiers(self, search, references: list[tuple["Reference", list[int]]]):
+        """Associate existing references with a search and additional identifiers.
+
+        Args:
+            search (Search): the search
+            references (list): pairs of a saved reference and identifier primary keys to add
+        """
+        RefSearchM2M = self.model.searches.through
+        RefIdM2M = self.model.identifiers.through
+        RefSearchM2M.objects.bulk_create(
+            [
+                RefSearchM2M(reference_id=ref_id, search_id=search.id)
+                for ref_id in {ref.id for ref, _ in references}
+            ],
+            ignore_conflicts=True,
+        )
+        RefIdM2M.objects.bulk_create(
+            [
+                RefIdM2M(reference_id=ref_id, identifiers_id=ident_id)
+                for ref_id, ident_id in {
+                    (ref.id, ident_id) for ref, ident_ids in references for ident_id in ident_ids
+                }
+            ],
+            ignore_conflicts=True,
+        )
+        if references:
+            self.model.clear_overview_cache(search.assessment_id)
+
+    def get_hero_references(self, search, identifiers, batch_size: int = 5000):
+        """
+        Given a list of Identifiers, return a list of references associated
+        with each of these identifiers.
 
+        New references are bulk created, using an existing reference instead if one in the
+        assessment has the same associated PubMed identifier. Query count is constant per batch.
+        """
+        refs, identifiers = self._get_new_identifiers(search, identifiers)
         pubmed_map = identifiers.associated_pubmed(create=True)
         doi_map = identifiers.associated_doi(create=True)
 
+        # find references which already exist for associated pubmed identifiers
+        pubmed_refs: dict[int, list[int]] = {}
+        for ident_id, ref_id in self.model.identifiers.through.objects.filter(
+            reference__assessment=search.assessment,
+            identifiers__in={ident.id for ident in pubmed_map.values()},
+        ).values_list("identifiers_id", "reference_id"):
+            pubmed_refs.setdefault(ident_id, []).append(ref_id)
+        existing = self.in_bulk({ref_id for ids in pubmed_refs.values() for ref_id in ids})
+
+        creates, updates, created_by_pubmed = [], [], {}
         for identifier in identifiers:
-            # check if any identifiers have a pubmed ID that already exists
-            # in database. If not, save a new reference.
+            ident_ids = [identifier.id]
+            if doi_identifier := doi_map.get(identifier):
+                ident_ids.append(doi_identifier.id)
 
+            # check if any identifiers have a pubmed ID that already exists
+            # in database. If not, create a new reference.
+            ref = None
             if pubmed_identifier := pubmed_map.get(identifier):
-                ref = self.get_qs(search.assessment).filter(identifiers=pubmed_identifier)
-            else:
-                ref = self.none()
-
-            if ref.count() == 1:
-                ref = ref[0]
-            elif ref.count() > 1:
-                raise Exception("Duplicate HERO reference found")
-            else:
+                ref_ids = pubmed_refs.get(pubmed_identifier.id, [])
+                if len(ref_ids) > 1:
+                    raise Exception("Duplicate HERO reference found")
+                elif ref_ids:
+                    ref = existing[ref_ids[0]]
+                else:
+                    ref = created_by_pubmed.get(pubmed_identifier.id)
+
+            if ref is None:
                 ref = identifier.create_reference(search.assessment)
-                ref.save()
                 if pubmed_identifier:
-                    ref.identifiers.add(pubmed_identifier)
-
-            if doi_identifier := doi_map.get(identifier):
-                ref.identifiers.add(doi_identifier)
-            ref.searches.add(search)
-            ref.identifiers.add(identifier)
+                    ident_ids.append(pubmed_identifier.id)
+                    created_by_pubmed[pubmed_identifier.id] = ref
+                creates.append((ref, ident_ids))
+            else:
+                updates.append((ref, ident_ids))
             refs.append(ref)
 
+        self.bulk_create_references(search, creates, batch_size=batch_size)
+        self._add_identifiers(search, updates)
         return refs
 
     def get_overview_details(self, assessment) -> (dict[str, int], list):
         """Generates statistics for literature overview page.
 
+        Statistics are cached per assessment, and cleared when references, tags, user tags, or
+        workflows change; see `Reference.clear_overview_cache`.
+
         Args:
             assessment (models.Assessment): The assessment to fetch data from
 
@@ -871,92 +992,119 @@ class ReferenceManager(BaseManager):
             is a dictionary of relevant literature statistics, and the second object is
             a list of Workflow objects with added data attributes.
         """
-        # Get an overview of tagging progress for an assessment
-        refs = self.get_qs(assessment)
         Workflow = apps.get_model("lit", "Workflow")
-        workflows = Workflow.objects.filter(
-            Q(assessment=assessment) & (Q(link_conflict_resolution=True) | Q(link_tagging=True))
+        workflows = list(
+            Workflow.objects.filter(
+                Q(assessment=assessment) & (Q(link_conflict_resolution=True) | Q(link_tagging=True))
+            )
         )
-        total = refs.count()
-        untagged_refs = refs.annotate(tag_count=models.Count("tags")).filter(tag_count=0)
-        total_untagged = untagged_refs.count()
-        total_tagged = total - total_untagged
-        total_searched = refs.all().filter(searches__search_type="s").distinct().count()
-        total_imported = total - total_searched
-        overview = {
-            "total_references": total,
-            "total_tagged": total_tagged,
-            "total_untagged": total_untagged,
-            "total_searched": total_searched,
-            "total_imported": total_imported,
-        }
-        if assessment.literature_settings.conflict_resolution:
-            UserReferenceTag = apps.get_model("lit", "UserReferenceTag")
-            user_refs = UserReferenceTag.objects.filter(reference__in=refs)
+        key = self.model.get_overview_cache_key(assessment.id)
+        data = cache.get(key)
+        if data is None or any(workflow.id not in data["workflows"] for workflow in workflows):
+            data = self._get_overview_counts(assessment, workflows)
+            cache.set(key, data)
+        for workflow in workflows:
+            workflow.needs_tagging, workflow.conflicts = data["workflows"][workflow.id]
+        return data["overview"], workflows
+
+    def _get_overview_counts(self, assessment, workflows: list) -> dict:
+        # Get an overview of tagging progress for an assessment; reference counts for the
+        # assessment and each workflow are computed in a single aggregate query.
+        ReferenceTags = apps.get_model("lit", "ReferenceTags")
+        UserReferenceTag = apps.get_model("lit", "UserReferenceTag")
+        RefSearchM2M = self.model.searches.through
+        conflict_resolution = assessment.literature_settings.conflict_resolution
+        refs = self.get_qs(assessment).annotate(
+            is_tagged=models.Exists(ReferenceTags.objects.filter(content_object=OuterRef("pk"))),
+            is_searched=models.Exists(
+                RefSearchM2M.objects.filter(reference=OuterRef("pk"), search__search_type="s")
+            ),
+        )
+        untagged = Q(is_tagged=False)
+        aggregates = dict(
+            total=Count("id"),
+            total_untagged=Count("id", filter=untagged),
+            total_searched=Count("id", filter=Q(is_searched=True)),
+        )
+        if conflict_resolution:
             refs = refs.annotate(
-                tags_count=Count("tags"),
-                user_tag_count=Count("user_tags", filter=Q(user_tags__is_resolved=False)),
-            )
-            needs_tagging = refs.filter(user_tag_count__lt=2)
-            conflicts = refs.filter(user_tag_count__gt=1)
-            for workflow in workflows:
-                workflow_refs = refs.in_workflow(workflow)
-                workflow.needs_tagging = (
-                    needs_tagging.intersection(workflow_refs).count()
-                    if workflow.link_tagging
-                    else None
+                user_tag_count=Coalesce(
+                    Subquery(
+                        UserReferenceTag.objects.filter(reference=OuterRef("pk"), is_resolved=False)
+                        .order_by()
+                        .values("reference")
+                        .annotate(count=Count("id"))
+                        .values("count")
+                    ),
+                    0,
                 )
-                workflow.conflicts = (
-                    conflicts.intersection(workflow_refs).count()
-                    if workflow.link_conflict_resolution
-                    else None
+            )
+            # needs_tagging = < 2 unresolved user reviews; conflicts = > 1 unresolved user reviews
+            needs_tagging = Q(user_tag_count__lt=2)
+            conflicts = Q(user_tag_count__gt=1)
+            aggregates.update(
+                needs_tagging=Count("id", filter=needs_tagging & untagged),
+                conflicts=Count("id", filter=conflicts),
+            )
+        for workflow in workflows:
+            in_workflow = Q(pk__in=self.get_qs(assessment).in_workflow(workflow).values("pk"))
+            if not conflict_resolution:
+                aggregates[f"needs_tagging_{workflow.id}"] = Count("id", filter=in_workflow)
+                continue
+            if workflow.link_tagging:
+                aggregates[f"needs_tagging_{workflow.id}"] = Count(
+                    "id", filter=needs_tagging & in_workflow
                 )
+            if workflow.link_conflict_resolution:
+                aggregates[f"conflicts_{workflow.id}"] = Count("id", filter=conflicts & in_workflow)
+        counts = refs.aggregate(**aggregates)
+
+        total = counts["total"]
+        overview = {
+            "total_references": total,
+            "total_tagged": total - counts["total_untagged"],
+            "total_untagged": counts["total_untagged"],
+            "total_searched": counts["total_searched"],
+            "total_imported": total - counts["total_searched"],
+        }
+        if conflict_resolution:
             # needs_tagging = 0 consensus tags and < 2 unresolved user reviews
             overview.update(
-                needs_tagging=needs_tagging.filter(tags_count=0).count(),
-                conflicts=conflicts.count(),
-                total_reviews=user_refs.count(),
-                total_users=user_refs.distinct("user_id").count(),
+                needs_tagging=counts["needs_tagging"],
+                conflicts=counts["conflicts"],
+                **UserReferenceTag.objects.filter(reference__in=self.get_qs(assessment)).aggregate(
+                    total_reviews=Count("id"), total_users=Count("user", distinct=True)
+                ),
             )
-        else:
-            for workflow in workflows:
-                workflow.needs_tagging = refs.in_workflow(workflow).count()
-        return overview, list(workflows)
+        return {
+            "overview": overview,
+            "workflows": {
+                workflow.id: (
+                    counts.get(f"needs_tagging_{workflow.id}"),
+                    counts.get(f"conflicts_{workflow.id}"),
+                )
+                for workflow in workflows
+            },
+        }
 
-    def get_pubmed_references(self, search, identifiers):
+    def get_pubmed_references(self, search, identifiers, batch_size: int = 5000):
         """
         Given a list of Identifiers, return a list of references associated
         with each of these identifiers.
-        """
-        # Get references which already existing and are tied to this identifier
-        # but are not associated with the current search and save this search
-        # as well to this Reference.
-        refs = (
-            self.get_qs(search.assessment)
-            .filter(identifiers__in=identifiers)
-            .exclude(searches=search)
-        )
-        self.build_ref_search_m2m(refs, search)
-
-        # Get any references already are associated with these identifiers
-        refs = list(self.get_qs(search.assessment).filter(identifiers__in=identifiers))
-
-        # Only process identifiers which have no reference
-        if refs:
-            identifiers = identifiers.exclude(references__in=refs)
 
+        New references are bulk created with their identifier and associated DOI identifier;
+        query count is constant per batch.
+        """
+        refs, identifiers = self._get_new_identifiers(search, identifiers)
         doi_map = identifiers.associated_doi(create=True)
-
-        # don't bulkcreate because we need the pks
+        creates = []
         for identifier in identifiers:
-            ref = identifier.create_reference(search.assessment)
-            ref.save()
-            ref.searches.add(search)
-            ref.identifiers.add(identifier)
+            ident_ids = [identifier.id]
             if doi_identifier := doi_map.get(identifier):
-                ref.identifiers.add(doi_identifier)
-            refs.append(ref)
-
+                ident_ids.append(doi_identifier.id)
+            creates.append((identifier.create_reference(search.assessment), ident_ids))
+        self.bulk_create_references(search, creates, batch_size=batch_size)
+        refs.extend(ref for ref, _ in creates)
         return refs
 
     def get_references_ready_for_import(self, assessment):
@@ -965,8 +1113,7 @@ class ReferenceManager(BaseManager):
         root_inclusion = assessment.literature_settings.extraction_tag
         inclusion_tags = []
         if root_inclusion:
-            inclusion_tags = list(root_inclusion.get_descendants().values_list("pk", flat=True))
-            inclusion_tags.append(root_inclusion.pk)
+            inclusion_tags = root_inclusion.get_descendant_ids(assessment.id)
             return (
                 self.get_qs(assessment)
                 .filter(referencetags__tag_id__in=inclusion_tags)
@@ -977,38 +1124,98 @@ class ReferenceManager(BaseManager):
         else:
             return self.none()
 
-    def update_from_ris_identifiers(self, search, identifiers):
-        """
-        Create or update Reference from list of lists of identifiers.
-        Expensive; each reference requires 4N queries.
+    def update_from_ris_identifiers(self, search, identifiers: list[list], batch_size: int = 5000):
+        """Create or update references from identifiers for each reference in an RIS file.
+
+        An existing reference in the assessment with any of the identifiers is updated;
+        otherwise a new reference is created. Each batch requires a fixed number of queries to
+        find existing references, bulk create and update references, and bulk create
+        reference-identifier and reference-search relationships.
+
+        Args:
+            search (Search): the search to associate with each reference
+            identifiers (list[list[Identifiers]]): identifiers from `get_from_ris`; the first
+                identifier for each reference is from the RIS file and provides its content
+            batch_size (int, default 5000): number of references per batch
         """
         assessment_id = search.assessment_id
-        for idents in identifiers:
-            # check if existing reference is found
-            ref = self.get_qs(assessment_id).filter(identifiers__in=idents).first()
-
-            # find ref if exists and update content
-            # first identifier is from RIS file; use this content
-            content = json.loads(idents[0].content)
-            data = dict(
-                title=content["title"],
-                authors_short=content["authors_short"],
-                authors=", ".join(content["authors"]),
-                year=content["year"],
-                journal=content["citation"],
-                abstract=content["abstract"],
+        RefIdM2M = self.model.identifiers.through
+        RefSearchM2M = self.model.searches.through
+        fields = ["title", "authors_short", "authors", "year", "journal", "abstract"]
+        refs_by_ident = {}
+        n_created = 0
+        n_linked = 0
+        updated_ids = set()
+        for batch in batched(identifiers, batch_size):
+            # find existing references for identifiers not already resolved
+            ident_ids = {ident.id for idents in batch for ident in idents} - refs_by_ident.keys()
+            links = list(
+                RefIdM2M.objects.filter(
+                    reference__assessment_id=assessment_id, identifiers_id__in=ident_ids
+                )
+                .order_by("reference_id")
+                .values_list("identifiers_id", "reference_id")
             )
-            if ref:
-                for key, value in data.items():
-                    setattr(ref, key, value)
-                ref.save()
-            else:
-                data["assessment_id"] = assessment_id
-                ref = self.create(**data)
+            existing = self.in_bulk({ref_id for _, ref_id in links})
+            for ident_id, ref_id in links:
+                refs_by_ident.setdefault(ident_id, existing[ref_id])
+
+            creates, updates, pairs = [], {}, []
+            for idents in batch:
+                ref = next((refs_by_ident[i.id] for i in idents if i.id in refs_by_ident), None)
+                if ref is None:
+                    ref = self.model(assessment_id=assessment_id)
+                    creates.append(ref)
+                elif ref.id is not None:
+                    updates[ref.id] = ref
+
+                # first identifier is from RIS file; use this content
+                content = json.loads(idents[0].content)
+                ref.title = content["title"]
+                ref.authors_short = content["authors_short"]
+                ref.authors = ", ".join(content["authors"])
+                ref.year = content["year"]
+                ref.journal = content["citation"]
+                ref.abstract = content["abstract"]
+
+                for ident in idents:
+                    refs_by_ident.setdefault(ident.id, ref)
+                pairs.append((ref, idents))
+
+            updatetime = now()
+            for ref in updates.values():
+                ref.last_updated = updatetime
+            self.bulk_update(updates.values(), [*fields, "last_updated"])
+            self.bulk_create(creates)
+            n_created += len(creates)
+            updated_ids.update(updates.keys())
 
             # add all identifiers and searches
-            ref.identifiers.add(*idents)
-            ref.searches.add(search)
+            ref_idents = {(ref.id, ident.id) for ref, idents in pairs for ident in idents}
+            RefIdM2M.objects.bulk_create(
+                [
+                    RefIdM2M(reference_id=ref_id, identifiers_id=ident_id)
+                    for ref_id, ident_id in ref_idents
+                ],
+                ignore_conflicts=True,
+            )
+            RefSearchM2M.objects.bulk_create(
+                [
+                    RefSearchM2M(reference_id=ref_id, search_id=search.id)
+                    for ref_id in {ref.id for ref, _ in pairs}
+                ],
+                ignore_conflicts=True,
+            )
+            n_linked += len(pairs)
+
+        # bulk operations do not send save signals
+        if updated_ids:
+            apps.get_model("study", "Study").delete_caches(list(updated_ids))
+        if n_created > 0:
+            apps.get_model("assessment", "Assessment").clear_data_presence_cache(assessment_id)
+        if n_linked > 0:
+            # search links change workflow counts, even if no references are created
+            self.model.clear_overview_cache(assessment_id)
 
     def identifiers_dataframe(self, qs: QuerySet) -> pd.DataFrame:
         """
@@ -1106,9 +1313,9 @@ class ReferenceManager(BaseManager):
 
         tree = ReferenceFilterTag.get_all_tags(assessment_id)
         tag_qs = ReferenceTags.objects.assessment_qs(assessment_id)
-        node_dict = refmltags.build_tree_node_dict(tree)
+        tag_tree = refmltags.build_tag_tree(tree)
         df2 = (
-            refmltags.create_df(tag_qs, node_dict)
+            refmltags.create_df(tag_qs, tag_tree)
             .rename(columns={"ref_id": "reference id"})
             .set_index("reference id")
         )
@@ -13,6 +13,7 @@ from django.apps import apps
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.indexes import GinIndex
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import models, transaction
 from django.forms import MultipleChoiceField
@@ -30,7 +31,7 @@ from ...services.nih import pubmed
 from ...services.utils import ris
 from ...services.utils.doi import get_doi_from_identifier, try_get_doi
 from ..assessment.models import Log
-from ..common.helper import SerializerHelper, tryParseInt
+from ..common.helper import SerializerHelper, assessment_cache_key, tryParseInt
 from ..common.models import (
     AssessmentRootMixin,
     CustomURLField,
@@ -323,33 +324,21 @@ class Search(models.Model):
         else:
             raise ValueError(f"Source type cannot be imported: {self.source}")
 
-    def create_new_references(self, results):
+    def create_new_references(self, results, batch_size: int = 5000):
         # Create assessment-specific references for each value which return
         # result which was added, based on the new results query values, where
         # results is a dictionary with a field "added", which is a list of the
         # primary keys of identifiers which need a new reference creation.
 
-        RefSearchM2M = Reference.searches.through
-        RefIdM2M = Reference.identifiers.through
-
         # For the cases where the current search found a new identifier which
         # already has an assessment-specific Reference object associated with
         # it, just associate the current reference with this search.
         added_str = [str(id) for id in results["added"]]
-        ref_ids = (
-            Reference.objects.filter(
-                assessment=self.assessment, identifiers__unique_id__in=added_str
-            )
-            .exclude(searches=self)
-            .values_list("pk", flat=True)
-        )
-        ids_count = ref_ids.count()
-
-        if ids_count > 0:
-            logger.debug("Starting bulk creation of existing search-through values")
-            ref_searches = [RefSearchM2M(reference_id=ref, search_id=self.pk) for ref in ref_ids]
-            RefSearchM2M.objects.bulk_create(ref_searches)
-            logger.debug(f"Completed bulk creation of {len(ref_searches)} search-through values")
+        refs = Reference.objects.filter(
+            assessment=self.assessment, identifiers__unique_id__in=added_str
+        ).exclude(searches=self)
+        n_existing = Reference.objects.add_search(refs, self)
+        logger.debug(f"Associated {n_existing} existing references with search")
 
         # For the cases where the search resulted in new ids which may or may
         # not already be imported as a reference for this assessment, find the
@@ -359,38 +348,15 @@ class Search(models.Model):
             .exclude(references__in=Reference.objects.get_qs(self.assessment))
             .order_by("pk")
         )
-        ids_count = ids.count()
-
-        if ids_count > 0:
-            block_id = timezone.now()
-
-            # create list of references for each identifier
-            refs = [i.create_reference(self.assessment, block_id) for i in ids]
-            id_pks = [i.pk for i in ids]
-
-            logger.debug(f"Starting  bulk creation of {len(refs)} references")
-            Reference.objects.bulk_create(refs)
-            logger.debug(f"Completed bulk creation of {len(refs)} references")
 
-            # re-query to get the objects back with PKs
-            refs = Reference.objects.filter(assessment=self.assessment, block_id=block_id).order_by(
-                "pk"
-            )
-
-            # associate identifiers with each
-            ref_searches = []
-            ref_ids = []
-            logger.debug(f"Starting  bulk creation of {refs.count()} reference-through values")
-            for i, ref in enumerate(refs):
-                ref_searches.append(RefSearchM2M(reference_id=ref.pk, search_id=self.pk))
-                ref_ids.append(RefIdM2M(reference_id=ref.pk, identifiers_id=id_pks[i]))
-            RefSearchM2M.objects.bulk_create(ref_searches)
-            RefIdM2M.objects.bulk_create(ref_ids)
-            logger.debug(f"Completed bulk creation of {refs.count()} reference-through values")
-
-            # finally, remove temporary identifier used for re-query after bulk_create
-            logger.debug("Removing block-id from created references")
-            refs.update(block_id=None)
+        # create references for each identifier with returned primary keys, and
+        # associate each with this search and its identifier in batches
+        refs = (
+            (ident.create_reference(self.assessment), [ident.pk])
+            for ident in ids.iterator(chunk_size=batch_size)
+        )
+        n_created = Reference.objects.bulk_create_references(self, refs, batch_size=batch_size)
+        logger.debug(f"Completed bulk creation of {n_created} references")
 
     def delete_old_references(self, results):
         """Conservatively delete results which were removed in the most recent search.
@@ -861,6 +827,16 @@ class Reference(models.Model):
             )
         ]
 
+    @classmethod
+    def get_overview_cache_key(cls, assessment_id: int) -> str:
+        return assessment_cache_key(assessment_id, "lit-overview")
+
+    @classmethod
+    def clear_overview_cache(cls, assessment_id: int):
+        # clear after commit, so a read before commit can't re-cache a stale overview
+        key = cls.get_overview_cache_key(assessment_id)
+        transaction.on_commit(lambda: cache.delete(key))
+
     @transaction.atomic
     def merge_tags(self, user):
         """Merge all unresolved user tags and apply to the reference.
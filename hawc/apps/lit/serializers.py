@@ -252,6 +252,7 @@ class BulkReferenceTagSerializer(serializers.Serializer):
             qs = models.ReferenceTags.objects.assessment_qs(assessment_id)
             logger.info(f"Deleting {qs.count()} reference tags for {assessment_id}")
             qs.delete()
+            models.Reference.clear_overview_cache(assessment_id)
 
         if operation == "remove":
             query = Q()
@@ -260,6 +261,7 @@ class BulkReferenceTagSerializer(serializers.Serializer):
             qs = models.ReferenceTags.objects.assessment_qs(assessment_id).filter(query)
             logger.info(f"Deleting {qs.count()} reference tags for {assessment_id}")
             qs.delete()
+            models.Reference.clear_overview_cache(assessment_id)
             return
 
         new_tags = [
@@ -272,6 +274,7 @@ class BulkReferenceTagSerializer(serializers.Serializer):
             logger.info(f"Creating {len(new_tags)} reference tags for {assessment_id}")
             models.ReferenceTags.objects.bulk_create(new_tags)
             models.Reference.delete_cache(assessment_id)
+            models.Reference.clear_overview_cache(assessment_id)
 
 
 class ReferenceSerializer(serializers.ModelSerializer):
@@ -1,5 +1,5 @@
 from django.apps import apps
-from django.db.models.signals import post_save, pre_delete
+from django.db.models.signals import m2m_changed, post_save, pre_delete
 from django.dispatch import receiver
 
 from . import models
@@ -21,3 +21,28 @@ def invalidate_tag_cache(sender, instance, **kwargs):
         instance.clear_cache(assessment_id)
     except IndexError:
         pass
+
+
+@receiver(post_save, sender=models.Reference)
+@receiver(pre_delete, sender=models.Reference)
+@receiver(post_save, sender=models.UserReferenceTag)
+@receiver(pre_delete, sender=models.UserReferenceTag)
+@receiver(post_save, sender=models.Workflow)
+@receiver(pre_delete, sender=models.Workflow)
+@receiver(m2m_changed, sender=models.Workflow.admission_source.through)
+@receiver(m2m_changed, sender=models.Workflow.removal_source.through)
+@receiver(post_save, sender=models.LiteratureAssessment)
+@receiver(pre_delete, sender=models.Search)
+def invalidate_overview_cache(sender, instance, **kwargs):
+    models.Reference.clear_overview_cache(instance.assessment_id)
+
+
+@receiver(pre_delete, sender=models.ReferenceFilterTag)
+def invalidate_tag_overview_cache(sender, instance, **kwargs):
+    # deleting a tag removes it from references
+    try:
+        # may be root-node
+        assessment_id = instance.get_assessment_id()
+    except IndexError:
+        return
+    models.Reference.clear_overview_cache(assessment_id)
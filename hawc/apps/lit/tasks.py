@@ -6,9 +6,8 @@ from django.apps import apps
 from django.db import transaction
 from django.db.models import Model
 
-from ...services.epa import hero
-from ...services.nih import pubmed
 from . import constants
+from .cache import fetch_hero_content, fetch_pubmed_content
 
 logger = get_task_logger(__name__)
 
@@ -19,8 +18,7 @@ def update_hero_content(ids: list[int]):
 
     Identifiers = apps.get_model("lit", "identifiers")
 
-    fetcher = hero.HEROFetch(sorted(ids))
-    contents = fetcher.get_content()
+    contents = fetch_hero_content(sorted(ids), refresh=True)
     with transaction.atomic():
         for d in contents.get("success"):
             content = json.dumps(d)
@@ -120,8 +118,7 @@ def replace_hero_ids(replace: list[list[int]]):
 def update_pubmed_content(ids: list[int]):
     """Fetch the latest data from Pubmed and update identifier object."""
     Identifiers = apps.get_model("lit", "identifiers")
-    fetcher = pubmed.PubMedFetch(ids)
-    contents = fetcher.get_content()
+    contents = fetch_pubmed_content(ids, refresh=True)
     for d in contents:
         content = json.dumps(d)
         Identifiers.objects.filter(
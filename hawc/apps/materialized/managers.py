@@ -1,3 +1,4 @@
+from collections import defaultdict
 from itertools import chain
 from typing import NamedTuple
 
@@ -18,23 +19,36 @@ class FinalRiskOfBiasScoreQuerySet(models.QuerySet):
     @property
     def score_values(self):
         if not hasattr(self, "_score_values"):
-            self._score_values = self.values()
+            self._score_values = self.order_by("score_id", "id").values()
         return self._score_values
 
+    def _build_indexes(self):
+        # index scores by study and by override object, preserving score order; built once
+        by_study = defaultdict(list)
+        by_override = defaultdict(list)
+        for score in self.score_values:
+            by_study[score["study_id"]].append(score)
+            if score["content_type_id"] is not None:
+                by_override[score["content_type_id"], score["object_id"]].append(score)
+        self._scores_by_study = dict(by_study)
+        self._scores_by_override = dict(by_override)
+
     def _study_scores(self, study_id: int) -> list[dict]:
-        return [score for score in self.score_values if study_id == score["study_id"]]
+        if not hasattr(self, "_scores_by_study"):
+            self._build_indexes()
+        return self._scores_by_study.get(study_id, [])
 
     def _default_tuples(self, scores: list[dict]) -> list[MetricScore]:
         return [MetricScore(score["metric_id"], score) for score in scores if score["is_default"]]
 
-    def _override_tuples(
-        self, scores: list[dict], override_model, object_id: int
-    ) -> list[MetricScore]:
+    def _override_tuples(self, study_id: int, override_model, object_id: int) -> list[MetricScore]:
+        if not hasattr(self, "_scores_by_override"):
+            self._build_indexes()
         content_type_id = ContentType.objects.get_for_model(override_model).id
         return [
             MetricScore(score["metric_id"], score)
-            for score in scores
-            if score["content_type_id"] == content_type_id and object_id == score["object_id"]
+            for score in self._scores_by_override.get((content_type_id, object_id), [])
+            if score["study_id"] == study_id
         ]
 
     def study_scores(self, study_ids: list[int]) -> dict[tuple[int, int], dict]:
@@ -46,10 +60,11 @@ class FinalRiskOfBiasScoreQuerySet(models.QuerySet):
         Returns:
             dict[tuple[int, int], dict]: Keys are equal to (study_id, metric_id)
         """
+        study_ids = set(study_ids)
         return {
             (score["study_id"], score["metric_id"]): score
             for score in self.score_values
-            if score["study_id"] in study_ids and score["is_default"]
+            if score["is_default"] and score["study_id"] in study_ids
         }
 
     def endpoint_scores(self, endpoint_ids: list[int]) -> dict[tuple[int, int], dict]:
@@ -67,8 +82,8 @@ class FinalRiskOfBiasScoreQuerySet(models.QuerySet):
             study_scores = self._study_scores(study_id)
             for metric_id, score in chain(
                 self._default_tuples(study_scores),
-                self._override_tuples(study_scores, AnimalGroup, endpoint.animal_group_id),
-                self._override_tuples(study_scores, Endpoint, endpoint.id),
+                self._override_tuples(study_id, AnimalGroup, endpoint.animal_group_id),
+                self._override_tuples(study_id, Endpoint, endpoint.id),
             ):
                 endpoint_scores[endpoint.id, metric_id] = score
 
@@ -86,7 +101,7 @@ class FinalRiskOfBiasScoreQuerySet(models.QuerySet):
             study_scores = self._study_scores(study_id)
             for metric_id, score in chain(
                 self._default_tuples(study_scores),
-                self._override_tuples(study_scores, Outcome, outcome.id),
+                self._override_tuples(study_id, Outcome, outcome.id),
             ):
                 outcome_scores[outcome.id, metric_id] = score
 
@@ -108,9 +123,9 @@ class FinalRiskOfBiasScoreQuerySet(models.QuerySet):
             study_scores = self._study_scores(study_id)
             for metric_id, score in chain(
                 self._default_tuples(study_scores),
-                self._override_tuples(study_scores, Exposure, result.comparison_set.exposure_id),
-                self._override_tuples(study_scores, Outcome, result.outcome_id),
-                self._override_tuples(study_scores, Result, result.id),
+                self._override_tuples(study_id, Exposure, result.comparison_set.exposure_id),
+                self._override_tuples(study_id, Outcome, result.outcome_id),
+                self._override_tuples(study_id, Result, result.id),
             ):
                 result_scores[result.id, metric_id] = score
 
@@ -0,0 +1,27 @@
+from django.db import migrations
+
+from ..sql import FinalRiskOfBiasScore
+
+# databases created before 0001 built a table have a materialized view
+DROP_VIEW = """
+    DO $$
+    BEGIN
+        IF EXISTS (
+            SELECT FROM pg_matviews WHERE matviewname = 'materialized_finalriskofbiasscore'
+        ) THEN
+            DROP MATERIALIZED VIEW materialized_finalriskofbiasscore;
+        END IF;
+    END $$;
+    """
+
+
+class Migration(migrations.Migration):
+    """Replace the materialized view with a table which can be refreshed incrementally."""
+
+    dependencies = [
+        ("materialized", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunSQL([DROP_VIEW, FinalRiskOfBiasScore.create], migrations.RunSQL.noop),
+    ]
@@ -1,19 +1,37 @@
 import json
+import logging
+import threading
+import time
+from collections.abc import Iterable
 
 from django.apps import apps
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
-from django.db import connection, models
+from django.db import connection, models, transaction
 
 from ..riskofbias.constants import NA_SCORES, SCORE_CHOICES_MAP
 from . import managers, sql
 
+logger = logging.getLogger(__name__)
 
-def refresh_all_mvs(force: bool = False):
+# ids pending an incremental refresh, by thread; drained after each transaction commits
+_pending = threading.local()
+
+
+def refresh_all_mvs(force: bool = False, assessment_id: int | None = None):
+    """Refresh all materialized views.
+
+    Args:
+        force (bool, default False): refresh even if a refresh was not flagged as needed
+        assessment_id (int, optional): if specified, only refresh rows for this assessment
+    """
     mvs = apps.get_app_config("materialized").get_models()
     for mv in mvs:
-        mv.refresh(force)
+        if assessment_id:
+            mv.refresh_partial(assessment=[assessment_id])
+        else:
+            mv.refresh(force)
 
 
 class MaterializedViewModel(models.Model):
@@ -22,8 +40,14 @@ class MaterializedViewModel(models.Model):
     Django does not manage view creation automatically; that is handled by custom SQL queries in migrations.
     And since these are views, any foreign keys on these models are not "true" foreign keys, so on_delete
     should be kept as DO_NOTHING to prevent Django from enforcing foreign key constraints.
+
+    Views are stored as regular tables which are maintained incrementally; rows for a subset of
+    the data can be recomputed using the filters in `refresh_filters`, and a full refresh is
+    available as a fallback.
     """
 
+    refresh_filters: dict[str, sql.RefreshFilter] = {}
+
     class Meta:
         abstract = True
         managed = False
@@ -47,15 +71,89 @@ class MaterializedViewModel(models.Model):
         return bool(cache.get(f"refresh-{cls._meta.db_table}", False))
 
     @classmethod
-    def refresh(cls, force: bool = False):
+    def _recompute(cls, filter: sql.RefreshFilter | None = None, ids: list[int] | None = None):
+        """Delete and re-insert rows matching a filter (or all rows); return refresh metrics."""
+        delete_filter = filter.delete if filter else ""
+        insert_filter = filter.insert if filter else ""
+        params = [ids] if filter else None
+        start = time.perf_counter()
+        with transaction.atomic(), connection.cursor() as cursor:
+            # serialize refreshes; concurrent delete and insert would otherwise duplicate rows
+            cursor.execute(f"LOCK TABLE {cls._meta.db_table} IN SHARE ROW EXCLUSIVE MODE")
+            cursor.execute(cls.sql.delete.format(filter=delete_filter), params)
+            deleted = cursor.rowcount
+            cursor.execute(cls.sql.insert.format(filter=insert_filter), params)
+            inserted = cursor.rowcount
+        metrics = {
+            "duration": round(time.perf_counter() - start, 4),
+            "deleted": deleted,
+            "inserted": inserted,
+            "delta": inserted - deleted,
+        }
+        return metrics
+
+    @classmethod
+    def refresh(cls, force: bool = False) -> dict | None:
+        """Recompute all rows, if forced or a refresh was flagged as needed."""
         if force or cls.should_refresh():
-            with connection.cursor() as cursor:
-                cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {cls._meta.db_table}")
+            metrics = cls._recompute()
             cls.set_refresh_flag(False)
+            logger.info(f"Full refresh of {cls._meta.db_table}: {metrics}")
+            return metrics
+
+    @classmethod
+    def refresh_partial(cls, **ids: Iterable[int]) -> list[dict]:
+        """Recompute rows for a subset of data, specified by filter name and ids.
+
+        For example, `refresh_partial(riskofbias=[1, 2])` only recomputes rows for those ids.
+        Changes which bypass model signals, such as `QuerySet.update` or `bulk_create`, must
+        call `mark_dirty` explicitly.
+        If an incremental refresh fails, a full refresh is flagged as needed.
+        """
+        results = []
+        try:
+            for name, values in ids.items():
+                if values := sorted(set(values)):
+                    metrics = cls._recompute(cls.refresh_filters[name], values)
+                    logger.info(f"Refresh of {cls._meta.db_table} by {name} {values}: {metrics}")
+                    results.append(metrics)
+        except Exception:
+            logger.exception(f"Incremental refresh of {cls._meta.db_table} failed")
+            cls.set_refresh_flag(True)
+        return results
+
+    @classmethod
+    def mark_dirty(cls, **ids: Iterable[int]):
+        """Queue ids for an incremental refresh after the current transaction commits.
+
+        Ids are accumulated per thread so that many changes in a single transaction are
+        refreshed together, by a single callback.
+        """
+        pending = getattr(_pending, "ids", None)
+        if pending is None:
+            pending = _pending.ids = {}
+        for name, values in ids.items():
+            pending.setdefault((cls, name), set()).update(values)
+        if not any(func is refresh_pending for _, func, *_ in connection.run_on_commit):
+            transaction.on_commit(refresh_pending)
+
+
+def refresh_pending():
+    """Refresh all rows queued for an incremental refresh in this thread."""
+    pending = getattr(_pending, "ids", None)
+    if not pending:
+        return
+    _pending.ids = {}
+    by_model: dict[type[MaterializedViewModel], dict[str, set[int]]] = {}
+    for (Model, name), values in pending.items():
+        by_model.setdefault(Model, {})[name] = values
+    for Model, ids in by_model.items():
+        Model.refresh_partial(**ids)
 
 
 class FinalRiskOfBiasScore(MaterializedViewModel):
     sql = sql.FinalRiskOfBiasScore
+    refresh_filters = sql.FinalRiskOfBiasScoreFilters
 
     objects = managers.FinalRiskOfBiasScoreManager()
 
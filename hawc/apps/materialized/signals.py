@@ -1,13 +1,23 @@
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from ..riskofbias.models import RiskOfBiasScore, RiskOfBiasScoreOverrideObject
+from ..riskofbias.models import RiskOfBias, RiskOfBiasScore, RiskOfBiasScoreOverrideObject
 from . import models
 
 
+@receiver(post_save, sender=RiskOfBias)
+@receiver(post_delete, sender=RiskOfBias)
+def set_riskofbias_flag(instance, **kwargs):
+    models.FinalRiskOfBiasScore.mark_dirty(riskofbias=[instance.id])
+
+
 @receiver(post_save, sender=RiskOfBiasScore)
 @receiver(post_delete, sender=RiskOfBiasScore)
+def set_score_flag(instance, **kwargs):
+    models.FinalRiskOfBiasScore.mark_dirty(riskofbias=[instance.riskofbias_id])
+
+
 @receiver(post_save, sender=RiskOfBiasScoreOverrideObject)
 @receiver(post_delete, sender=RiskOfBiasScoreOverrideObject)
-def set_score_flag(**kwargs):
-    models.FinalRiskOfBiasScore.set_refresh_flag(True)
+def set_override_flag(instance, **kwargs):
+    models.FinalRiskOfBiasScore.mark_dirty(score=[instance.score_id])
@@ -4,13 +4,19 @@ from typing import NamedTuple
 class SQL(NamedTuple):
     create: str
     drop: str
+    delete: str
+    insert: str
 
 
-FinalRiskOfBiasScore = SQL(
-    """
-    CREATE MATERIALIZED VIEW IF NOT EXISTS materialized_finalriskofbiasscore AS
+class RefreshFilter(NamedTuple):
+    """SQL filters used to select a subset of rows for an incremental refresh."""
+
+    delete: str
+    insert: str
+
+
+_FINAL_ROB_SCORE_SELECT = """
     SELECT
-        ROW_NUMBER() OVER (ORDER BY score_id, ovr.content_type_id, ovr.object_id) as id,
         scr.id as "score_id",
         scr.label as "score_label",
         scr.notes as "score_notes",
@@ -27,14 +33,66 @@ FinalRiskOfBiasScore = SQL(
     ON scr.riskofbias_id = rob.id
     LEFT JOIN riskofbias_riskofbiasscoreoverrideobject ovr
     ON scr.id = ovr.score_id
-    WHERE rob.final AND rob.active
-    ORDER BY scr.id, ovr.id;
+    WHERE rob.final AND rob.active {filter}
+    ORDER BY scr.id, ovr.id
+"""
 
-    CREATE UNIQUE INDEX ON materialized_finalriskofbiasscore (id);
-    CREATE INDEX ON materialized_finalriskofbiasscore (score_id);
-    CREATE INDEX ON materialized_finalriskofbiasscore (study_id);
+_FINAL_ROB_SCORE_INSERT = f"""
+    INSERT INTO materialized_finalriskofbiasscore (
+        score_id, score_label, score_notes, score_score, bias_direction, is_default,
+        study_id, metric_id, riskofbias_id, content_type_id, object_id
+    )
+    {_FINAL_ROB_SCORE_SELECT}
+"""
+
+FinalRiskOfBiasScore = SQL(
+    f"""
+    CREATE TABLE IF NOT EXISTS materialized_finalriskofbiasscore (
+        id serial PRIMARY KEY,
+        score_id integer NOT NULL,
+        score_label varchar(128) NOT NULL,
+        score_notes text NOT NULL,
+        score_score smallint NOT NULL,
+        bias_direction smallint NOT NULL,
+        is_default boolean NOT NULL,
+        study_id integer NOT NULL,
+        metric_id integer NOT NULL,
+        riskofbias_id integer NOT NULL,
+        content_type_id integer NULL,
+        object_id integer NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS materialized_finalriskofbiasscore_score_id
+        ON materialized_finalriskofbiasscore (score_id);
+    CREATE INDEX IF NOT EXISTS materialized_finalriskofbiasscore_study_id
+        ON materialized_finalriskofbiasscore (study_id);
+    CREATE INDEX IF NOT EXISTS materialized_finalriskofbiasscore_riskofbias_id
+        ON materialized_finalriskofbiasscore (riskofbias_id);
+
+    {_FINAL_ROB_SCORE_INSERT.format(filter="AND NOT EXISTS (SELECT FROM materialized_finalriskofbiasscore)")};
     """,
     """
-    DROP MATERIALIZED VIEW IF EXISTS materialized_finalriskofbiasscore;
+    DROP TABLE IF EXISTS materialized_finalriskofbiasscore;
     """,
+    "DELETE FROM materialized_finalriskofbiasscore WHERE TRUE {filter}",
+    _FINAL_ROB_SCORE_INSERT,
 )
+
+FinalRiskOfBiasScoreFilters = {
+    "assessment": RefreshFilter(
+        "AND study_id IN (SELECT reference_ptr_id FROM study_study WHERE assessment_id = ANY(%s))",
+        "AND rob.study_id IN (SELECT reference_ptr_id FROM study_study WHERE assessment_id = ANY(%s))",
+    ),
+    "study": RefreshFilter(
+        "AND study_id = ANY(%s)",
+        "AND rob.study_id = ANY(%s)",
+    ),
+    "riskofbias": RefreshFilter(
+        "AND riskofbias_id = ANY(%s)",
+        "AND scr.riskofbias_id = ANY(%s)",
+    ),
+    "score": RefreshFilter(
+        "AND score_id = ANY(%s)",
+        "AND scr.id = ANY(%s)",
+    ),
+}
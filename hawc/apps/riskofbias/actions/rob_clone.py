@@ -6,6 +6,7 @@ import pydantic
 
 from hawc.apps.assessment.models import Assessment, Log
 from hawc.apps.common.actions import BaseApiAction
+from hawc.apps.materialized.models import FinalRiskOfBiasScore
 from hawc.apps.myuser.models import HAWCUser
 from hawc.apps.riskofbias.models import RiskOfBias, RiskOfBiasMetric, RiskOfBiasScore
 from hawc.apps.study.models import Study
@@ -180,6 +181,9 @@ class BulkRobCopyAction(BaseApiAction):
         dst_scores = RiskOfBiasScore.objects.bulk_create(new_scores)
         dst_score_ids = [obj.pk for obj in dst_scores]
 
+        # bulk changes bypass signals; refresh final scores for destination studies
+        FinalRiskOfBiasScore.mark_dirty(study=dst_study_ids)
+
         # add to mapping
         src_to_dst["score"] = {
             src: dst for src, dst in zip(src_score_ids, dst_score_ids, strict=True)
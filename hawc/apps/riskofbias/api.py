@@ -21,7 +21,7 @@ from ..assessment.models import Assessment, TimeSpentEditing
 from ..common.api import DisabledPagination
 from ..common.api.utils import get_published_only
 from ..common.helper import tryParseInt
-from ..common.renderers import PandasRenderers
+from ..common.renderers import PandasRenderers, streaming_response
 from ..common.serializers import ExportQuerySerializer, UnusedSerializer
 from ..common.validators import validate_exact_ids
 from ..mgmt.models import Task
@@ -62,8 +62,8 @@ class RiskOfBiasAssessmentViewSet(BaseAssessmentViewSet):
             .order_by("riskofbias__study__short_citation", "riskofbias_id", "id")
         )
         filename = f"{self.assessment}-{rob_name}"
-        exporter = exports.RiskOfBiasExporter.flat_export(qs, filename)
-        return Response(exporter)
+        export = exports.RiskOfBiasExporter.streaming_export(qs, filename)
+        return streaming_response(request, export)
 
     @action(
         detail=True,
@@ -89,8 +89,8 @@ class RiskOfBiasAssessmentViewSet(BaseAssessmentViewSet):
             .order_by("riskofbias__study__short_citation", "riskofbias_id", "id")
         )
         filename = f"{self.assessment}-{rob_name}-complete"
-        exporter = exports.RiskOfBiasCompleteExporter.flat_export(qs, filename)
-        return Response(exporter)
+        export = exports.RiskOfBiasCompleteExporter.streaming_export(qs, filename)
+        return streaming_response(request, export)
 
     @action(detail=False, methods=("post",), permission_classes=(IsAuthenticated,))
     def bulk_rob_copy(self, request):
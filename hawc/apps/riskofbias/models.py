@@ -15,6 +15,7 @@ from reversion import revisions as reversion
 
 from ..assessment.models import Assessment
 from ..common.helper import HAWCDjangoJSONEncoder, SerializerHelper
+from ..materialized.models import FinalRiskOfBiasScore
 from ..myuser.models import HAWCUser
 from ..study.models import Study
 from . import constants, managers
@@ -153,6 +154,9 @@ class RiskOfBiasMetric(models.Model):
         if create_ids:
             scores = [self.build_score(expected[rob_id], True) for rob_id in create_ids]
             RiskOfBiasScore.objects.bulk_create(scores)
+            FinalRiskOfBiasScore.mark_dirty(
+                study={expected[rob_id].study_id for rob_id in create_ids}
+            )
 
         delete_ids = actual_ids - expected_ids
         if delete_ids:
@@ -180,6 +184,7 @@ class RiskOfBiasMetric(models.Model):
                 for metric_id, rob_id in create_ids
             ]
             RiskOfBiasScore.objects.bulk_create(scores)
+            FinalRiskOfBiasScore.mark_dirty(study=[study.id])
 
         delete_ids = actual_ids - expected_ids
         if delete_ids:
@@ -237,6 +242,7 @@ class RiskOfBias(models.Model):
             for metric in RiskOfBiasMetric.objects.get_required_metrics(study)
         ]
         RiskOfBiasScore.objects.bulk_create(scores)
+        FinalRiskOfBiasScore.mark_dirty(study=[study.id])
 
     def activate(self):
         self.active = True
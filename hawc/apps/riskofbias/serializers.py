@@ -6,6 +6,7 @@ from rest_framework import serializers
 from ..common import validators
 from ..common.clean import sanitize_html
 from ..common.helper import SerializerHelper, tryParseInt
+from ..materialized.models import FinalRiskOfBiasScore
 from ..myuser.models import HAWCUser
 from ..myuser.serializers import HAWCUserSerializer
 from ..study.models import Study
@@ -400,6 +401,7 @@ class RiskOfBiasAssignmentSerializer(serializers.ModelSerializer):
             models.RiskOfBias.objects.filter(study=validated_data["study"], final=True).update(
                 active=False
             )
+            FinalRiskOfBiasScore.mark_dirty(study=[validated_data["study"].id])
         rob = super().create(validated_data)
         rob.build_scores(rob.study.assessment, rob.study)
         return rob
@@ -409,6 +411,7 @@ class RiskOfBiasAssignmentSerializer(serializers.ModelSerializer):
         # there can be one and only one final active
         if instance.final and validated_data["active"]:
             models.RiskOfBias.objects.filter(study=instance.study, final=True).update(active=False)
+            FinalRiskOfBiasScore.mark_dirty(study=[instance.study_id])
         # only set some keys
         for key in ("active", "author"):
             setattr(instance, key, validated_data[key])
@@ -57,7 +57,7 @@ class StudyExport(ModelExport):
         # cast from string to nullable int
         for key in [self.get_column_name("pubmed_id"), self.get_column_name("hero_id")]:
             if key in df.columns:
-                df[key] = pd.to_numeric(df[key], errors="coerce")
+                df[key] = pd.to_numeric(df[key], errors="coerce").astype("Int64")
 
         # cast from string to null
         doi = self.get_column_name("doi")
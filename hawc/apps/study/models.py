@@ -115,6 +115,8 @@ class Study(Reference):
     )
 
     BREADCRUMB_PARENT = "assessment"
+    # relations prefetched when serializing; see SerializerHelper
+    serialization_prefetch = ("identifiers", "searches", "riskofbiases__scores__metric__domain")
 
     class Meta:
         verbose_name_plural = "Studies"
@@ -270,11 +272,7 @@ class Study(Reference):
     def optimized_for_serialization(self):
         return (
             self.__class__.objects.filter(id=self.id)
-            .prefetch_related(
-                "identifiers",
-                "searches",
-                "riskofbiases__scores__metric__domain",
-            )
+            .prefetch_related(*self.serialization_prefetch)
             .first()
         )
 
@@ -14,7 +14,7 @@ from ..assessment.api import (
 from ..assessment.constants import AssessmentViewSetPermissions
 from ..assessment.models import Assessment
 from ..common.api import DisabledPagination
-from ..common.helper import FlatExport, cacheable
+from ..common.helper import FlatExport, assessment_cache_key, cacheable
 from ..common.renderers import DocxRenderer, PandasRenderers
 from ..common.serializers import UnusedSerializer
 from . import models, serializers, table_serializers
@@ -167,6 +167,6 @@ class SummaryTableViewSet(AssessmentEditViewSet):
         )
         ser.is_valid(raise_exception=True)
         # get cached value
-        cache_key = f"assessment-{self.assessment.id}-summary-table-{ser.cache_key}"
+        cache_key = assessment_cache_key(self.assessment.id, f"summary-table-{ser.cache_key}")
         data = cacheable(lambda: ser.get_data(), cache_key)
         return Response(data)
@@ -520,12 +520,12 @@ class Visual(models.Model):
             "created": timezone.now().isoformat(),
             "last_updated": timezone.now().isoformat(),
             "rob_settings": AssessmentRiskOfBiasSerializer(self.assessment).data,
-            "endpoints": [
-                SerializerHelper.get_serialized(e, json=False) for e in self.get_endpoints(request)
-            ],
-            "studies": [
-                SerializerHelper.get_serialized(s, json=False) for s in self.get_studies(request)
-            ],
+            "endpoints": SerializerHelper.get_serialized_many(
+                Endpoint, self.get_endpoints(request), json=False, assessment_id=self.assessment_id
+            ),
+            "studies": SerializerHelper.get_serialized_many(
+                Study, self.get_studies(request), json=False, assessment_id=self.assessment_id
+            ),
         }
 
     def get_rob_visual_type_display(self, value):
@@ -2,10 +2,12 @@ from django.core.exceptions import ValidationError
 from django.db import transaction
 from rest_framework import serializers
 
+from ..animal.models import Endpoint
 from ..common import validators
 from ..common.clean import sanitize_html
 from ..common.helper import SerializerHelper
 from ..riskofbias.serializers import AssessmentRiskOfBiasSerializer
+from ..study.models import Study
 from . import constants, models
 
 
@@ -81,13 +83,13 @@ class VisualSerializer(serializers.ModelSerializer):
 
         ret["visual_type"] = instance.get_visual_type_display()
 
-        ret["endpoints"] = [
-            SerializerHelper.get_serialized(d, json=False) for d in instance.get_endpoints()
-        ]
+        ret["endpoints"] = SerializerHelper.get_serialized_many(
+            Endpoint, instance.get_endpoints(), json=False, assessment_id=instance.assessment_id
+        )
 
-        ret["studies"] = [
-            SerializerHelper.get_serialized(d, json=False) for d in instance.get_studies()
-        ]
+        ret["studies"] = SerializerHelper.get_serialized_many(
+            Study, instance.get_studies(), json=False, assessment_id=instance.assessment_id
+        )
 
         ret["assessment_rob_name"] = instance.assessment.get_rob_name_display()
         ret["assessment_name"] = str(instance.assessment)
@@ -5,12 +5,12 @@ from django.db import models
 from django.utils import safestring
 
 from ..assessment.models import Assessment
-from ..common.helper import cacheable
+from ..common.helper import assessment_cache_key, cacheable
 from .models import ModelBinding
 
 
 def _get_mb_cache_key(assessment: Assessment, content_type: ContentType):
-    return f"assessment-{assessment.id}-udf-model-binding-{content_type.id}"
+    return assessment_cache_key(assessment.id, f"udf-model-binding-{content_type.id}")
 
 
 def _get_model_binding(assessment: Assessment, Model: type[models.Model]):
@@ -43,7 +43,7 @@ class UDFCache:
 
 
 def _get_tag_cache_key(assessment_id: int) -> str:
-    return f"assessment-{assessment_id}-tag-forms"
+    return assessment_cache_key(assessment_id, "tag-forms")
 
 
 class TagCache:
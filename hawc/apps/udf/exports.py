@@ -17,6 +17,9 @@ class ContentTypeExport(ModelExport):
 
 
 class ModelUDFContentExport(ModelExport):
+    # expanded content columns depend on every row in the export
+    chunk_safe = False
+
     def get_value_map(self):
         return {
             "pk": "pk",
@@ -42,6 +45,9 @@ class ModelUDFContentExporter(Exporter):
 
 
 class TagUDFContentExport(ModelExport):
+    # expanded content columns depend on every row in the export
+    chunk_safe = False
+
     def get_value_map(self):
         return {
             "pk": "pk",
@@ -87,6 +87,7 @@ MIDDLEWARE = (
     "wagtail.contrib.redirects.middleware.RedirectMiddleware",
     "hawc.apps.common.middleware.MicrosoftOfficeLinkMiddleware",
     "hawc.apps.common.middleware.RequestLogMiddleware",
+    "hawc.apps.common.middleware.CacheGenerationMiddleware",
     "hawc.apps.common.middleware.ThreadLocalMiddleware",
 )
 
@@ -179,12 +180,19 @@ CACHES = {
     "default": {
         "BACKEND": "django_redis.cache.RedisCache",
         "LOCATION": os.getenv("DJANGO_CACHE_LOCATION"),
-        "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+        "OPTIONS": {"CLIENT_CLASS": "hawc.apps.common.middleware.InstrumentedRedisClient"},
         "TIMEOUT": 60 * 60 * 24 * 10,  # 10 days
     }
 }
 CACHE_1_HR = 60 * 60
 CACHE_10_MIN = 60 * 10
+# per-process tier in front of the shared cache for serialized objects; 0 disables
+SERIALIZER_LOCAL_CACHE_SIZE = int(os.getenv("HAWC_SERIALIZER_LOCAL_CACHE_SIZE", "0"))
+SERIALIZER_LOCAL_CACHE_TIMEOUT = 30  # seconds
+# maximum time a `cacheable` recompute holds its lock before other workers recompute
+CACHEABLE_LOCK_TIMEOUT = 60 * 5
+# maximum time a request waits for another worker's `cacheable` recompute
+CACHEABLE_LOCK_WAIT = 5
 
 # Email settings
 EMAIL_SUBJECT_PREFIX = os.environ.get("EMAIL_SUBJECT_PREFIX", "[HAWC] ")
@@ -327,6 +335,12 @@ GTM_ID = os.getenv("GTM_ID")
 PUBMED_API_KEY = os.getenv("PUBMED_API_KEY")
 PUBMED_MAX_QUERY_SIZE = 10000
 
+# cache duration for metadata fetched from PubMed and HERO, before revalidation
+LIT_METADATA_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # 1 week
+
+# rows fetched per server-side cursor round trip for chunked exports
+EXPORT_CHUNK_SIZE = int(os.getenv("HAWC_EXPORT_CHUNK_SIZE", "5000"))
+
 # CCTE API key
 CCTE_API_KEY = os.getenv("CCTE_API_KEY")
 
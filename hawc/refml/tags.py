@@ -1,84 +1,109 @@
-from typing import Any
-
+import numpy as np
 import pandas as pd
 from django.db.models import QuerySet
-from pydantic import BaseModel as PydanticModel
-
 
-class TreeNode(PydanticModel):
-    id: int
-    name: str
-    parent: Any = None  # TreeNode
-
-    @property
-    def column_name(self) -> str:
-        return f"{self.name} ({self.id})"
 
+class TagTree:
+    """Array-backed tag tree, where position 0 is the assessment root.
 
-TreeNodeDict = dict[int, TreeNode]
+    Each tag is stored by position; `parents` contains the position of each tag's parent, or -1
+    for the root. This data structure is useful in finding all parent nodes given any tag by ID.
+    """
 
+    def __init__(self, ids: list[int], names: list[str], parents: list[int]):
+        self.ids = np.array(ids, dtype=int)
+        self.names = names
+        self.parents = np.array(parents, dtype=int)
 
-def build_tree_node_dict(tree: dict) -> TreeNodeDict:
-    """Build a dictionary with tag ids and TreeNode instances.
+    def __len__(self) -> int:
+        return self.ids.size
 
-    Given a dump from django treebeard, create a dictionary of tree-nodes. This data structure
-    is useful in finding all parent nodes given any tag by ID.
+    @property
+    def column_names(self) -> list[str]:
+        return [f"{name} ({id})" for name, id in zip(self.names, self.ids.tolist(), strict=True)]
+
+    def ancestors(self) -> pd.DataFrame:
+        """Return a dataframe with one row for each tag and each of its ancestors.
+
+        Rows are ordered by tag, then from the tag's parent up to the root. `attribute` is the
+        ancestor column name, and `value` is the name of the tag or ancestor directly below it.
+
+        Returns:
+            pd.DataFrame: columns tag_id, attribute, and value
+        """
+        column_names = self.column_names
+        positions, ancestors, children = [], [], []
+        for position in range(len(self)):
+            child = position
+            while (parent := self.parents[child]) >= 0:
+                positions.append(position)
+                ancestors.append(parent)
+                children.append(child)
+                child = parent
+        return pd.DataFrame(
+            {
+                "tag_id": self.ids[positions],
+                "attribute": np.array(column_names, dtype=object)[ancestors],
+                "value": np.array(self.names, dtype=object)[children],
+            }
+        )
+
+
+def build_tag_tree(tree: dict) -> TagTree:
+    """Build an array-backed tag tree.
+
+    Given a dump from django treebeard, create a tree of tag ids, names, and parents.
 
     Args:
         tree (dict): An export from the django-treebeard, `dump_bulk` command.
 
     Returns:
-        TreeNodeDict: An instance of the tree.
+        TagTree: An instance of the tree.
     """
-    leaves: TreeNodeDict = {}
+    ids, names, parents = [], [], []
 
-    def get_leaves(tag, parent_id=None):
-        tag_id = tag["id"]
-        parent = leaves[parent_id] if parent_id else None
-        leaves[tag_id] = TreeNode(id=tag_id, name=tag["data"]["name"], parent=parent)
+    def add_tag(tag: dict, name: str, parent: int):
+        position = len(ids)
+        ids.append(tag["id"])
+        names.append(name)
+        parents.append(parent)
         for child in tag.get("children", []):
-            get_leaves(child, tag_id)
+            add_tag(child, child["data"]["name"], position)
 
     # special case for root
-    root = tree[0]
-    leaves[root["id"]] = TreeNode(id=root["id"], name="assessment-root", parent=None)
-
-    # start at root node's children; since we these effectively have no parents
-    for tag in tree[0].get("children", []):
-        get_leaves(tag, parent_id=root["id"])
+    add_tag(tree[0], "assessment-root", -1)
 
-    return leaves
+    return TagTree(ids, names, parents)
 
 
-def create_df(tag_qs: QuerySet, tree_dict: TreeNodeDict, sep: str = "|") -> pd.DataFrame:
+def create_df(tag_qs: QuerySet, tree: TagTree, sep: str = "|") -> pd.DataFrame:
     """Create a dataframe where rows are each reference ID, and parents are each parent tag with
     values being text-values child-tags, pipe-delimited. Used for building heatmaps.
 
     Args:
         tag_qs (QuerySet): A queryset of tags from ReferenceTag
-        tree_dict (TreeNodeDict): must contain all tag ids in the queryset
+        tree (TagTree): must contain all tag ids in the queryset
         sep (str, optional): When multiple tags with parent, delimiter; defaults to "|".
 
     Returns:
         pd.DataFrame: the resulting dataframe.
     """
-    data = []
-
-    def add_data(ref_id: int, node: TreeNode):
-        if node.parent is not None:
-            data.append((ref_id, node.parent.column_name, node.name))
-            add_data(ref_id, node.parent)
-
-    for reftag in tag_qs:
-        add_data(reftag.content_object_id, tree_dict[reftag.tag_id])
-
-    return (
-        pd.DataFrame(data=data, columns=("ref_id", "attribute", "value"))
+    applied = pd.DataFrame(
+        data=tag_qs.values_list("content_object_id", "tag_id"), columns=("ref_id", "tag_id")
+    )
+    df = (
+        applied.merge(tree.ancestors(), on="tag_id", how="inner")
+        .drop(columns=["tag_id"])
         .drop_duplicates()
-        .groupby(["ref_id", "attribute"], as_index=False)
-        .agg({"value": sep.join})
+    )
+    # join values for each reference and attribute, in order; prefixing all but the first value
+    # with the delimiter lets a vectorized sum do the join
+    first = ~df.duplicated(["ref_id", "attribute"])
+    values = df["value"].where(first, sep + df["value"])
+    return (
+        values.groupby([df["ref_id"], df["attribute"]])
+        .sum()
         .reset_index()
-        .drop(columns=["index"])
         .pivot(index="ref_id", columns="attribute", values="value")
         .reset_index()
         .fillna("")
@@ -1,5 +1,6 @@
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import requests
@@ -8,6 +9,7 @@ from django.conf import settings
 from hawc.services.utils.doi import try_get_doi
 
 from ..utils.authors import get_author_short_text, normalize_authors
+from ..utils.session import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -52,9 +54,20 @@ class HEROFetch:
     Given a list of HERO IDs, fetch the content for each one and return a
     list of dictionaries of citation information. Note that this citation
     includes the PubMed ID, if available in HERO.
+
+    Pages of `recordsperpage` IDs are requested concurrently, using up to
+    `max_workers` connections from a shared connection pool.
     """
 
-    default_settings = {"recordsperpage": 100}
+    base_url = "https://hero.epa.gov/hero/ws/index.cfm/api/1.0/search/criteria"
+    default_settings = {"recordsperpage": 100, "max_workers": 4}
+    _session: requests.Session | None = None
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        if cls._session is None:
+            cls._session = create_session(pool_size=cls.default_settings["max_workers"])
+        return cls._session
 
     def __init__(self, id_list: list[int], **kwargs):
         if id_list is None:
@@ -90,27 +103,35 @@ class HEROFetch:
             self.failures = []
             return dict(success=self.content, failure=self.failures)
 
-        rng = list(range(0, self.ids_count, self.settings["recordsperpage"]))
-        for recstart in rng:
-            request_ids = self.ids[recstart : recstart + self.settings["recordsperpage"]]
-            ids = ",".join([str(id_) for id_ in request_ids])
-            rpp = self.settings["recordsperpage"]
-            url = f"https://hero.epa.gov/hero/ws/index.cfm/api/1.0/search/criteria/{ids}/recordsperpage/{rpp}.json"
-            try:
-                r = requests.get(url, timeout=30.0)
-                if r.status_code == 200:
-                    data = json.loads(r.text)
-                    for ref in data["results"]:
-                        self.content.append(parse_article(ref))
-                else:
-                    logger.info(f"HERO request failure: {url}")
-            except requests.exceptions.Timeout:
-                logger.info(f"HERO request timeout: {url}")
-            except json.JSONDecodeError:
-                logger.info(f"HERO request failure: {url}")
+        rpp = self.settings["recordsperpage"]
+        pages = [self.ids[recstart : recstart + rpp] for recstart in range(0, self.ids_count, rpp)]
+        workers = max(min(self.settings["max_workers"], len(pages)), 1)
+        self.get_session()  # initialize shared session before spawning workers
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for content in executor.map(self._fetch_page, pages):
+                self.content.extend(content)
         self.failures = self._get_missing_ids()
         return dict(success=self.content, failure=self.failures)
 
+    def _fetch_page(self, request_ids: list[int]) -> list[dict]:
+        ids = ",".join([str(id_) for id_ in request_ids])
+        rpp = self.settings["recordsperpage"]
+        url = f"{self.base_url}/{ids}/recordsperpage/{rpp}.json"
+        try:
+            r = self.get_session().get(url, timeout=30.0)
+            if r.status_code == 200:
+                data = json.loads(r.text)
+                return [parse_article(ref) for ref in data["results"]]
+            else:
+                logger.info(f"HERO request failure: {url}")
+        except requests.exceptions.Timeout:
+            logger.info(f"HERO request timeout: {url}")
+        except requests.exceptions.RequestException:
+            logger.info(f"HERO request failure: {url}")
+        except json.JSONDecodeError:
+            logger.info(f"HERO request failure: {url}")
+        return []
+
     def _get_missing_ids(self) -> list[int]:
         requested_ids = set(self.ids)
         found_ids = set([v["HEROID"] for v in self.content])
@@ -1,13 +1,19 @@
 import logging
 import random
 import re
+import threading
 import xml.etree.ElementTree as ET
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
+from typing import IO
 
 import requests
 from django.conf import settings as hawc_settings
 
 from ..utils.authors import get_author_short_text, normalize_author
+from ..utils.session import RateLimiter, create_session
 
 logger = logging.getLogger(__name__)
 
@@ -17,11 +23,31 @@ class PubMedSettings:
 
     PLACEHOLDER = "PLACEHOLDER"
 
+    # NCBI E-utilities request budget, in requests per second
+    RATE_LIMIT_ANONYMOUS = 3
+    RATE_LIMIT_API_KEY = 10
+
     def __init__(self):
         self.api_key = self.PLACEHOLDER
+        self.max_workers = 4
+        self.rate_limiter = RateLimiter(self.RATE_LIMIT_ANONYMOUS)
+        self._session: requests.Session | None = None
+        self._session_lock = threading.Lock()
 
     def connect(self, api_key: str):
         self.api_key = api_key
+        self.rate_limiter = RateLimiter(self.RATE_LIMIT_API_KEY)
+
+    @property
+    def session(self) -> requests.Session:
+        """A pooled HTTP session, shared by all requests to E-utilities."""
+        with self._session_lock:
+            if self._session is None:
+                # retries are sent within the same request budget
+                self._session = create_session(
+                    pool_size=self.max_workers, before_retry=lambda: self.rate_limiter.wait()
+                )
+            return self._session
 
 
 # global singleton
@@ -39,6 +65,30 @@ class PubMedUtility:
         if settings.api_key != PubMedSettings.PLACEHOLDER:
             self.settings["api_key"] = settings.api_key
 
+    def _post(self, url: str, data: dict, stream: bool = False) -> requests.Response:
+        """POST to E-utilities on the shared session, within the request budget."""
+        settings.rate_limiter.wait()
+        return settings.session.post(url, data=data, timeout=60.0, stream=stream)
+
+    def _imap(self, func, items: list) -> Iterator:
+        """Apply `func` to each item concurrently; results are yielded in input order.
+
+        At most `max_workers` calls are in flight or waiting to be consumed at once, so a
+        slow consumer does not cause completed results to accumulate in memory.
+        """
+        if len(items) <= 1 or settings.max_workers <= 1:
+            yield from (func(item) for item in items)
+            return
+        workers = min(settings.max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for item in items:
+                if len(pending) == workers:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(func, item))
+            while pending:
+                yield pending.popleft().result()
+
 
 class PubMedSearch(PubMedUtility):
     """Search PubMed with search-term and return a complete list of PubMed IDs."""
@@ -60,7 +110,7 @@ class PubMedSearch(PubMedUtility):
             return self.id_count
 
         data = dict(db=self.settings["db"], term=self.settings["term"], rettype="count")
-        r = requests.post(PubMedSearch.base_url, data=data)
+        r = self._post(self.base_url, data=data)
         if r.status_code == 200:
             txt = ET.fromstring(r.text)
             self.id_count = int(txt.find("Count").text)
@@ -78,20 +128,19 @@ class PubMedSearch(PubMedUtility):
             self.ids = [random.randrange(100_000_000, 999_9999_999)]  # noqa: S311
             return
 
-        ids = []
-        data = self.settings.copy()
         if self.id_count is None:
             self._get_id_count()
         rng = list(range(0, self.id_count, self.settings["retmax"]))
         self.request_count = len(rng)
-        for retstart in rng:
-            data["retstart"] = retstart
-            resp = requests.post(PubMedSearch.base_url, data=data)
-            if resp.status_code == 200:
-                ids.extend(self._parse_ids(resp.text))
-            else:
-                raise Exception("Search query failed; please reformat query or try again later")
-        self.ids = ids
+        self.ids = list(chain.from_iterable(self._imap(self._fetch_id_batch, rng)))
+
+    def _fetch_id_batch(self, retstart: int) -> list[int]:
+        data = self.settings.copy()
+        data["retstart"] = retstart
+        resp = self._post(self.base_url, data=data)
+        if resp.status_code == 200:
+            return self._parse_ids(resp.text)
+        raise Exception("Search query failed; please reformat query or try again later")
 
     def get_ids_count(self) -> int:
         return self._get_id_count()
@@ -109,15 +158,19 @@ class PubMedSearch(PubMedUtility):
 
 
 class PubMedFetch(PubMedUtility):
-    """Given a list of PubMed IDs, return list of dict of PubMed citation."""
+    """Given a list of PubMed IDs, return list of dict of PubMed citation.
+
+    Set `include_xml` to False to omit the raw XML of each citation from the results.
+    """
 
     base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
     default_settings = dict(retmax=1000, db="pubmed", retmode="xml")
 
-    def __init__(self, id_list, **kwargs):
+    def __init__(self, id_list, include_xml: bool = True, **kwargs):
         if id_list is None:
             raise Exception("List of IDs are required for a PubMed search")
         self.ids = id_list
+        self.include_xml = include_xml
         self.content: list[dict] = []
         self.settings = PubMedFetch.default_settings.copy()
         self._register_instance()
@@ -141,29 +194,35 @@ class PubMedFetch(PubMedUtility):
         ]
 
     def get_content(self) -> list[dict]:
-        data = self.settings.copy()
-        rng = list(range(0, len(self.ids), self.settings["retmax"]))
+        self.content.extend(self.iter_content())
+        return self.content
+
+    def iter_content(self) -> Iterator[dict]:
+        """Yield parsed citations one at a time, in the order of requested IDs."""
+        retmax = self.settings["retmax"]
+        rng = list(range(0, len(self.ids), retmax))
         self.request_count = len(rng)
-        for retstart in rng:
-            if hawc_settings.HAWC_FEATURES.FAKE_IMPORTS:
-                self.content = self.fake()
-                break
-
-            data["id"] = self.ids[retstart : retstart + self.settings["retmax"]]
-            resp = requests.post(PubMedFetch.base_url, data=data)
-            if resp.status_code == 200:
-                tree = ET.fromstring(resp.text.encode("utf-8"))
-                if tree.tag != "PubmedArticleSet":
-                    raise ValueError(f"Unexpected response type: {tree.tag}")
-                for content in tree:
-                    result = PubMedParser.parse(content)
-                    if result:
-                        self.content.append(result)
-            else:
+        if hawc_settings.HAWC_FEATURES.FAKE_IMPORTS:
+            if rng:
+                yield from self.fake()
+            return
+
+        # batches are fetched concurrently and parsed as each response streams in
+        batches = [self.ids[retstart : retstart + retmax] for retstart in rng]
+        for results in self._imap(self._fetch_batch, batches):
+            yield from results
+
+    def _fetch_batch(self, ids: list) -> list[dict]:
+        data = self.settings.copy()
+        data["id"] = ids
+        resp = self._post(self.base_url, data=data, stream=True)
+        with resp:
+            if resp.status_code != 200:
                 logger.error(f"Pubmed failure: {resp.status_code} -> {resp.text}")
                 logger.error(f"Pubmed failure data submission: {data}")
                 raise Exception("Fetch query failed; please reformat query or try again later")
-        return self.content
+            resp.raw.decode_content = True
+            return list(PubMedParser.iterparse(resp.raw, include_xml=self.include_xml))
 
 
 class PubMedParser:
@@ -177,19 +236,54 @@ class PubMedParser:
     ABSTRACT_BOOK_SEARCH_STRING = "BookDocument/Abstract/AbstractText"
 
     @classmethod
-    def parse(cls, tree: ET.Element) -> dict | None:
+    def iterparse(cls, source: IO[bytes], include_xml: bool = True) -> Iterator[dict]:
+        """Incrementally parse a PubmedArticleSet, yielding one citation at a time.
+
+        Each article element is cleared once parsed, so memory use is bounded by the size
+        of a single article rather than the complete response.
+
+        Args:
+            source (IO[bytes]): A file-like object of the XML response
+            include_xml (bool, default True): Include the raw XML of each citation
+
+        Raises:
+            ValueError: If the document is not a PubmedArticleSet
+        """
+        root = None
+        depth = 0
+        for event, element in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = element
+                    if root.tag != "PubmedArticleSet":
+                        raise ValueError(f"Unexpected response type: {root.tag}")
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1:
+                result = cls.parse(element, include_xml=include_xml)
+                root.clear()
+                if result:
+                    yield result
+
+    @classmethod
+    def parse(cls, tree: ET.Element, include_xml: bool = True) -> dict | None:
         if tree.tag == "PubmedArticle":
-            return cls._parse_article(tree)
+            return cls._parse_article(tree, include_xml)
         elif tree.tag == "PubmedBookArticle":
-            return cls._parse_book(tree)
+            return cls._parse_book(tree, include_xml)
         else:
             logger.warning(f"Cannot parse response: {tree.tag}")
             return None
 
     @classmethod
-    def _parse_article(cls, tree: ET.Element) -> dict:
+    def _get_xml(cls, tree: ET.Element, include_xml: bool) -> str:
+        return ET.tostring(tree, encoding="unicode") if include_xml else ""
+
+    @classmethod
+    def _parse_article(cls, tree: ET.Element, include_xml: bool = True) -> dict:
         d = {
-            "xml": ET.tostring(tree, encoding="unicode"),
+            "xml": cls._get_xml(tree, include_xml),
             "PMID": int(cls._try_single_find(tree, "MedlineCitation/PMID")),
             "title": cls._try_single_find(tree, "MedlineCitation/Article/ArticleTitle"),
             "abstract": cls._get_abstract(tree, cls.ABSTRACT_ARTICLE_SEARCH_STRING),
@@ -201,7 +295,7 @@ class PubMedParser:
         return d
 
     @classmethod
-    def _parse_book(cls, tree: ET.Element) -> dict:
+    def _parse_book(cls, tree: ET.Element, include_xml: bool = True) -> dict:
         pmid = int(cls._try_single_find(tree, "BookDocument/PMID"))
         book_title = cls._try_single_find(tree, "BookDocument/Book/BookTitle")
         article_title = cls._try_single_find(tree, "BookDocument/ArticleTitle")
@@ -210,7 +304,7 @@ class PubMedParser:
         doi = cls._get_doi(tree, cls.DOI_BOOK_SEARCH_STRING)
 
         d = {
-            "xml": ET.tostring(tree, encoding="unicode"),
+            "xml": cls._get_xml(tree, include_xml),
             "PMID": pmid,
             "abstract": abstract,
             "year": year,
@@ -0,0 +1,73 @@
+import threading
+import time
+from collections.abc import Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class RateLimiter:
+    """Thread-safe limiter which spaces calls to at most `rate` per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_call = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_call - now
+            self._next_call = max(now, self._next_call) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+class HookedRetry(Retry):
+    """Retry which calls a hook after each backoff, before the request is retried."""
+
+    def __init__(self, *args, before_retry: Callable[[], None] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.before_retry = before_retry
+
+    def new(self, **kwargs) -> "HookedRetry":
+        return super().new(before_retry=self.before_retry, **kwargs)
+
+    def sleep(self, response=None):
+        super().sleep(response)
+        if self.before_retry is not None:
+            self.before_retry()
+
+
+def create_session(
+    pool_size: int,
+    retries: int = 3,
+    backoff: float = 0.5,
+    before_retry: Callable[[], None] | None = None,
+) -> requests.Session:
+    """Create a requests session with a connection pool and retry with backoff.
+
+    Args:
+        pool_size (int): Number of connections to keep alive in the pool
+        retries (int, default 3): Number of retries on connection errors or throttling
+        backoff (float, default 0.5): Exponential backoff factor, in seconds
+        before_retry (Callable, optional): called before each retry; for example, to wait for a
+            `RateLimiter`, since retries are sent by the connection pool
+
+    Returns:
+        requests.Session: the configured session
+    """
+    retry = HookedRetry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=None,  # service requests are idempotent; retry POST too
+        raise_on_status=False,
+        before_retry=before_retry,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
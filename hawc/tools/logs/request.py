@@ -7,7 +7,9 @@ def parse_request_logs(logs: str) -> pd.DataFrame:
     """Parse logs generated by `hawc.apps.common.middleware.RequestLogMiddleware`.
 
     Example input text string:
-    INFO 2021-08-26 19:51:02,705 hawc.request GET /assessment/public/ 200 4887 ip-127.0.0.1 user-0 assess-0
+    INFO 2021-08-26 19:51:02,705 hawc.request GET /assessment/public/ 200 4887 ip-127.0.0.1 user-0 assess-0 ms-52.1 sql-12 sqlms-8.3 cache-hit-3 cache-miss-1 cache-set-1
+
+    Timing, SQL, and cache columns are empty for log lines written before they were recorded.
 
     Args:
         logs (str): A string of logs
@@ -17,9 +19,66 @@ def parse_request_logs(logs: str) -> pd.DataFrame:
     """
     regex = re.compile(
         r"(\w+) (.*) hawc\.request (\w+) (.*) (\d+) (\d+) ip-(.*) user-(\d+) assess-(\d+)"
+        r"(?: ms-([\d.]+) sql-(\d+) sqlms-([\d.]+) cache-hit-(\d+) cache-miss-(\d+) cache-set-(\d+))?$"
     )
     data = [list(*regex.findall(line)) for line in logs.strip().splitlines()]
-    cols = "message timestamp verb path status_code content_length ip user_id assessment_id".split()
-    df = pd.DataFrame(data=data, columns=cols).apply(pd.to_numeric, errors="ignore")
+    cols = (
+        "message timestamp verb path status_code content_length ip user_id assessment_id "
+        "ms sql_count sql_ms cache_hits cache_misses cache_sets"
+    ).split()
+    df = pd.DataFrame(data=data, columns=cols)
+    df = df.mask(df == "").apply(pd.to_numeric, errors="ignore")
     df = df.assign(timestamp=pd.to_datetime(df.timestamp))
     return df
+
+
+def normalize_path(path: str) -> str:
+    """Replace numeric path segments with a placeholder to group requests by endpoint.
+
+    Example: `/study/api/study/7/` returns `/study/api/study/{id}/`
+    """
+    return re.sub(r"/\d+(?=/|$)", "/{id}", path)
+
+
+def endpoint_latency(df: pd.DataFrame, percentiles=(0.5, 0.9, 0.99)) -> pd.DataFrame:
+    """Summarize request latency by endpoint, slowest first.
+
+    Args:
+        df (pd.DataFrame): parsed logs from `parse_request_logs`
+        percentiles (tuple): latency percentiles to report, between 0 and 1
+
+    Returns:
+        pd.DataFrame: One row per verb and endpoint, with request count, latency percentiles and
+            maximum in milliseconds, and mean SQL count, SQL time, and cache hits and misses.
+    """
+    df = df.dropna(subset=["ms"]).assign(endpoint=lambda d: d.path.map(normalize_path))
+    grouped = df.groupby(["verb", "endpoint"])
+    summary = grouped.ms.quantile(list(percentiles)).unstack()
+    summary.columns = [f"p{round(p * 100)}_ms" for p in percentiles]
+    sort_by = summary.columns[-1]
+    summary = pd.concat(
+        [
+            grouped.size().rename("requests"),
+            summary,
+            grouped.ms.max().rename("max_ms"),
+            grouped[["sql_count", "sql_ms", "cache_hits", "cache_misses"]]
+            .mean()
+            .add_prefix("mean_"),
+        ],
+        axis=1,
+    )
+    return summary.sort_values(sort_by, ascending=False).reset_index()
+
+
+def slowest_requests(df: pd.DataFrame, n: int = 20) -> pd.DataFrame:
+    """Return the slowest individual requests.
+
+    Args:
+        df (pd.DataFrame): parsed logs from `parse_request_logs`
+        n (int): number of requests to return
+
+    Returns:
+        pd.DataFrame: the `n` slowest requests, slowest first
+    """
+    cols = ["timestamp", "verb", "path", "status_code", "ms", "sql_count", "sql_ms"]
+    return df.dropna(subset=["ms"]).nlargest(n, "ms")[cols].reset_index(drop=True)
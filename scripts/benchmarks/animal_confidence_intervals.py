@@ -0,0 +1,177 @@
+"""
+Benchmark confidence-interval and percent-control calculations used in animal bioassay
+exports against the prior row-wise implementations, on synthetic endpoint-group data.
+
+No database is required; results of both implementations are compared for equality.
+
+```bash
+cd /path/to/hawc/hawc
+source ../venv/bin/activate
+python ../scripts/benchmarks/animal_confidence_intervals.py --n 250000
+```
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import django
+import numpy as np
+import pandas as pd
+
+ROOT = str((Path(__file__).parents[2] / "hawc").resolve())
+sys.path.append(ROOT)
+os.chdir(ROOT)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "main.settings.dev")
+
+django.setup()
+
+from hawc.apps.animal import constants, exports  # noqa: E402
+from hawc.apps.animal.models import Endpoint  # noqa: E402
+
+GROUPS_PER_ENDPOINT = 4
+
+
+def legacy_handle_ci(df: pd.DataFrame) -> pd.DataFrame:
+    def _func(row: pd.Series) -> pd.Series:
+        data_type = row["endpoint-data_type"]
+        lower_ci = row["endpoint_group-lower_ci"]
+        upper_ci = row["endpoint_group-upper_ci"]
+        n = row["endpoint_group-n"]
+        response = row["endpoint_group-response"]
+        stdev = row["endpoint_group-stdev"]
+        incidence = row["endpoint_group-incidence"]
+        if lower_ci is not None or upper_ci is not None or n is None or n <= 0:
+            pass
+        elif (
+            data_type == constants.DataType.CONTINUOUS
+            and response is not None
+            and stdev is not None
+        ):
+            row["endpoint_group-lower_ci"], row["endpoint_group-upper_ci"] = exports.cont_ci(
+                stdev, n, response
+            )
+        elif data_type == constants.DataType.DICHOTOMOUS and incidence is not None:
+            row["endpoint_group-lower_ci"], row["endpoint_group-upper_ci"] = exports.dich_ci(
+                incidence, n
+            )
+        return row
+
+    return df.apply(_func, axis="columns")
+
+
+def legacy_handle_percent_control(df: pd.DataFrame) -> pd.DataFrame:
+    def _func(group_df: pd.DataFrame) -> pd.DataFrame:
+        control = group_df.iloc[0]
+        data_type = control["endpoint-data_type"]
+        i_1 = control["endpoint_group-incidence"]
+        n_1 = control["endpoint_group-n"]
+        mu_1 = control["endpoint_group-response"]
+        sd_1 = control["endpoint_group-stdev"]
+
+        def __func(row: pd.Series) -> pd.Series:
+            row["percent control mean"] = None
+            row["percent control low"] = None
+            row["percent control high"] = None
+            if data_type == constants.DataType.CONTINUOUS:
+                (
+                    row["percent control mean"],
+                    row["percent control low"],
+                    row["percent control high"],
+                ) = exports.percent_control(
+                    n_1,
+                    mu_1,
+                    sd_1,
+                    row["endpoint_group-n"],
+                    row["endpoint_group-response"],
+                    row["endpoint_group-stdev"],
+                )
+            elif data_type == constants.DataType.DICHOTOMOUS and i_1 and n_1:
+                i_2 = row["endpoint_group-incidence"]
+                n_2 = row["endpoint_group-n"]
+                if n_2:
+                    row["percent control mean"] = ((i_2 / n_2) - (i_1 / n_1)) / (i_1 / n_1) * 100
+            return row
+
+        group_df = group_df.apply(__func, axis="columns")
+        group_df["maximum endpoint change"] = exports.maximum_percent_control_change(
+            group_df["percent control mean"].dropna()
+        )
+        return group_df
+
+    return (
+        df.groupby("endpoint-id", group_keys=False, sort=False).apply(_func).reset_index(drop=True)
+    )
+
+
+def get_data(n: int) -> pd.DataFrame:
+    # object columns with None for missing values, as returned for nullable fields
+    rng = np.random.default_rng(0)
+    endpoint_id = np.arange(n) // GROUPS_PER_ENDPOINT
+    continuous = endpoint_id % 2 == 0
+    data_type = np.where(continuous, constants.DataType.CONTINUOUS, constants.DataType.DICHOTOMOUS)
+    group_n = rng.integers(1, 50, n)
+    response = rng.uniform(1, 100, n)
+    stdev = rng.uniform(0.1, 10, n)
+    incidence = rng.integers(1, group_n + 1)
+
+    def _nullable(values: np.ndarray, mask: np.ndarray) -> list:
+        return [value if keep else None for value, keep in zip(values.tolist(), mask, strict=True)]
+
+    return pd.DataFrame(
+        {
+            "endpoint-id": endpoint_id,
+            "endpoint-data_type": data_type,
+            "endpoint_group-n": group_n,
+            "endpoint_group-response": pd.Series(_nullable(response, continuous), dtype=object),
+            "endpoint_group-stdev": pd.Series(_nullable(stdev, continuous), dtype=object),
+            "endpoint_group-incidence": pd.Series(_nullable(incidence, ~continuous), dtype=object),
+            "endpoint_group-lower_ci": pd.Series([None] * n, dtype=object),
+            "endpoint_group-upper_ci": pd.Series([None] * n, dtype=object),
+        }
+    )
+
+
+def compare(legacy: pd.DataFrame, current: pd.DataFrame, columns: list[str]):
+    for column in columns:
+        a = pd.to_numeric(legacy[column], errors="coerce").to_numpy(dtype=float)
+        b = pd.to_numeric(current[column], errors="coerce").to_numpy(dtype=float)
+        if not np.allclose(a, b, equal_nan=True):
+            raise ValueError(f"Unexpected difference in {column}")
+
+
+def run(name: str, func, df: pd.DataFrame) -> pd.DataFrame:
+    start = time.perf_counter()
+    result = func(df.copy())
+    duration = time.perf_counter() - start
+    print(f"{name:>24}: {duration:8.2f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=250_000)
+    args = parser.parse_args()
+    print(f"Calculating {args.n:,} endpoint-groups")
+    df = get_data(args.n)
+    exporter = exports.EndpointGroupFlatDataPivot(queryset=Endpoint.objects.none())
+
+    legacy = run("legacy ci", legacy_handle_ci, df)
+    current = run("current ci", exporter.handle_ci, df)
+    compare(legacy, current, ["endpoint_group-lower_ci", "endpoint_group-upper_ci"])
+
+    columns = [
+        "percent control mean",
+        "percent control low",
+        "percent control high",
+        "maximum endpoint change",
+    ]
+    legacy = run("legacy percent control", legacy_handle_percent_control, df)
+    current = run("current percent control", exporter.handle_percent_control, df)
+    compare(legacy, current, columns)
+
+
+if __name__ == "__main__":
+    main()
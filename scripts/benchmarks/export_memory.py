@@ -0,0 +1,102 @@
+"""
+Benchmark peak memory of `Exporter.get_df` and streaming `Exporter.iter_df` against the
+unchunked implementation, using a synthetic large assessment.
+
+Synthetic risk of bias scores are added to an existing study evaluation in the assessment;
+all changes are rolled back after the benchmark.
+
+```bash
+cd /path/to/hawc/hawc
+source ../venv/bin/activate
+python ../scripts/benchmarks/export_memory.py --assessment 1 --n 500000 --chunk-size 5000
+```
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import django
+from django.db import transaction
+
+ROOT = str((Path(__file__).parents[2] / "hawc").resolve())
+sys.path.append(ROOT)
+os.chdir(ROOT)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "main.settings.dev")
+
+django.setup()
+
+from hawc.apps.riskofbias.exports import RiskOfBiasCompleteExporter  # noqa: E402
+from hawc.apps.riskofbias.models import (  # noqa: E402
+    RiskOfBias,
+    RiskOfBiasMetric,
+    RiskOfBiasScore,
+)
+
+NOTES = "<p>" + "Synthetic study evaluation notes. " * 15 + "</p>"
+
+
+def setup(assessment_id: int, n: int):
+    riskofbias = RiskOfBias.objects.filter(study__assessment_id=assessment_id).first()
+    metrics = list(RiskOfBiasMetric.objects.filter(domain__assessment_id=assessment_id))
+    if riskofbias is None or not metrics:
+        raise ValueError("Assessment requires at least one study evaluation and metric")
+    RiskOfBiasScore.objects.bulk_create(
+        (
+            RiskOfBiasScore(
+                riskofbias=riskofbias,
+                metric=metrics[i % len(metrics)],
+                is_default=False,
+                label=f"synthetic-{i}",
+                score=17,
+                notes=NOTES,
+            )
+            for i in range(n)
+        ),
+        batch_size=10_000,
+    )
+
+
+def run(name: str, func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = func()
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:>12}: {duration:8.2f}s; {peak / 1024**2:8.1f} MB peak; {rows:,} rows")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--assessment", type=int, default=1)
+    parser.add_argument("--n", type=int, default=500_000)
+    parser.add_argument("--chunk-size", type=int, default=5_000)
+    args = parser.parse_args()
+
+    with transaction.atomic():
+        setup(args.assessment, args.n)
+        qs = RiskOfBiasScore.objects.filter(
+            riskofbias__study__assessment_id=args.assessment
+        ).order_by("id")
+
+        def _get_df(chunk_size: int | None = None):
+            return lambda: RiskOfBiasCompleteExporter().get_df(qs, chunk_size).shape[0]
+
+        def _iter_df():
+            return sum(
+                df.shape[0] for df in RiskOfBiasCompleteExporter().iter_df(qs, args.chunk_size)
+            )
+
+        print(f"Exporting {args.n:,} synthetic scores; chunk size {args.chunk_size:,}")
+        run("unchunked", _get_df())
+        run("chunked", _get_df(args.chunk_size))
+        run("streaming", _iter_df)
+        transaction.set_rollback(True)
+
+
+if __name__ == "__main__":
+    main()
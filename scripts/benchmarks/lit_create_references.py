@@ -0,0 +1,110 @@
+"""
+Benchmark `Search.create_new_references` against the prior implementation, which re-queried
+created references by a temporary `block_id` and built through-table rows in Python.
+
+Synthetic PubMed identifiers are created for an existing assessment; all changes are rolled
+back after each run.
+
+```bash
+cd /path/to/hawc/hawc
+source ../venv/bin/activate
+python ../scripts/benchmarks/lit_create_references.py --assessment 1 --n 100000
+```
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import django
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+ROOT = str((Path(__file__).parents[2] / "hawc").resolve())
+sys.path.append(ROOT)
+os.chdir(ROOT)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "main.settings.dev")
+
+django.setup()
+
+from hawc.apps.lit import constants  # noqa: E402
+from hawc.apps.lit.models import Identifiers, Reference, Search  # noqa: E402
+
+
+def legacy_create_new_references(search: Search, results: dict):
+    RefSearchM2M = Reference.searches.through
+    RefIdM2M = Reference.identifiers.through
+    added_str = [str(id) for id in results["added"]]
+    ids = (
+        Identifiers.objects.filter(database=search.source, unique_id__in=added_str)
+        .exclude(references__in=Reference.objects.get_qs(search.assessment))
+        .order_by("pk")
+    )
+    block_id = timezone.now()
+    refs = [i.create_reference(search.assessment, block_id) for i in ids]
+    id_pks = [i.pk for i in ids]
+    Reference.objects.bulk_create(refs)
+    refs = Reference.objects.filter(assessment=search.assessment, block_id=block_id).order_by("pk")
+    ref_searches = []
+    ref_ids = []
+    for i, ref in enumerate(refs):
+        ref_searches.append(RefSearchM2M(reference_id=ref.pk, search_id=search.pk))
+        ref_ids.append(RefIdM2M(reference_id=ref.pk, identifiers_id=id_pks[i]))
+    RefSearchM2M.objects.bulk_create(ref_searches)
+    RefIdM2M.objects.bulk_create(ref_ids)
+    refs.update(block_id=None)
+
+
+def setup(assessment_id: int, n: int) -> tuple[Search, dict]:
+    search = Search.objects.create(
+        assessment_id=assessment_id,
+        search_type=constants.SearchType.SEARCH,
+        source=constants.ReferenceDatabase.PUBMED,
+        title="benchmark",
+        slug="benchmark",
+        search_string="benchmark",
+    )
+    pmids = list(range(900_000_000, 900_000_000 + n))
+    Identifiers.objects.bulk_create(
+        [
+            Identifiers(
+                database=constants.ReferenceDatabase.PUBMED,
+                unique_id=str(pmid),
+                content=json.dumps({"PMID": pmid, "title": f"Title {pmid}", "year": 2024}),
+            )
+            for pmid in pmids
+        ],
+        batch_size=10_000,
+    )
+    return search, {"added": pmids}
+
+
+def run(name: str, func, assessment_id: int, n: int):
+    with transaction.atomic():
+        search, results = setup(assessment_id, n)
+        with CaptureQueriesContext(connection) as ctx:
+            start = time.perf_counter()
+            func(search, results)
+            duration = time.perf_counter() - start
+        if search.references.count() != n:
+            raise ValueError("Unexpected reference count")
+        transaction.set_rollback(True)
+    print(f"{name:>8}: {duration:8.2f}s; {len(ctx.captured_queries):>5} queries")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--assessment", type=int, default=1)
+    parser.add_argument("--n", type=int, default=100_000)
+    args = parser.parse_args()
+    print(f"Creating {args.n:,} references")
+    run("legacy", legacy_create_new_references, args.assessment, args.n)
+    run("current", Search.create_new_references, args.assessment, args.n)
+
+
+if __name__ == "__main__":
+    main()
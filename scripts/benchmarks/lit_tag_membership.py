@@ -0,0 +1,92 @@
+"""
+Benchmark tag membership used in reference exports against the prior implementation, which
+checked each reference's tags against every tag-descendant set.
+
+Synthetic tag trees and reference tags are generated in memory; no database is required.
+
+```bash
+cd /path/to/hawc/hawc
+source ../venv/bin/activate
+python ../scripts/benchmarks/lit_tag_membership.py --references 50000 --tags 500
+```
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import django
+import numpy as np
+
+ROOT = str((Path(__file__).parents[2] / "hawc").resolve())
+sys.path.append(ROOT)
+os.chdir(ROOT)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "main.settings.dev")
+
+django.setup()
+
+from hawc.apps.lit.exports import TagMatrix  # noqa: E402
+from hawc.apps.lit.models import ReferenceFilterTag  # noqa: E402
+
+TAGS_PER_REFERENCE = 5
+
+
+def get_tag_tree(n_tags: int) -> dict:
+    # random tree in dump_bulk format, with tag ids 1..n_tags
+    rng = np.random.default_rng(0)
+    nodes = {0: {"id": 0, "data": {"name": "root"}, "children": []}}
+    for tag_id in range(1, n_tags + 1):
+        parent = 0 if tag_id < 10 else int(rng.integers(1, tag_id))
+        nodes[tag_id] = {"id": tag_id, "data": {"name": f"tag {tag_id}"}, "children": []}
+        nodes[parent]["children"].append(nodes[tag_id])
+    return ReferenceFilterTag.get_tree_descendants([nodes[0]])
+
+
+def get_reference_tags(n_references: int, n_tags: int) -> list[tuple[int, int]]:
+    rng = np.random.default_rng(0)
+    ref_ids = np.repeat(np.arange(n_references), TAGS_PER_REFERENCE)
+    tag_ids = rng.integers(1, n_tags + 1, ref_ids.size)
+    return list(zip(ref_ids.tolist(), tag_ids.tolist(), strict=True))
+
+
+def legacy(tag_tree: dict, ref_ids: list[int], item_tags: list[tuple[int, int]]) -> list[list]:
+    tags_by_ref = {ref_id: set() for ref_id in ref_ids}
+    for ref_id, tag_id in item_tags:
+        tags_by_ref[ref_id].add(tag_id)
+    return [
+        [any(tag in tag_set for tag in tags_by_ref[ref_id]) for tag_set in tag_tree.values()]
+        for ref_id in ref_ids
+    ]
+
+
+def current(tag_tree: dict, ref_ids: list[int], item_tags: list[tuple[int, int]]) -> list[list]:
+    return TagMatrix(tag_tree).get_membership(ref_ids, item_tags).tolist()
+
+
+def run(name: str, func, *args) -> list[list]:
+    start = time.perf_counter()
+    result = func(*args)
+    duration = time.perf_counter() - start
+    print(f"{name:>8}: {duration:8.2f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--references", type=int, default=50_000)
+    parser.add_argument("--tags", type=int, default=500)
+    args = parser.parse_args()
+    tag_tree = get_tag_tree(args.tags)
+    ref_ids = list(range(args.references))
+    item_tags = get_reference_tags(args.references, args.tags)
+    print(f"Tag membership for {args.references:,} references and {args.tags:,} tags")
+    expected = run("legacy", legacy, tag_tree, ref_ids, item_tags)
+    actual = run("current", current, tag_tree, ref_ids, item_tags)
+    if actual != expected:
+        raise ValueError("Unexpected difference in tag membership")
+
+
+if __name__ == "__main__":
+    main()
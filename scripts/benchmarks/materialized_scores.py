@@ -0,0 +1,132 @@
+"""
+Benchmark resolving final risk of bias scores for endpoints against the prior implementation,
+which scanned all scores once per endpoint.
+
+Synthetic scores are generated for 10,000 endpoints (across 1,000 studies, 10 metrics each, with
+endpoint and animal-group overrides); only content types are read from the database.
+
+```bash
+cd /path/to/hawc/hawc
+source ../venv/bin/activate
+python ../scripts/benchmarks/materialized_scores.py --endpoints 10000
+```
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from itertools import chain
+from pathlib import Path
+
+import django
+from django.contrib.contenttypes.models import ContentType
+
+ROOT = str((Path(__file__).parents[2] / "hawc").resolve())
+sys.path.append(ROOT)
+os.chdir(ROOT)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "main.settings.dev")
+
+django.setup()
+
+from hawc.apps.animal.models import AnimalGroup, Endpoint  # noqa: E402
+from hawc.apps.materialized.managers import MetricScore  # noqa: E402
+from hawc.apps.materialized.models import FinalRiskOfBiasScore  # noqa: E402
+
+ENDPOINTS_PER_STUDY = 10
+METRICS = 10
+
+
+def get_data(n_endpoints: int) -> tuple[list[dict], list[tuple[int, int, int]]]:
+    # returns synthetic score values, and (endpoint_id, animal_group_id, study_id) tuples
+    rng = random.Random(0)  # noqa: S311
+    endpoint_ct = ContentType.objects.get_for_model(Endpoint).id
+    animal_group_ct = ContentType.objects.get_for_model(AnimalGroup).id
+    endpoints = [(i, i // 2, i // ENDPOINTS_PER_STUDY) for i in range(n_endpoints)]
+    scores = []
+
+    def _score(study_id, metric_id, is_default, content_type_id=None, object_id=None):
+        scores.append(
+            dict(
+                id=len(scores),
+                score_id=len(scores),
+                study_id=study_id,
+                metric_id=metric_id,
+                is_default=is_default,
+                score_score=rng.choice([14, 15, 16, 17]),
+                content_type_id=content_type_id,
+                object_id=object_id,
+            )
+        )
+
+    for study_id in range(n_endpoints // ENDPOINTS_PER_STUDY):
+        for metric_id in range(METRICS):
+            _score(study_id, metric_id, True)
+    for endpoint_id, animal_group_id, study_id in endpoints:
+        if rng.random() < 0.1:
+            _score(study_id, rng.randrange(METRICS), False, endpoint_ct, endpoint_id)
+        if rng.random() < 0.1:
+            _score(study_id, rng.randrange(METRICS), False, animal_group_ct, animal_group_id)
+    return scores, endpoints
+
+
+def legacy(scores: list[dict], endpoints: list[tuple[int, int, int]]) -> dict:
+    endpoint_ct = ContentType.objects.get_for_model(Endpoint).id
+    animal_group_ct = ContentType.objects.get_for_model(AnimalGroup).id
+
+    def _override_tuples(study_scores, content_type_id, object_id):
+        return [
+            MetricScore(score["metric_id"], score)
+            for score in study_scores
+            if score["content_type_id"] == content_type_id and object_id == score["object_id"]
+        ]
+
+    results = {}
+    for endpoint_id, animal_group_id, study_id in endpoints:
+        study_scores = [score for score in scores if study_id == score["study_id"]]
+        for metric_id, score in chain(
+            [MetricScore(s["metric_id"], s) for s in study_scores if s["is_default"]],
+            _override_tuples(study_scores, animal_group_ct, animal_group_id),
+            _override_tuples(study_scores, endpoint_ct, endpoint_id),
+        ):
+            results[endpoint_id, metric_id] = score
+    return results
+
+
+def current(scores: list[dict], endpoints: list[tuple[int, int, int]]) -> dict:
+    qs = FinalRiskOfBiasScore.objects.none()
+    qs._score_values = scores
+    results = {}
+    for endpoint_id, animal_group_id, study_id in endpoints:
+        for metric_id, score in chain(
+            qs._default_tuples(qs._study_scores(study_id)),
+            qs._override_tuples(study_id, AnimalGroup, animal_group_id),
+            qs._override_tuples(study_id, Endpoint, endpoint_id),
+        ):
+            results[endpoint_id, metric_id] = score
+    return results
+
+
+def run(name: str, func, scores: list[dict], endpoints: list[tuple[int, int, int]]) -> dict:
+    start = time.perf_counter()
+    results = func(scores, endpoints)
+    duration = time.perf_counter() - start
+    print(f"{name:>8}: {duration:8.3f}s")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--endpoints", type=int, default=10_000)
+    args = parser.parse_args()
+    scores, endpoints = get_data(args.endpoints)
+    print(f"Resolving {len(scores):,} scores for {len(endpoints):,} endpoints")
+    expected = run("legacy", legacy, scores, endpoints)
+    actual = run("current", current, scores, endpoints)
+    if actual != expected:
+        raise ValueError("Unexpected difference in resolved scores")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark building the reference tag heatmap dataframe against the prior implementation,
+which walked parent nodes for each tag application.
+
+Synthetic references and tag applications are added to an existing assessment with a tag tree;
+all changes are rolled back after the benchmark.
+
+```bash
+cd /path/to/hawc/hawc
+source ../venv/bin/activate
+python ../scripts/benchmarks/refml_heatmap.py --assessment 1 --n 100000
+```
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import django
+import numpy as np
+import pandas as pd
+from django.db import transaction
+from pydantic import BaseModel as PydanticModel
+
+ROOT = str((Path(__file__).parents[2] / "hawc").resolve())
+sys.path.append(ROOT)
+os.chdir(ROOT)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "main.settings.dev")
+
+django.setup()
+
+from hawc.apps.lit.models import Reference, ReferenceFilterTag, ReferenceTags  # noqa: E402
+from hawc.refml import tags  # noqa: E402
+
+TAGS_PER_REFERENCE = 5
+
+
+class TreeNode(PydanticModel):
+    id: int
+    name: str
+    parent: Any = None
+
+    @property
+    def column_name(self) -> str:
+        return f"{self.name} ({self.id})"
+
+
+def legacy_create_df(tag_qs, tree: dict, sep: str = "|") -> pd.DataFrame:
+    leaves = {}
+
+    def get_leaves(tag, parent_id=None):
+        tag_id = tag["id"]
+        parent = leaves[parent_id] if parent_id else None
+        leaves[tag_id] = TreeNode(id=tag_id, name=tag["data"]["name"], parent=parent)
+        for child in tag.get("children", []):
+            get_leaves(child, tag_id)
+
+    root = tree[0]
+    leaves[root["id"]] = TreeNode(id=root["id"], name="assessment-root", parent=None)
+    for tag in tree[0].get("children", []):
+        get_leaves(tag, parent_id=root["id"])
+
+    data = []
+
+    def add_data(ref_id: int, node: TreeNode):
+        if node.parent is not None:
+            data.append((ref_id, node.parent.column_name, node.name))
+            add_data(ref_id, node.parent)
+
+    for reftag in tag_qs:
+        add_data(reftag.content_object_id, leaves[reftag.tag_id])
+
+    return (
+        pd.DataFrame(data=data, columns=("ref_id", "attribute", "value"))
+        .drop_duplicates()
+        .groupby(["ref_id", "attribute"], as_index=False)
+        .agg({"value": sep.join})
+        .reset_index()
+        .drop(columns=["index"])
+        .pivot(index="ref_id", columns="attribute", values="value")
+        .reset_index()
+        .fillna("")
+    )
+
+
+def current_create_df(tag_qs, tree: dict) -> pd.DataFrame:
+    return tags.create_df(tag_qs, tags.build_tag_tree(tree))
+
+
+def setup(assessment_id: int, n: int):
+    tag_ids = ReferenceFilterTag.get_descendants_pks(assessment_id)
+    if not tag_ids:
+        raise ValueError("Assessment requires a tag tree")
+    n_refs = n // TAGS_PER_REFERENCE
+    refs = Reference.objects.bulk_create(
+        [Reference(assessment_id=assessment_id, title=f"Reference {i}") for i in range(n_refs)],
+        batch_size=10_000,
+    )
+    rng = np.random.default_rng(0)
+    ReferenceTags.objects.bulk_create(
+        [
+            ReferenceTags(content_object_id=ref.id, tag_id=tag_id)
+            for ref in refs
+            for tag_id in rng.choice(
+                tag_ids, min(TAGS_PER_REFERENCE, len(tag_ids)), replace=False
+            ).tolist()
+        ],
+        batch_size=10_000,
+    )
+
+
+def run(name: str, func, tag_qs, tree: dict) -> pd.DataFrame:
+    start = time.perf_counter()
+    df = func(tag_qs, tree)
+    duration = time.perf_counter() - start
+    print(f"{name:>8}: {duration:8.2f}s")
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--assessment", type=int, default=1)
+    parser.add_argument("--n", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with transaction.atomic():
+        setup(args.assessment, args.n)
+        tree = ReferenceFilterTag.get_all_tags(args.assessment)
+        tag_qs = ReferenceTags.objects.assessment_qs(args.assessment)
+        print(f"Building heatmap dataframe for {tag_qs.count():,} tag applications")
+        expected = run("legacy", legacy_create_df, tag_qs.all(), tree)
+        actual = run("current", current_create_df, tag_qs.all(), tree)
+        pd.testing.assert_frame_equal(expected, actual)
+        transaction.set_rollback(True)
+
+
+if __name__ == "__main__":
+    main()
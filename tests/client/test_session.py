@@ -0,0 +1,181 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pytest
+
+from hawc_client import AsyncHawcClient, HawcServerException, HawcSession
+from hawc_client.session import AsyncHawcSession
+
+COUNT = 23
+PAGE_SIZE = 5
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Paginated API stub, in the format of a django-rest-framework PageNumberPagination."""
+
+    def do_GET(self):
+        server = self.server
+        if self.path.startswith("/flaky/"):
+            # fail the first two requests to each path
+            with server.lock:
+                server.attempts[self.path] = server.attempts.get(self.path, 0) + 1
+                attempt = server.attempts[self.path]
+            if attempt <= 2:
+                status, headers = (429, {"Retry-After": "0"}) if attempt == 1 else (503, {})
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.path = self.path.replace("/flaky/", "/items/")
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(0.05)
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query.get("page", ["1"])[0])
+        start = (page - 1) * PAGE_SIZE
+        ids = range(start, min(start + PAGE_SIZE, COUNT))
+        host = f"http://{server.server_address[0]}:{server.server_address[1]}"
+        base = urlparse(self.path).path
+        results = [{"id": id, "name": f"item {id}"} for id in ids]
+        if base.startswith("/sparse/"):
+            # a nullable field which is null on the first page
+            for result in results:
+                result["value"] = None if page == 1 else result["id"] * 0.5
+        content = {
+            "count": COUNT,
+            "next": f"{host}{base}?page={page + 1}" if start + PAGE_SIZE < COUNT else None,
+            "previous": None,
+            "results": results,
+        }
+        body = json.dumps(content).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with server.lock:
+            server.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.lock = threading.Lock()
+    server.in_flight = 0
+    server.max_in_flight = 0
+    server.attempts = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server, path: str = "items") -> str:
+    return f"http://{server.server_address[0]}:{server.server_address[1]}/{path}/"
+
+
+class TestHawcSession:
+    def test_iter_pages(self, stub_server):
+        session = HawcSession(_url(stub_server))
+        pages = list(session.iter_pages(_url(stub_server)))
+        assert [len(page) for page in pages] == [5, 5, 5, 5, 3]
+        assert [item["id"] for page in pages for item in page] == list(range(COUNT))
+        assert stub_server.max_in_flight == 1
+
+    def test_iter_pages_concurrent(self, stub_server):
+        session = HawcSession(_url(stub_server), workers=4)
+        pages = list(session.iter_pages(_url(stub_server)))
+        # pages are yielded in order
+        assert [item["id"] for page in pages for item in page] == list(range(COUNT))
+        assert stub_server.max_in_flight > 1
+
+    def test_get_dataframe(self, stub_server):
+        session = HawcSession(_url(stub_server))
+        df = session.get_dataframe(_url(stub_server), workers=3)
+        assert df.shape == (COUNT, 2)
+        assert df.id.tolist() == list(range(COUNT))
+
+    def test_write_parquet(self, stub_server, tmp_path):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            pytest.skip("pyarrow is not installed")
+        session = HawcSession(_url(stub_server))
+        path = session.write_parquet(_url(stub_server), tmp_path / "items.parquet", workers=3)
+        df = pd.read_parquet(path)
+        assert df.id.tolist() == list(range(COUNT))
+
+    def test_write_parquet_null_first_page(self, stub_server, tmp_path):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            pytest.skip("pyarrow is not installed")
+        session = HawcSession(_url(stub_server))
+        path = session.write_parquet(_url(stub_server, "sparse"), tmp_path / "items.parquet")
+        df = pd.read_parquet(path)
+        assert df.id.tolist() == list(range(COUNT))
+        assert df.value.isna().sum() == PAGE_SIZE
+        assert df.value.tolist()[PAGE_SIZE:] == [id * 0.5 for id in range(PAGE_SIZE, COUNT)]
+
+    def test_retries(self, stub_server):
+        session = HawcSession(_url(stub_server), retries=2, backoff=0.01)
+        response = session.get(_url(stub_server, "flaky"))
+        assert response.json()["count"] == COUNT
+
+        session = HawcSession(_url(stub_server), retries=1, backoff=0.01)
+        with pytest.raises(HawcServerException):
+            session.get(_url(stub_server, "flaky"), {"page": 2})
+
+
+class TestAsyncHawcSession:
+    def test_iter_pages(self, stub_server):
+        async def get_pages():
+            session = AsyncHawcSession(_url(stub_server), max_concurrency=4)
+            return [page async for page in session.iter_pages(_url(stub_server))]
+
+        pages = asyncio.run(get_pages())
+        # pages are yielded in order
+        assert [item["id"] for page in pages for item in page] == list(range(COUNT))
+        assert 1 < stub_server.max_in_flight <= 4
+
+    def test_retries(self, stub_server):
+        session = AsyncHawcSession(_url(stub_server), retries=2, backoff=0.01)
+        response = asyncio.run(session.get(_url(stub_server, "flaky")))
+        assert response.json()["count"] == COUNT
+
+    def test_client(self, stub_server):
+        async def get_many():
+            client = AsyncHawcClient(_url(stub_server), max_concurrency=2)
+            urls = [f"{_url(stub_server)}?page={page}" for page in range(1, 6)]
+            responses = await asyncio.gather(
+                *(client.call(client.session.get, url) for url in urls)
+            )
+            return [response.json()["results"] for response in responses]
+
+        pages = asyncio.run(get_many())
+        assert [item["id"] for page in pages for item in page] == list(range(COUNT))
+        assert 1 < stub_server.max_in_flight <= 2
+
+    def test_client_paginated(self, stub_server):
+        async def get_many():
+            client = AsyncHawcClient(_url(stub_server), max_concurrency=2)
+            return await asyncio.gather(
+                *(client.call(client.session.get_dataframe, _url(stub_server)) for _ in range(3))
+            )
+
+        dfs = asyncio.run(get_many())
+        assert all(df.id.tolist() == list(range(COUNT)) for df in dfs)
+        # paginated calls don't fan out past the concurrency limit
+        assert 1 < stub_server.max_in_flight <= 2
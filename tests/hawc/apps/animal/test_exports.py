@@ -1,8 +1,9 @@
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_series_equal
 
-from hawc.apps.animal import exports
+from hawc.apps.animal import constants, exports
 from hawc.apps.animal.models import Endpoint
 
 
@@ -26,3 +27,95 @@ class TestEndpointFlatDataPivot:
         exporter = exports.EndpointFlatDataPivot(queryset=Endpoint.objects.none())
         df2 = exporter.handle_treatment_period(df)
         assert_series_equal(df2["treatment period"], expected_output)
+
+    def test_handle_percent_control(self):
+        C, D = constants.DataType.CONTINUOUS, constants.DataType.DICHOTOMOUS
+        df = pd.DataFrame(
+            data=[
+                # endpoint, data_type, n, incidence, response, stdev
+                (1, C, 10, None, 5.0, 1.0),
+                (2, D, 10, 2, None, None),
+                (1, C, 10, None, 7.5, 2.0),
+                (2, D, 10, 4, None, None),
+                (1, C, 10, None, 2.5, 0.5),
+            ],
+            columns=[
+                "endpoint-id",
+                "endpoint-data_type",
+                "endpoint_group-n",
+                "endpoint_group-incidence",
+                "endpoint_group-response",
+                "endpoint_group-stdev",
+            ],
+        ).assign(**{"endpoint_group-lower_ci": None, "endpoint_group-upper_ci": None})
+
+        exporter = exports.EndpointFlatDataPivot(queryset=Endpoint.objects.none())
+        df2 = exporter.handle_percent_control(df)
+        # row order is unchanged; the first group of each endpoint is the control
+        assert df2["endpoint-id"].tolist() == [1, 2, 1, 2, 1]
+        assert np.allclose(df2["percent control mean"], [0, 0, 50, 100, -50])
+        assert df2["maximum endpoint change"].tolist() == [50, 100, 50, 100, 50]
+
+
+class TestVectorizedStatistics:
+    def test_cont_ci_array(self):
+        rng = np.random.default_rng(0)
+        stdev = rng.uniform(0.1, 10, 200)
+        n = rng.integers(1, 30, 200)
+        response = rng.uniform(-50, 50, 200)
+        lower, upper = exports.cont_ci_array(stdev, n, response)
+        expected = np.array(
+            [exports.cont_ci(*args) for args in zip(stdev, n, response, strict=False)]
+        )
+        assert np.allclose(lower, expected[:, 0])
+        assert np.allclose(upper, expected[:, 1])
+
+    def test_dich_ci_array(self):
+        rng = np.random.default_rng(0)
+        n = rng.integers(1, 100, 200)
+        incidence = rng.integers(0, n + 1)
+        lower, upper = exports.dich_ci_array(incidence, n)
+        expected = np.array([exports.dich_ci(*args) for args in zip(incidence, n, strict=False)])
+        assert np.allclose(lower, expected[:, 0], equal_nan=True)
+        assert np.allclose(upper, expected[:, 1], equal_nan=True)
+
+    def test_percent_control_array(self):
+        args = [
+            # n_1, mu_1, sd_1, n_2, mu_2, sd_2
+            (10, 5.0, 1.0, 10, 7.5, 2.0),
+            (10, 5.0, 0, 10, 7.5, 2.0),
+            (10, 0, 1.0, 10, 7.5, 2.0),
+            (10, 5.0, 1.0, 8, 2.5, 0.5),
+        ]
+        mean, low, high = exports.percent_control_array(*np.array(args).T)
+        for i, row in enumerate(args):
+            expected = [np.nan if v is None else v for v in exports.percent_control(*row)]
+            assert np.allclose([mean[i], low[i], high[i]], expected, equal_nan=True)
+
+    def test_add_confidence_intervals(self):
+        C, D = constants.DataType.CONTINUOUS, constants.DataType.DICHOTOMOUS
+        df = pd.DataFrame(
+            data=[
+                # data_type, lower_ci, upper_ci, n, response, stdev, incidence
+                (C, None, None, 10, 5.0, 1.0, None),
+                (C, 1.0, 2.0, 10, 5.0, 1.0, None),
+                (C, None, None, 0, 5.0, 1.0, None),
+                (C, None, None, 10, None, None, None),
+                (D, None, None, 10, None, None, 3),
+            ],
+            columns=[
+                "endpoint-data_type",
+                "endpoint_group-lower_ci",
+                "endpoint_group-upper_ci",
+                "endpoint_group-n",
+                "endpoint_group-response",
+                "endpoint_group-stdev",
+                "endpoint_group-incidence",
+            ],
+        )
+        df2 = exports.add_confidence_intervals(df.copy())
+        cont, dich = exports.cont_ci(1.0, 10, 5.0), exports.dich_ci(3, 10)
+        expected_lower = [cont[0], 1.0, np.nan, np.nan, dich[0]]
+        expected_upper = [cont[1], 2.0, np.nan, np.nan, dich[1]]
+        assert np.allclose(df2["endpoint_group-lower_ci"], expected_lower, equal_nan=True)
+        assert np.allclose(df2["endpoint_group-upper_ci"], expected_upper, equal_nan=True)
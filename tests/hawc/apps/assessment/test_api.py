@@ -98,6 +98,65 @@ class TestDatasetViewSet:
         assert resp.status_code == 404
 
 
+@pytest.mark.django_db
+class TestJobViewSet:
+    def test_export(self, db_keys):
+        client = get_client("team", api=True)
+        url = reverse("assessment:api:job-list")
+        payload = {"assessment": db_keys.assessment_final, "job": "ANIMAL_EXPORT"}
+
+        # create and complete; identical requests reuse the job
+        resp = client.post(url, payload, format="json")
+        assert resp.status_code == 201
+        assert resp.json()["kwargs"] == {"published_only": True}
+        detail_url = reverse("assessment:api:job-detail", args=(resp.json()["task_id"],))
+        data = client.get(detail_url).json()
+        assert data["status"] == "SUCCESS"
+        resp = client.post(url, payload | {"kwargs": {"published_only": True}}, format="json")
+        assert resp.status_code == 200
+        assert resp.json()["task_id"] == data["task_id"]
+
+        # download
+        resp = client.get(data["download_url"] + "?format=json")
+        assert resp.status_code == 200
+        assert len(resp.json()) == data["result"]["data"]["rows"]
+
+    def test_permissions(self, db_keys):
+        url = reverse("assessment:api:job-list")
+        payload = {"assessment": db_keys.assessment_final, "job": "EPI_EXPORT"}
+
+        # anonymous users can export published data from public assessments
+        client = get_client(api=True)
+        resp = client.post(url, payload, format="json")
+        assert resp.status_code == 201
+        detail_url = reverse("assessment:api:job-detail", args=(resp.json()["task_id"],))
+        assert client.get(detail_url).status_code == 200
+        resp = client.post(url, payload | {"kwargs": {"published_only": False}}, format="json")
+        assert resp.status_code == 403
+        resp = client.post(url, payload | {"assessment": db_keys.assessment_working}, format="json")
+        assert resp.status_code == 403
+
+        # only team members can view exports which include unpublished data
+        team = get_client("team", api=True)
+        resp = team.post(url, payload | {"kwargs": {"published_only": False}}, format="json")
+        assert resp.status_code == 201
+        task_id = resp.json()["task_id"]
+        detail_url = reverse("assessment:api:job-detail", args=(task_id,))
+        download_url = reverse("assessment:api:job-download", args=(task_id,))
+        assert team.get(detail_url).status_code == 200
+        assert team.get(download_url + "?format=json").status_code == 200
+        assert client.get(detail_url).status_code == 403
+        assert client.get(download_url + "?format=json").status_code == 403
+
+        # invalid kwargs
+        client = team
+        resp = client.post(url, payload | {"kwargs": {"foo": 1}}, format="json")
+        assert resp.status_code == 400
+        payload = {"assessment": db_keys.assessment_final, "job": "DATA_PIVOT_EXPORT"}
+        resp = client.post(url, payload | {"kwargs": {"data_pivot_id": -1}}, format="json")
+        assert resp.status_code == 400
+
+
 @pytest.mark.django_db
 class TestDssToxViewSet:
     def test_expected_response(self):
@@ -73,6 +73,13 @@ class TestDatasetForm:
         assert instance.revisions.count() == 1
         assert instance.revisions.first().notes == "notes"
 
+        # a columnar copy is saved on upload, and used to read the revision
+        revision = instance.revisions.first()
+        assert revision.get_columnar_path().exists()
+        pd.testing.assert_frame_equal(revision.get_df(), form.revision_df)
+        df = revision.get_df(columns=["species"])
+        assert df.shape == (150, 1)
+
     def test_required_data(self, db_keys):
         # data is required when creating a new dataset
         settings = {
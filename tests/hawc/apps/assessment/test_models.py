@@ -3,6 +3,7 @@ from django.contrib.auth.models import AnonymousUser
 from django.core.cache import cache
 from django.test.client import RequestFactory
 
+from hawc.apps.animal.models import Experiment
 from hawc.apps.assessment import constants, models
 
 
@@ -22,6 +23,30 @@ class TestJob:
         assert ran_job.status == constants.JobStatus.FAILURE
         assert ran_job.result.get("error") == "FAILURE"
 
+    def test_export_job(self, db_keys):
+        assessment = models.Assessment.objects.get(id=db_keys.assessment_final)
+        kw = dict(job=constants.JobType.LITERATURE_EXPORT, assessment=assessment)
+        job, created = models.Job.objects.get_or_create_job(**kw)
+        assert created is True
+        job.refresh_from_db()
+        assert job.status == constants.JobStatus.SUCCESS
+        export = job.get_export()
+        assert job.output.name.endswith(".arrow")
+        assert job.result["data"]["rows"] == export.df.shape[0] > 0
+        assert job.result["data"]["filename"] == export.filename
+
+        # identical requests reuse the job; other assessments do not
+        assert models.Job.objects.get_or_create_job(**kw) == (job, False)
+        other = models.Assessment.objects.get(id=db_keys.assessment_working)
+        _, created = models.Job.objects.get_or_create_job(job=kw["job"], assessment=other)
+        assert created is True
+
+        # output is removed with the job
+        storage, name = job.output.storage, job.output.name
+        assert storage.exists(name)
+        job.delete()
+        assert not storage.exists(name)
+
 
 class TestContent:
     @pytest.mark.django_db
@@ -53,6 +78,42 @@ class TestContent:
         assert cache.get(key) is None
 
 
+@pytest.mark.django_db
+class TestAssessment:
+    def test_data_presence(self, db_keys, django_capture_on_commit_callbacks):
+        assessment = models.Assessment.objects.get(id=db_keys.assessment_working)
+        key = models.Assessment.get_data_presence_cache_key(assessment.id)
+        with django_capture_on_commit_callbacks(execute=True):
+            models.Assessment.clear_data_presence_cache(assessment.id)
+
+        presence = models.Assessment.get_data_presence(assessment.id)
+        assert cache.get(key) == presence
+        assert presence["lit"] is assessment.references.exists()
+        assert presence["animal"] is (
+            Experiment.objects.filter(study__assessment=assessment).exists()
+        )
+        assert assessment.has_animal_data is presence["animal"]
+
+        # saving a data model clears the cache, after commit
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            Experiment.objects.filter(study__assessment=assessment).first().save()
+            assert cache.get(key) == presence
+        assert len(callbacks) == 1
+        assert cache.get(key) is None
+
+        # rows deleted in cascade from a study are cleared once, without a query per row
+        models.Assessment.get_data_presence(assessment.id)
+        study = Experiment.objects.filter(study__assessment=assessment).first().study
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            study.delete()
+        clears = [cb for cb in callbacks if "clear_data_presence_cache" in cb.__qualname__]
+        assert len(clears) == 1
+        assert cache.get(key) is None
+
+        # missing assessments have no data
+        assert not any(models.Assessment.get_data_presence(-1).values())
+
+
 class TestAssessmentDetail:
     def test_get_peer_review_status_display(self):
         obj = models.AssessmentDetail(peer_review_status=constants.PeerReviewType.JOURNAL)
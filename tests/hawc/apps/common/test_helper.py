@@ -1,12 +1,18 @@
+import json
+import threading
+import time
+from collections import Counter
 from io import StringIO
 
 import pandas as pd
 import pytest
+from django.core.cache import cache
 from django.core.exceptions import ValidationError as DjangoValidationError
 from pydantic import BaseModel
 from rest_framework.serializers import ValidationError as DRFValidationError
 
 from hawc.apps.common import helper
+from hawc.apps.study.models import Study
 
 
 def test_rename_duplicate_columns():
@@ -20,6 +26,204 @@ def test_rename_duplicate_columns():
     assert helper.rename_duplicate_columns(df).columns.tolist() == ["a.1", "b", "a.2"]
 
 
+class TestLocalCache:
+    def test_lru(self):
+        local = helper.LocalCache(maxsize=2, ttl=60)
+        local.set_many({"a": 1, "b": 2})
+        assert local.get_many(["a"]) == {"a": 1}
+        local.set_many({"c": 3})  # evicts b, the least recently used
+        assert local.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+        local.delete_many(["a"])
+        assert local.get_many(["a", "c"]) == {"c": 3}
+
+    def test_ttl(self):
+        local = helper.LocalCache(maxsize=2, ttl=-1)
+        local.set_many({"a": 1})
+        assert local.get_many(["a"]) == {}
+
+    def test_disabled(self):
+        local = helper.LocalCache(maxsize=0, ttl=60)
+        local.set_many({"a": 1})
+        assert local.get_many(["a"]) == {}
+
+
+@pytest.mark.django_db
+class TestSerializerHelper:
+    def test_get_serialized_many(self, db_keys, monkeypatch):
+        cache.clear()
+        monkeypatch.setattr(helper.SerializerHelper, "stats", Counter())
+        monkeypatch.setattr(helper.SerializerHelper, "local_cache", helper.LocalCache(100, 60))
+        ids = list(
+            Study.objects.filter(assessment_id=db_keys.assessment_working)
+            .order_by("-id")
+            .values_list("id", flat=True)
+        )
+
+        # misses are serialized and cached together
+        data = helper.SerializerHelper.get_serialized_many(Study, ids, json=False)
+        assert [d["id"] for d in data] == ids
+        assert helper.SerializerHelper.stats["misses"] == len(ids)
+
+        # hits from the local tier, then the shared cache
+        json_data = helper.SerializerHelper.get_serialized_many(Study, ids)
+        assert [json.loads(d)["id"] for d in json_data] == ids
+        assert helper.SerializerHelper.stats["local_hits"] == len(ids)
+        helper.SerializerHelper.local_cache.clear()
+        helper.SerializerHelper.get_serialized_many(Study, ids)
+        assert helper.SerializerHelper.stats["hits"] == len(ids)
+        assert helper.SerializerHelper.get_stats()["hit_ratio"] == pytest.approx(2 / 3)
+
+        # consistent with single-object lookups; deleting caches clears both tiers
+        study = Study.objects.get(id=ids[0])
+        assert helper.SerializerHelper.get_serialized(study) == json_data[0]
+        helper.SerializerHelper.delete_caches(Study, ids)
+        helper.SerializerHelper.get_serialized(study)
+        assert helper.SerializerHelper.stats["misses"] == len(ids) + 1
+
+    def test_bust_assessment_cache(self, db_keys, monkeypatch):
+        cache.clear()
+        monkeypatch.setattr(helper.SerializerHelper, "stats", Counter())
+        monkeypatch.setattr(helper.SerializerHelper, "local_cache", helper.LocalCache(100, 60))
+        study = Study.objects.filter(assessment_id=db_keys.assessment_working).first()
+        helper.SerializerHelper.get_serialized(study)
+        helper.SerializerHelper.get_serialized(study)
+        assert helper.SerializerHelper.stats["misses"] == 1
+
+        # a new generation is not found in either tier
+        helper.bust_assessment_cache(db_keys.assessment_working)
+        helper.SerializerHelper.get_serialized(study)
+        assert helper.SerializerHelper.stats["misses"] == 2
+
+    def test_known_assessment(self, db_keys, monkeypatch, django_assert_num_queries):
+        cache.clear()
+        monkeypatch.setattr(helper.SerializerHelper, "local_cache", helper.LocalCache(100, 60))
+        assessment_id = db_keys.assessment_working
+        ids = list(Study.objects.filter(assessment_id=assessment_id).values_list("id", flat=True))
+        expected = helper.SerializerHelper.get_serialized_many(Study, ids)
+
+        # primary keys require a query to find their assessment, unless it is given
+        with django_assert_num_queries(1):
+            assert helper.SerializerHelper.get_serialized_many(Study, ids) == expected
+        with django_assert_num_queries(0):
+            data = helper.SerializerHelper.get_serialized_many(
+                Study, ids, assessment_id=assessment_id
+            )
+            assert data == expected
+
+
+def test_assessment_cache_key():
+    cache.clear()
+    key = helper.assessment_cache_key(1, "test")
+    assert key.startswith("assessment-1-") and key.endswith("-test")
+    assert helper.assessment_cache_key(1, "test") == key
+    other = helper.assessment_cache_key(2, "test")
+
+    # busting changes keys for one assessment only, even if the generation was evicted
+    helper.bust_assessment_cache(1)
+    assert helper.assessment_cache_key(1, "test") != key
+    assert helper.assessment_cache_key(2, "test") == other
+    cache.clear()
+    assert helper.assessment_cache_key(2, "test") != other
+
+
+def test_cache_generation_scope(monkeypatch):
+    cache.clear()
+    key = helper.assessment_cache_key(1, "test")
+    lookups = []
+    get_many = cache.get_many
+    monkeypatch.setattr(cache, "get_many", lambda keys: lookups.append(keys) or get_many(keys))
+
+    # generations are read once per scope
+    with helper.cache_generation_scope():
+        assert helper.assessment_cache_key(1, "test") == key
+        assert helper.assessment_cache_key(1, "test") == key
+        assert len(lookups) == 1
+
+        # and updated when busted
+        helper.bust_assessment_cache(1)
+        busted = helper.assessment_cache_key(1, "test")
+        assert busted != key
+        assert len(lookups) == 1
+
+    # outside a scope, generations are always read
+    assert helper.assessment_cache_key(1, "test") == busted
+    assert len(lookups) == 2
+
+
+class TestCacheable:
+    def get_callable(self):
+        calls = []
+
+        def func():
+            calls.append(1)
+            return len(calls)
+
+        return func
+
+    def test_cacheable(self, monkeypatch):
+        cache.clear()
+        monkeypatch.setattr(helper, "cacheable_stats", Counter())
+        func = self.get_callable()
+        assert helper.cacheable(func, "test-key") == 1
+        assert helper.cacheable(func, "test-key") == 1
+        assert helper.cacheable(func, "test-key", flush=True) == 2
+        assert helper.cacheable_stats == Counter(hits=1, misses=1, recomputes=2)
+
+    def test_lock(self, monkeypatch):
+        cache.clear()
+        monkeypatch.setattr(helper, "cacheable_stats", Counter())
+        func = self.get_callable()
+
+        # another worker holds the lock; wait for its result instead of recomputing
+        cache.add("test-key-lock", True)
+        timer = threading.Timer(0.2, lambda: cache.set("test-key", 100))
+        timer.start()
+        assert helper.cacheable(func, "test-key", lock=True) == 100
+        timer.join()
+        assert helper.cacheable_stats["lock_waits"] == 1
+        assert helper.cacheable_stats["recomputes"] == 0
+
+        # lock released without a result; compute locally
+        cache.delete_many(["test-key", "test-key-lock"])
+        assert helper.cacheable(func, "test-key", lock=True) == 1
+        assert cache.get("test-key-lock") is None
+
+    def test_lock_wait(self, monkeypatch, settings):
+        cache.clear()
+        monkeypatch.setattr(helper, "cacheable_stats", Counter())
+        settings.CACHEABLE_LOCK_WAIT = 0.3
+        func = self.get_callable()
+
+        # another worker holds the lock for too long; stop waiting and compute locally
+        cache.add("test-key-lock", True)
+        start = time.monotonic()
+        assert helper.cacheable(func, "test-key", lock=True) == 1
+        assert time.monotonic() - start < 2
+        assert helper.cacheable_stats["lock_waits"] == 1
+        assert helper.cacheable_stats["recomputes"] == 1
+
+    def test_stale_while_revalidate(self, monkeypatch):
+        cache.clear()
+        monkeypatch.setattr(helper, "cacheable_stats", Counter())
+        func = self.get_callable()
+        kw = dict(cache_duration=60, stale_duration=60)
+        assert helper.cacheable(func, "test-key", **kw) == 1
+        assert helper.cacheable(func, "test-key", **kw) == 1
+
+        # stale value is served while revalidation is queued, once
+        cache.set("test-key", helper.CachedValue(1, time.time() - 1))
+        queued = []
+        assert helper.cacheable(func, "test-key", revalidate=lambda: queued.append(1), **kw) == 1
+        assert helper.cacheable(func, "test-key", revalidate=lambda: queued.append(1), **kw) == 1
+        assert queued == [1]
+        assert helper.cacheable_stats["stale_hits"] == 2
+
+        # without a revalidate hook, the caller holding the lock recomputes
+        cache.delete("test-key-lock")
+        assert helper.cacheable(func, "test-key", **kw) == 2
+        assert helper.cacheable(func, "test-key", **kw) == 2
+
+
 class TestFlatFileExporter:
     def test_get_flattened_tags(self):
         # check if key doesn't exist
@@ -1,9 +1,20 @@
+import logging
+import subprocess
+import sys
+
 import pytest
-from django.http import HttpRequest, HttpResponse
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from django.test import TestCase
 from django.test.client import Client, RequestFactory
 
-from hawc.apps.common.middleware import CsrfRefererCheckMiddleware, MicrosoftOfficeLinkMiddleware
+from hawc.apps.common.middleware import (
+    CsrfRefererCheckMiddleware,
+    MicrosoftOfficeLinkMiddleware,
+    RequestLogMiddleware,
+)
+from hawc.apps.myuser.models import HAWCUser
+from hawc.tools.logs.request import parse_request_logs
 
 
 class MicrosoftOfficeLinkMiddlewareTests(TestCase):
@@ -110,3 +121,55 @@ class TestCsrfRefererCheckMiddleware:
 
         resp = client.get("/", HTTP_REFERER=self.EXTERNAL_URL)
         assert resp.content == CsrfRefererCheckMiddleware.REFRESH
+
+
+class TestRequestLogMiddleware:
+    @pytest.mark.django_db
+    def test_stats(self, caplog):
+        def get_response(request):
+            HAWCUser.objects.count()
+            HAWCUser.objects.count()
+            return HttpResponse("ok")
+
+        request = RequestFactory().get("/test/1/")
+        request.user = AnonymousUser()
+        with caplog.at_level(logging.INFO, logger="hawc.request"):
+            RequestLogMiddleware(get_response)(request)
+        line = caplog.records[-1]
+        df = parse_request_logs(f"INFO 2021-08-26 19:51:02,705 hawc.request {line.getMessage()}")
+        row = df.iloc[0]
+        assert row.path == "/test/1/"
+        assert row.status_code == 200
+        assert row.sql_count == 2
+        assert row.ms >= row.sql_ms >= 0
+
+    @pytest.mark.django_db
+    def test_streaming(self, caplog):
+        def content():
+            for _ in range(3):
+                yield str(HAWCUser.objects.count())
+
+        def get_response(request):
+            return StreamingHttpResponse(content())
+
+        request = RequestFactory().get("/test/1/")
+        request.user = AnonymousUser()
+        with caplog.at_level(logging.INFO, logger="hawc.request"):
+            response = RequestLogMiddleware(get_response)(request)
+            # logged once the body is generated
+            assert not [r for r in caplog.records if r.name == "hawc.request"]
+            body = b"".join(response.streaming_content)
+            response.close()
+        (line,) = (r for r in caplog.records if r.name == "hawc.request")
+        df = parse_request_logs(f"INFO 2021-08-26 19:51:02,705 hawc.request {line.getMessage()}")
+        row = df.iloc[0]
+        assert row.sql_count == 3
+        assert row.content_length == len(body) > 0
+
+
+@pytest.mark.parametrize("module", ["middleware", "helper"])
+def test_import_order(module):
+    # helper and middleware import each other; either may be imported first
+    code = f"import hawc.apps.common.{module}"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -1,8 +1,10 @@
 import pytest
+from django.core.cache import cache
 
 # use concrete implementations to test
 from hawc.apps.animal.models import DoseGroup, Experiment
 from hawc.apps.common.models import (
+    TagClosure,
     apply_flavored_help_text,
     clone_name,
     sql_format,
@@ -46,6 +48,31 @@ class TestAssessmentRootMixin:
         assert not ReferenceFilterTag.objects.filter(id=40, name="Orphan").exists()
         assert ReferenceFilterTag.objects.all().count() == n - 1
 
+    def test_get_closure(self, db_keys):
+        assessment_id = db_keys.assessment_working
+        ReferenceFilterTag.clear_cache(assessment_id)
+        closure = ReferenceFilterTag.get_closure(assessment_id)
+        root = ReferenceFilterTag.get_assessment_root(assessment_id)
+        for tag in ReferenceFilterTag.get_assessment_qs(assessment_id, include_root=True):
+            expected = [tag.id, *tag.get_descendants().values_list("id", flat=True)]
+            assert closure.descendants[tag.id] == expected
+            assert tag.get_descendant_ids(assessment_id) == expected
+
+        # cleared with the tag tree
+        assert ReferenceFilterTag.get_closure(assessment_id) == closure
+        ReferenceFilterTag.clear_cache(assessment_id)
+        assert cache.get(ReferenceFilterTag.get_closure_cache_key(assessment_id)) is None
+
+        # tags missing from a stale closure are read from the database
+        child = root.add_child(name="new tag", slug="new-tag")
+        assert child.get_descendant_ids(closure=closure) == [child.id]
+
+
+def test_tag_closure():
+    tags = [{"id": 1, "children": [{"id": 2, "children": [{"id": 3}]}, {"id": 4}]}]
+    closure = TagClosure.from_tags(tags)
+    assert closure.descendants == {1: [1, 2, 3, 4], 2: [2, 3], 3: [3], 4: [4]}
+
 
 @pytest.mark.django_db
 class TestBaseManager:
@@ -8,7 +8,7 @@ from rest_framework.response import Response
 from rest_framework.test import APIRequestFactory
 
 from hawc.apps.common import renderers
-from hawc.apps.common.helper import FlatExport
+from hawc.apps.common.helper import FlatExport, StreamingFlatExport
 
 
 @pytest.fixture
@@ -64,6 +64,42 @@ def test_json_renderer(basic_export):
     assert json.loads(response) == [{"a.1": 1, "a.2": 2}, {"a.1": 3, "a.2": 4}]
 
 
+class TestStreamingResponse:
+    def get_request(self, renderer):
+        request = APIRequestFactory().get("/")
+        request.accepted_renderer = renderer
+        return request
+
+    def get_export(self, df: pd.DataFrame) -> StreamingFlatExport:
+        return StreamingFlatExport(chunks=(df.iloc[i : i + 1] for i in range(2)), filename="fn")
+
+    def test_streaming(self, basic_export):
+        for renderer in [
+            renderers.PandasCsvRenderer(),
+            renderers.PandasTsvRenderer(),
+            renderers.PandasJsonRenderer(),
+        ]:
+            request = self.get_request(renderer)
+            response = renderers.streaming_response(request, self.get_export(basic_export.df))
+            assert response.streaming is True
+            assert response["Content-Type"] == f"{renderer.media_type}; charset=utf-8"
+            expected = renderer.render(basic_export, renderer_context={"response": Response()})
+            assert response.getvalue().decode() == expected
+
+        # empty chunks
+        renderer = renderers.PandasJsonRenderer()
+        export = StreamingFlatExport(chunks=iter([basic_export.df.iloc[:0]]), filename="fn")
+        response = renderers.streaming_response(self.get_request(renderer), export)
+        assert json.loads(response.getvalue()) == []
+
+    def test_fallback(self, basic_export):
+        # renderers which cannot stream receive a concatenated export
+        request = self.get_request(renderers.PandasXlsxRenderer())
+        response = renderers.streaming_response(request, self.get_export(basic_export.df))
+        assert isinstance(response, Response)
+        assert response.data.df.equals(basic_export.df)
+
+
 class TestXlsxRenderer:
     def test_success(self, basic_export):
         resp_obj = Response()
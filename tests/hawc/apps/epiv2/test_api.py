@@ -1,3 +1,4 @@
+import json
 from copy import deepcopy
 
 import pytest
@@ -26,7 +27,7 @@ class TestEpiAssessmentViewSet:
         client = get_client("pm", api=True)
         response = check_200(client, url + "?unpublished=true")
         key = "api-epiv2-export-1.json"
-        check_api_json_data(response.json(), key, rewrite_data_files)
+        check_api_json_data(json.loads(response.getvalue()), key, rewrite_data_files)
 
     def test_study_export(self, rewrite_data_files):
         url = reverse("epiv2:api:assessment-study-export", args=(1,))
@@ -0,0 +1,51 @@
+from django.core.cache import cache
+
+from hawc.apps.lit.cache import ReferenceMetadataCache, fetch_hero_content
+from hawc.apps.lit.constants import ReferenceDatabase
+
+
+class TestReferenceMetadataCache:
+    def test_fetch_misses_only(self):
+        cache.clear()
+        requested = []
+
+        def fetch_missing(ids: list[int]) -> list[dict]:
+            requested.append(ids)
+            return [{"PMID": id_} for id_ in ids if id_ != 3]
+
+        metadata_cache = ReferenceMetadataCache(ReferenceDatabase.PUBMED)
+        content = metadata_cache.fetch([1, 2, 3], fetch_missing, "PMID")
+        assert [item["PMID"] for item in content] == [1, 2]
+        assert requested == [[1, 2, 3]]
+        assert metadata_cache.stats == {"hits": 0, "misses": 3, "hit_ratio": 0.0}
+
+        # only misses are fetched; failures are not cached
+        content = metadata_cache.fetch(["2", 1, 3, 4], fetch_missing, "PMID")
+        assert [item["PMID"] for item in content] == [2, 1, 4]
+        assert requested[1] == [3, 4]
+        assert metadata_cache.hits == 2
+        assert metadata_cache.misses == 5
+
+        # expired content is revalidated
+        metadata_cache.delete_many([1])
+        metadata_cache.fetch([1, 2], fetch_missing, "PMID")
+        assert requested[2] == [1]
+
+        # a refresh fetches all content, and caches it
+        metadata_cache.fetch([1, 2], fetch_missing, "PMID", refresh=True)
+        assert requested[3] == [1, 2]
+        metadata_cache.fetch([1, 2], fetch_missing, "PMID")
+        assert len(requested) == 4
+
+    def test_fetch_hero_content(self, settings, monkeypatch):
+        cache.clear()
+        monkeypatch.setattr(settings.HAWC_FEATURES, "FAKE_IMPORTS", True)
+        metadata_cache = ReferenceMetadataCache(ReferenceDatabase.HERO)
+        content = fetch_hero_content([123, 1234], metadata_cache)
+        assert [item["HEROID"] for item in content["success"]] == [123, 1234]
+        assert content["failure"] == []
+        content = fetch_hero_content([1234], metadata_cache)
+        assert metadata_cache.stats["hits"] == 1
+        content = fetch_hero_content([1234], metadata_cache, refresh=True)
+        assert [item["HEROID"] for item in content["success"]] == [1234]
+        assert metadata_cache.stats["hits"] == 1
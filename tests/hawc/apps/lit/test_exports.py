@@ -0,0 +1,22 @@
+from hawc.apps.lit.exports import TagMatrix
+
+
+class TestTagMatrix:
+    def test_get_membership(self):
+        # tag 1 has children 2 and 4; tag 2 has child 3
+        tag_tree = {1: {1, 2, 3, 4}, 2: {2, 3}, 3: {3}, 4: {4}, 5: {5}}
+        matrix = TagMatrix(tag_tree)
+        membership = matrix.get_membership(
+            [10, 11, 12, 13],
+            [(10, 3), (11, 4), (11, 5), (12, 2), (999, 1), (10, 999)],
+        )
+        assert membership.tolist() == [
+            [True, True, True, False, False],
+            [True, False, False, True, True],
+            [True, True, False, False, False],
+            [False, False, False, False, False],
+        ]
+
+    def test_empty(self):
+        assert TagMatrix({}).get_membership([1, 2], [(1, 1)]).shape == (2, 0)
+        assert TagMatrix({1: {1}}).get_membership([], []).shape == (0, 1)
@@ -1,6 +1,7 @@
 import os
 
 import pytest
+from django.core.cache import cache
 from django.test.client import Client
 from django.urls import reverse
 from pytest_django.asserts import assertFormError
@@ -422,3 +423,64 @@ class TestRis:
         # check that these exist and are properly associated with a reference
         assert models.Identifiers.objects.get(unique_id="10.1016/b36c36").references.count() == 1
         assert models.Identifiers.objects.get(unique_id="10.1016/b37c37").references.count() == 1
+
+    def test_ris_bulk(
+        self, db_keys, django_assert_max_num_queries, django_capture_on_commit_callbacks
+    ):
+        """Check that RIS imports use a fixed number of queries, and update existing references"""
+
+        def _search(slug):
+            return models.Search.objects.create(
+                assessment_id=db_keys.assessment_working,
+                search_type="i",
+                source=constants.ReferenceDatabase.RIS,
+                title=slug,
+                slug=slug,
+                description="-",
+            )
+
+        refs = [
+            dict(
+                id=i,
+                PMID=None,
+                accession_db="WOS",
+                accession_number=f"WOS:{i:06}",
+                doi=f"10.1000/ris-bulk.{i}",
+                title=f"Title {i}",
+                authors_short=f"Author {i}",
+                authors=[f"Author {i}"],
+                year=2020,
+                citation="Journal",
+                abstract="",
+            )
+            for i in range(50)
+        ]
+        n_refs = models.Reference.objects.count()
+
+        search = _search("ris-bulk-1")
+        with django_assert_max_num_queries(20):
+            identifiers = models.Identifiers.objects.get_from_ris(search.id, refs)
+            models.Reference.objects.update_from_ris_identifiers(search, identifiers)
+        assert models.Reference.objects.count() == n_refs + 50
+        ref = search.references.get(title="Title 7")
+        assert {ident.database for ident in ref.identifiers.all()} == {
+            constants.ReferenceDatabase.RIS,
+            constants.ReferenceDatabase.DOI,
+            constants.ReferenceDatabase.WOS,
+        }
+
+        # a second import matches existing references by DOI and WOS accession number; linking
+        # them to the search clears the overview
+        for ref in refs:
+            ref["title"] += " (updated)"
+        search = _search("ris-bulk-2")
+        overview_key = models.Reference.get_overview_cache_key(db_keys.assessment_working)
+        cache.set(overview_key, "overview")
+        with django_capture_on_commit_callbacks(execute=True):
+            identifiers = models.Identifiers.objects.get_from_ris(search.id, refs)
+            models.Reference.objects.update_from_ris_identifiers(search, identifiers)
+        assert cache.get(overview_key) is None
+        assert models.Reference.objects.count() == n_refs + 50
+        ref = search.references.get(title="Title 7 (updated)")
+        assert ref.searches.count() == 2
+        assert ref.identifiers.count() == 4
@@ -1,5 +1,8 @@
 import pytest
+from django.core.cache import cache
+from django.db.models import Count, Q
 
+from hawc.apps.assessment.models import Assessment
 from hawc.apps.lit import models
 
 
@@ -68,3 +71,56 @@ class TestReferenceManager:
             models.Reference.objects.filter(assessment=assessment, tags__in=tag_ids).count()
             > tagged_animal_before
         )
+
+    @pytest.mark.django_db
+    def test_get_overview_details(
+        self, db_keys, django_assert_max_num_queries, django_capture_on_commit_callbacks
+    ):
+        assessment = Assessment.objects.get(id=db_keys.assessment_conflict_resolution)
+        refs = models.Reference.objects.filter(assessment=assessment)
+        with django_capture_on_commit_callbacks(execute=True):
+            models.Reference.clear_overview_cache(assessment.id)
+
+        overview, workflows = models.Reference.objects.get_overview_details(assessment)
+        untagged = refs.filter(tags__isnull=True)
+        user_tags = models.UserReferenceTag.objects.filter(reference__in=refs)
+        assert overview["total_references"] == refs.count()
+        assert overview["total_untagged"] == untagged.count()
+        assert overview["total_tagged"] == refs.count() - untagged.count()
+        assert overview["total_reviews"] == user_tags.count()
+        assert overview["total_users"] == user_tags.values("user").distinct().count()
+        n_unresolved = Count("user_tags", filter=Q(user_tags__is_resolved=False))
+        assert overview["conflicts"] == (refs.annotate(n=n_unresolved).filter(n__gt=1).count())
+        for workflow in workflows:
+            if workflow.link_tagging:
+                workflow_refs = refs.filter(id__in=refs.in_workflow(workflow).values("id"))
+                assert workflow.needs_tagging == (
+                    workflow_refs.annotate(n=n_unresolved).filter(n__lt=2).count()
+                )
+
+        # cached; statistics only require a workflow query
+        with django_assert_max_num_queries(1):
+            assert models.Reference.objects.get_overview_details(assessment)[0] == overview
+
+        # cleared when tags change, after commit
+        ref = untagged.first()
+        with django_capture_on_commit_callbacks(execute=True):
+            ref.tags.set([models.ReferenceFilterTag.get_assessment_qs(assessment.id).last().id])
+        assert cache.get(models.Reference.get_overview_cache_key(assessment.id)) is None
+        overview, _ = models.Reference.objects.get_overview_details(assessment)
+        assert overview["total_untagged"] == untagged.count()
+
+
+class TestReferenceQuerySet:
+    @pytest.mark.django_db
+    def test_with_tag(self, db_keys, django_assert_num_queries):
+        assessment_id = db_keys.assessment_working
+        tag = models.ReferenceFilterTag.get_assessment_root(assessment_id).get_children().first()
+        refs = models.Reference.objects.filter(assessment=assessment_id)
+        tag_ids = tag.get_descendant_ids(assessment_id)
+        expected = set(refs.filter(tags__in=tag_ids).values_list("id", flat=True))
+
+        # descendants are selected without looking up the tag's assessment
+        with django_assert_num_queries(1):
+            ids = {ref.id for ref in refs.with_tag(tag, descendants=True)}
+        assert ids == expected
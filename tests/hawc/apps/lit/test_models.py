@@ -1,8 +1,9 @@
 import pytest
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 
 from hawc.apps.assessment.models import HAWCUser
-from hawc.apps.lit.models import Reference, ReferenceFilterTag, Search
+from hawc.apps.lit.models import Identifiers, Reference, ReferenceFilterTag, Search
 from hawc.apps.study.models import Study
 
 
@@ -169,3 +170,126 @@ class TestSearch:
         search.run_new_query()
         assert search.references.count() == 3
         search.delete()
+
+    def test_create_new_references(self, django_assert_num_queries):
+        search = Search.objects.create(
+            assessment_id=1, title="bulk", slug="bulk", search_type="s", source=1, search_string="x"
+        )
+        pmids = list(range(990_000_000, 990_000_010))
+        Identifiers.objects.bulk_create(
+            [
+                Identifiers(database=1, unique_id=str(pmid), content=f'{{"title": "{pmid}"}}')
+                for pmid in pmids
+            ]
+        )
+        existing = Reference.objects.create(assessment_id=1, title="existing")
+        existing.identifiers.add(Identifiers.objects.get(database=1, unique_id=str(pmids[0])))
+        assert search.assessment.id == 1  # prefetch assessment
+
+        # 1 insert-select for existing references, 1 identifier query, 3 inserts per batch
+        with django_assert_num_queries(1 + 1 + 3 * 3):
+            search.create_new_references({"added": pmids}, batch_size=4)
+
+        assert search.references.count() == 10
+        assert list(search.references.order_by("id").values_list("title", flat=True)) == [
+            "existing",
+            *(str(pmid) for pmid in pmids[1:]),
+        ]
+        assert all(ref.identifiers.count() == 1 for ref in search.references.all())
+
+    def test_overview_cache(self, django_capture_on_commit_callbacks):
+        key = Reference.get_overview_cache_key(1)
+        search = Search.objects.create(
+            assessment_id=1, title="link", slug="link", search_type="s", source=1, search_string="x"
+        )
+        ident = Identifiers.objects.create(
+            database=1, unique_id="990000100", content='{"title": "linked"}'
+        )
+        Reference.objects.create(assessment_id=1, title="existing").identifiers.add(ident)
+
+        # linking only existing references clears the overview, after commit
+        cache.set(key, "overview")
+        with django_capture_on_commit_callbacks(execute=True):
+            search.create_new_references({"added": [990000100]})
+            assert cache.get(key) == "overview"
+        assert search.references.count() == 1
+        assert cache.get(key) is None
+
+        # deleting a search clears the overview
+        cache.set(key, "overview")
+        with django_capture_on_commit_callbacks(execute=True):
+            search.delete()
+        assert cache.get(key) is None
+
+    @pytest.mark.parametrize("batch_size,n_batches", [(3, 3), (100, 1)])
+    def test_get_pubmed_references(self, django_assert_num_queries, batch_size, n_batches):
+        search = Search.objects.create(
+            assessment_id=1, title="bulk", slug="bulk", search_type="s", source=1, search_string="x"
+        )
+        pmids = list(range(990_000_100, 990_000_110))
+        Identifiers.objects.bulk_create(
+            [
+                Identifiers(
+                    database=1,
+                    unique_id=str(pmid),
+                    content=f'{{"title": "{pmid}", "doi": "10.1000/bulk.{pmid}"}}',
+                )
+                for pmid in pmids
+            ]
+        )
+        existing = Reference.objects.create(assessment_id=1, title="existing")
+        existing.identifiers.add(Identifiers.objects.get(database=1, unique_id=str(pmids[0])))
+        identifiers = Identifiers.objects.pubmed(pmids)
+        assert search.assessment.id == 1  # prefetch assessment
+
+        # 1 insert-select for existing references, 1 reference query, 1 identifier query,
+        # 1 doi query, 1 doi insert, and 3 inserts per batch
+        with django_assert_num_queries(5 + 3 * n_batches):
+            refs = Reference.objects.get_pubmed_references(search, identifiers, batch_size)
+
+        assert len(refs) == 10
+        assert search.references.count() == 10
+        ref = search.references.get(title=str(pmids[1]))
+        assert sorted(ref.identifiers.values_list("database", "unique_id")) == [
+            (1, str(pmids[1])),
+            (4, f"10.1000/bulk.{pmids[1]}"),
+        ]
+
+    def test_get_hero_references(self):
+        search = Search.objects.create(
+            assessment_id=1, title="hero", slug="hero", search_type="i", source=2, search_string="x"
+        )
+        pubmed = Identifiers.objects.bulk_create(
+            [
+                Identifiers(database=1, unique_id="990000201", content="{}"),
+                Identifiers(database=1, unique_id="990000202", content="{}"),
+            ]
+        )
+        existing = Reference.objects.create(assessment_id=1, title="existing")
+        existing.identifiers.add(pubmed[0])
+        hero_ids = [990_000_301, 990_000_302, 990_000_303, 990_000_304]
+        Identifiers.objects.bulk_create(
+            [
+                Identifiers(database=2, unique_id=str(hero_id), content=content)
+                for hero_id, content in zip(
+                    hero_ids,
+                    [
+                        '{"title": "a", "PMID": 990000201}',
+                        '{"title": "b", "PMID": 990000202}',
+                        '{"title": "c", "PMID": 990000202}',
+                        '{"title": "d"}',
+                    ],
+                    strict=True,
+                )
+            ]
+        )
+
+        refs = Reference.objects.get_hero_references(search, Identifiers.objects.hero(hero_ids))
+
+        # existing reference is matched by pubmed id; references sharing a pubmed id are merged
+        assert sorted(ref.title for ref in refs) == ["b", "b", "d", "existing"]
+        assert search.references.count() == 3
+        assert existing.identifiers.count() == 2
+        assert sorted(
+            search.references.get(title="b").identifiers.values_list("unique_id", flat=True)
+        ) == ["990000202", "990000302", "990000303"]
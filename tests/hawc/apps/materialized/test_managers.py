@@ -83,3 +83,18 @@ class TestFinalRiskOfBiasScoreManager:
             ]
         )
         assert expected_scores_set == actual_scores_set
+
+    def test_endpoint_scores_many(self):
+        # scores resolved together match scores resolved individually
+        endpoint_ids = [1, 3, 6]
+        qs = models.FinalRiskOfBiasScore.objects.all()
+        actual_scores = qs.endpoint_scores(endpoint_ids)
+        for endpoint_id in endpoint_ids:
+            expected = models.FinalRiskOfBiasScore.objects.all().endpoint_scores([endpoint_id])
+            assert expected
+            assert {k: v for k, v in actual_scores.items() if k[0] == endpoint_id} == expected
+
+        # indexes are built once and reused
+        scores_by_study = qs._scores_by_study
+        qs.endpoint_scores(endpoint_ids)
+        assert qs._scores_by_study is scores_by_study
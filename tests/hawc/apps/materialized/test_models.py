@@ -0,0 +1,89 @@
+import pytest
+
+from hawc.apps.materialized import models
+from hawc.apps.riskofbias.models import RiskOfBias, RiskOfBiasScore
+
+
+def _final_score() -> RiskOfBiasScore:
+    return RiskOfBiasScore.objects.filter(
+        riskofbias__final=True, riskofbias__active=True, is_default=True
+    ).first()
+
+
+@pytest.mark.django_db
+class TestFinalRiskOfBiasScore:
+    def test_refresh(self):
+        n_rows = models.FinalRiskOfBiasScore.objects.count()
+        metrics = models.FinalRiskOfBiasScore.refresh(force=True)
+        assert metrics["deleted"] == metrics["inserted"] == n_rows
+        assert metrics["delta"] == 0
+
+        # refresh only if flagged
+        assert models.FinalRiskOfBiasScore.refresh() is None
+        models.FinalRiskOfBiasScore.set_refresh_flag(True)
+        assert models.FinalRiskOfBiasScore.refresh()["delta"] == 0
+
+    def test_refresh_partial(self):
+        score = _final_score()
+        other_ids = set(
+            models.FinalRiskOfBiasScore.objects.exclude(
+                riskofbias_id=score.riskofbias_id
+            ).values_list("id", flat=True)
+        )
+        RiskOfBiasScore.objects.filter(id=score.id).update(notes="updated")
+
+        metrics = models.FinalRiskOfBiasScore.refresh_partial(riskofbias=[score.riskofbias_id])
+        assert len(metrics) == 1
+        assert metrics[0]["delta"] == 0
+        assert (
+            models.FinalRiskOfBiasScore.objects.filter(score_id=score.id).first().score_notes
+            == "updated"
+        )
+
+        # rows for other risk of bias evaluations are untouched
+        assert other_ids.issubset(
+            set(models.FinalRiskOfBiasScore.objects.values_list("id", flat=True))
+        )
+
+        # deactivated evaluations are removed
+        RiskOfBias.objects.filter(id=score.riskofbias_id).update(active=False)
+        metrics = models.FinalRiskOfBiasScore.refresh_partial(riskofbias=[score.riskofbias_id])
+        assert metrics[0]["inserted"] == 0
+        assert not models.FinalRiskOfBiasScore.objects.filter(score_id=score.id).exists()
+
+    def test_signals(self, django_capture_on_commit_callbacks):
+        score = _final_score()
+        with django_capture_on_commit_callbacks(execute=True):
+            score.notes = "signal updated"
+            score.save()
+        assert (
+            models.FinalRiskOfBiasScore.objects.filter(score_id=score.id).first().score_notes
+            == "signal updated"
+        )
+
+    def test_refresh_assessment(self):
+        score = _final_score()
+        RiskOfBiasScore.objects.filter(id=score.id).update(notes="assessment updated")
+        models.refresh_all_mvs(assessment_id=score.riskofbias.study.assessment_id)
+        assert (
+            models.FinalRiskOfBiasScore.objects.filter(score_id=score.id).first().score_notes
+            == "assessment updated"
+        )
+
+    def test_mark_dirty_study(self, django_capture_on_commit_callbacks):
+        # bulk changes bypass signals; studies are marked dirty explicitly
+        score = _final_score()
+        study_id = score.riskofbias.study_id
+        with django_capture_on_commit_callbacks(execute=True):
+            RiskOfBias.objects.filter(study_id=study_id, final=True).update(active=False)
+            models.FinalRiskOfBiasScore.mark_dirty(study=[study_id])
+        assert not models.FinalRiskOfBiasScore.objects.filter(study_id=study_id).exists()
+
+    def test_mark_dirty_once(self, django_capture_on_commit_callbacks):
+        # many changes in a transaction are refreshed by a single callback
+        scores = RiskOfBiasScore.objects.filter(riskofbias_id=_final_score().riskofbias_id)
+        assert scores.count() > 1
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            for score in scores:
+                score.save()
+        assert callbacks.count(models.refresh_pending) == 1
@@ -40,7 +40,8 @@ class TestRiskOfBiasAssessmentViewSet:
         # check data
         resp = team_client.get(url)
         assert resp.status_code == 200
-        check_api_json_data(resp.json(), fn, rewrite_data_files)
+        assert resp.streaming
+        check_api_json_data(json.loads(resp.getvalue()), fn, rewrite_data_files)
 
     def test_export(self, rewrite_data_files: bool, db_keys):
         # permission check
@@ -62,7 +63,8 @@ class TestRiskOfBiasAssessmentViewSet:
 
         resp = anon_client.get(url)
         assert resp.status_code == 200
-        check_api_json_data(resp.json(), fn, rewrite_data_files)
+        assert resp.streaming
+        check_api_json_data(json.loads(resp.getvalue()), fn, rewrite_data_files)
 
     def test_PandasXlsxRenderer(self, db_keys):
         """
@@ -1,3 +1,5 @@
+import json
+
 import pandas as pd
 import pytest
 
@@ -27,3 +29,50 @@ class TestRiskOfBiasCompleteFlat:
         qs = RiskOfBiasScore.objects.none()
         export = exports.RiskOfBiasCompleteExporter.flat_export(qs, filename="test")
         check_metadata_accuracy(export)
+
+    def test_streaming_export(self, db_keys):
+        qs = RiskOfBiasScore.objects.filter(
+            riskofbias__study__assessment=db_keys.assessment_working
+        ).order_by("id")
+        expected = exports.RiskOfBiasCompleteExporter.flat_export(qs, filename="test")
+        export = exports.RiskOfBiasCompleteExporter.streaming_export(qs, "test", chunk_size=2)
+        chunks = list(export.chunks)
+        assert len(chunks) > 1
+        assert all(chunk.shape[0] <= 2 for chunk in chunks)
+        df = pd.concat(chunks, ignore_index=True)
+        assert json.loads(df.to_json(orient="records")) == json.loads(
+            expected.df.to_json(orient="records")
+        )
+
+        # falls back to a complete export, with metadata
+        export = exports.RiskOfBiasCompleteExporter.streaming_export(qs, "test", chunk_size=2)
+        check_metadata_accuracy(export.to_flat_export())
+
+    def test_chunked_df(self, db_keys):
+        qs = RiskOfBiasScore.objects.filter(
+            riskofbias__study__assessment=db_keys.assessment_working
+        ).order_by("id")
+        expected = exports.RiskOfBiasCompleteExporter().get_df(qs)
+        df = exports.RiskOfBiasCompleteExporter().get_df(qs, chunk_size=2)
+        assert json.loads(df.to_json(orient="records")) == json.loads(
+            expected.to_json(orient="records")
+        )
+
+        # modules which are not chunk-safe prepare the complete dataframe
+        sizes = []
+
+        class UnsafeExport(exports.RiskOfBiasScoreExport):
+            chunk_safe = False
+
+            def prepare_df(self, df: pd.DataFrame) -> pd.DataFrame:
+                sizes.append(df.shape[0])
+                return super().prepare_df(df)
+
+        class Exporter(exports.RiskOfBiasCompleteExporter):
+            def build_modules(self):
+                return [UnsafeExport("rob_score", "")]
+
+        df = Exporter().get_df(qs, chunk_size=2)
+        assert sizes == [expected.shape[0]]
+        chunks = list(Exporter().iter_df(qs, chunk_size=2))
+        assert len(chunks) == 1
@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+from django.contrib.contenttypes.models import ContentType
+
+from hawc.apps.study.models import Study
+from hawc.apps.udf import exports, models
+
+
+@pytest.mark.django_db
+class TestModelUDFContentExporter:
+    def test_chunked_df(self):
+        # content with different fields in different chunks
+        existing = models.ModelUDFContent.objects.get(id=1)
+        models.ModelUDFContent.objects.create(
+            model_binding=existing.model_binding,
+            content_type=ContentType.objects.get_for_model(Study),
+            object_id=8,
+            content={"field3": "other"},
+        )
+        qs = models.ModelUDFContent.objects.order_by("id")
+        expected = exports.ModelUDFContentExporter().get_df(qs)
+        assert {"content-field-field1", "content-field-field3"}.issubset(expected.columns)
+
+        df = exports.ModelUDFContentExporter().get_df(qs, chunk_size=1)
+        pd.testing.assert_frame_equal(df, expected)
+        chunks = list(exports.ModelUDFContentExporter().iter_df(qs, chunk_size=1))
+        assert len(chunks) == 1
+        pd.testing.assert_frame_equal(chunks[0], expected)
+
+    def test_module_order(self):
+        # modules after one which is not chunk-safe still prepare data in order
+        calls = []
+
+        class ContentExport(exports.ModelUDFContentExport):
+            def prepare_df(self, df):
+                calls.append("content")
+                return super().prepare_df(df)
+
+        class TypeExport(exports.ContentTypeExport):
+            def prepare_df(self, df):
+                calls.append("type")
+                return super().prepare_df(df)
+
+        class Exporter(exports.ModelUDFContentExporter):
+            def build_modules(self):
+                return [ContentExport(), TypeExport("content_type", "content_type")]
+
+        Exporter().get_df(models.ModelUDFContent.objects.order_by("id"), chunk_size=1)
+        assert calls == ["content", "type"]
@@ -5,15 +5,35 @@ from hawc.refml import tags
 
 
 @pytest.mark.django_db
-def test_build_tree_node_dict(db_keys):
+def test_build_tag_tree(db_keys):
     tree = models.ReferenceFilterTag.get_all_tags(db_keys.assessment_final)
-    node_dict = tags.build_tree_node_dict(tree)
+    tag_tree = tags.build_tag_tree(tree)
 
     root = models.ReferenceFilterTag.get_assessment_root(db_keys.assessment_final)
     node_list = models.ReferenceFilterTag.get_annotated_list(root)
 
-    # Make sure the built dict has the expected number of entries
-    assert len(node_dict) == len(node_list)
+    # Make sure the built tree has the expected number of entries
+    assert len(tag_tree) == len(node_list)
+
+
+def test_tag_tree_ancestors():
+    tree = [
+        {
+            "id": 1,
+            "data": {"name": "root"},
+            "children": [
+                {"id": 2, "data": {"name": "a"}, "children": [{"id": 3, "data": {"name": "b"}}]},
+                {"id": 4, "data": {"name": "c"}},
+            ],
+        }
+    ]
+    df = tags.build_tag_tree(tree).ancestors()
+    assert df.values.tolist() == [
+        [2, "assessment-root (1)", "a"],
+        [3, "a (2)", "b"],
+        [3, "assessment-root (1)", "a"],
+        [4, "assessment-root (1)", "c"],
+    ]
 
 
 @pytest.mark.django_db
@@ -21,8 +41,8 @@ def test_create_df(db_keys):
     tree = models.ReferenceFilterTag.get_all_tags(db_keys.assessment_final)
     tag_qs = models.ReferenceTags.objects.assessment_qs(db_keys.assessment_final)
 
-    node_dict = tags.build_tree_node_dict(tree)
-    df = tags.create_df(tag_qs, node_dict)
+    tag_tree = tags.build_tag_tree(tree)
+    df = tags.create_df(tag_qs, tag_tree)
 
     # Make sure the dataframe has the expected number of rows
     assert len(df) == len(tag_qs)
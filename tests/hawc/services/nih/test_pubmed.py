@@ -1,4 +1,10 @@
+import io
 import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
 
 import pytest
 
@@ -225,3 +231,132 @@ class TestPubMedFetch:
         ]
         actual = [item["authors_short"] for item in fetch.content]
         assert expected == actual
+
+
+class StubEutilsHandler(BaseHTTPRequestHandler):
+    """Minimal E-utilities stub; responds to esearch and efetch requests."""
+
+    ids = list(range(1000, 1025))
+    requests_seen: list[str] = []
+    fail_once: set[str] = set()
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        data = parse_qs(self.rfile.read(length).decode())
+        self.requests_seen.append(self.path)
+        key = f"{self.path}-{data.get('retstart', data.get('id', [''])[0])}"
+        if key in self.fail_once:
+            self.fail_once.remove(key)
+            self.send_response(503)
+            self.end_headers()
+            return
+        if self.path == "/esearch.fcgi":
+            if data.get("rettype") == ["count"]:
+                body = f"<eSearchResult><Count>{len(self.ids)}</Count></eSearchResult>"
+            else:
+                start, size = int(data["retstart"][0]), int(data["retmax"][0])
+                ids = "".join(f"<Id>{id_}</Id>" for id_ in self.ids[start : start + size])
+                body = f"<eSearchResult><IdList>{ids}</IdList></eSearchResult>"
+        else:
+            articles = "".join(
+                f"<PubmedArticle><MedlineCitation><PMID>{id_}</PMID><Article>"
+                f"<ArticleTitle>Title {id_}</ArticleTitle></Article></MedlineCitation>"
+                "</PubmedArticle>"
+                for id_ in data["id"]
+            )
+            body = f"<PubmedArticleSet>{articles}</PubmedArticleSet>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/xml")
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+
+@pytest.fixture
+def eutils_stub(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubEutilsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    monkeypatch.setattr(pubmed.PubMedSearch, "base_url", f"{url}/esearch.fcgi")
+    monkeypatch.setattr(pubmed.PubMedFetch, "base_url", f"{url}/efetch.fcgi")
+    monkeypatch.setattr(pubmed.settings, "rate_limiter", pubmed.RateLimiter(100))
+    StubEutilsHandler.requests_seen = []
+    StubEutilsHandler.fail_once = set()
+    yield StubEutilsHandler
+    server.shutdown()
+    server.server_close()
+
+
+class TestConcurrentEutils:
+    def test_search(self, eutils_stub):
+        search = pubmed.PubMedSearch(term="foo", retmax=4)
+        search.get_ids_count()
+        search.get_ids()
+        assert search.request_count == 7
+        assert search.ids == eutils_stub.ids
+
+    def test_fetch_ordered(self, eutils_stub):
+        ids = eutils_stub.ids
+        fetch = pubmed.PubMedFetch(id_list=ids, retmax=3)
+        fetch.get_content()
+        assert fetch.request_count == 9
+        assert len(eutils_stub.requests_seen) == 9
+        assert [item["PMID"] for item in fetch.content] == ids
+        assert fetch.content[0]["title"] == "Title 1000"
+
+    def test_fetch_retry(self, eutils_stub, monkeypatch):
+        # retries wait for the rate limiter too
+        waits = []
+        monkeypatch.setattr(pubmed.settings.rate_limiter, "wait", lambda: waits.append(1))
+        eutils_stub.fail_once.add("/efetch.fcgi-1003")
+        fetch = pubmed.PubMedFetch(id_list=eutils_stub.ids, retmax=3)
+        fetch.get_content()
+        assert len(eutils_stub.requests_seen) == len(waits) == 10
+        assert [item["PMID"] for item in fetch.content] == eutils_stub.ids
+
+    def test_rate_limit(self):
+        limiter = pubmed.RateLimiter(20)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.wait()
+        assert time.monotonic() - start >= 0.2
+
+    def test_fetch_without_xml(self, eutils_stub):
+        fetch = pubmed.PubMedFetch(id_list=eutils_stub.ids[:5], include_xml=False)
+        items = list(fetch.iter_content())
+        assert [item["PMID"] for item in items] == eutils_stub.ids[:5]
+        assert all(item["xml"] == "" for item in items)
+
+
+class TestPubMedParser:
+    xml = (
+        b'<?xml version="1.0" ?><PubmedArticleSet>'
+        b"<PubmedArticle><MedlineCitation><PMID>1</PMID><Article><ArticleTitle>A</ArticleTitle>"
+        b"<AuthorList><Author><LastName>Smith</LastName><Initials>J</Initials></Author>"
+        b"</AuthorList></Article></MedlineCitation></PubmedArticle>"
+        b"<DeleteCitation><PMID>2</PMID></DeleteCitation>"
+        b"<PubmedBookArticle><BookDocument><PMID>3</PMID><Book><BookTitle>B</BookTitle>"
+        b"<PubDate><Year>2001</Year></PubDate></Book></BookDocument></PubmedBookArticle>"
+        b"</PubmedArticleSet>"
+    )
+
+    def test_iterparse(self):
+        expected = [
+            pubmed.PubMedParser.parse(el)
+            for el in ET.fromstring(self.xml)
+            if el.tag != "DeleteCitation"
+        ]
+        actual = list(pubmed.PubMedParser.iterparse(io.BytesIO(self.xml)))
+        assert actual == expected
+        assert [item["PMID"] for item in actual] == [1, 3]
+        assert actual[0]["xml"].startswith("<PubmedArticle>")
+
+        actual = list(pubmed.PubMedParser.iterparse(io.BytesIO(self.xml), include_xml=False))
+        assert [item["xml"] for item in actual] == ["", ""]
+
+    def test_iterparse_bad_root(self):
+        with pytest.raises(ValueError, match="Unexpected response type"):
+            list(pubmed.PubMedParser.iterparse(io.BytesIO(b"<eFetchResult></eFetchResult>")))
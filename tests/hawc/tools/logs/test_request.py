@@ -1,17 +1,45 @@
-from hawc.tools.logs.request import parse_request_logs
+from hawc.tools.logs.request import (
+    endpoint_latency,
+    normalize_path,
+    parse_request_logs,
+    slowest_requests,
+)
 
 logs = """
 INFO 2021-08-26 19:51:02,705 hawc.request GET /assessment/public/ 200 4887 ip-127.0.0.1 user-0 assess-0
 INFO 2021-08-26 19:51:10,325 hawc.request GET /study/7/ 200 20116 ip-127.0.0.1 user-1 assess-2
 INFO 2021-08-26 19:51:11,389 hawc.request GET /study/7/update/ 200 18401 ip-127.0.0.1 user-1 assess-2
 INFO 2021-08-26 19:51:12,891 hawc.request GET /study/api/study/7/ 200 29000 ip-127.0.0.1 user-1 assess-0
+INFO 2021-08-26 19:51:13,105 hawc.request GET /study/7/ 200 20116 ip-127.0.0.1 user-1 assess-2 ms-120.5 sql-30 sqlms-40.2 cache-hit-3 cache-miss-1 cache-set-1
+INFO 2021-08-26 19:51:14,218 hawc.request GET /study/8/ 200 18401 ip-127.0.0.1 user-1 assess-2 ms-80.0 sql-10 sqlms-12.0 cache-hit-4 cache-miss-0 cache-set-0
+INFO 2021-08-26 19:51:15,734 hawc.request GET /study/api/study/7/ 200 29000 ip-127.0.0.1 user-1 assess-0 ms-300.1 sql-5 sqlms-2.0 cache-hit-0 cache-miss-2 cache-set-2
 """
 
 
 def test_parse_request_logs():
     df = parse_request_logs(logs)
-    assert df.shape == (4, 9)
+    assert df.shape == (7, 15)
     assert set(df.status_code.values.tolist()) == {200}
     assert set(df.ip.values.tolist()) == {"127.0.0.1"}
     assert set(df.user_id.values.tolist()) == {0, 1}
     assert set(df.assessment_id.values.tolist()) == {0, 2}
+    assert df.ms.isna().sum() == 4
+    assert df.sql_count.sum() == 45
+
+
+def test_normalize_path():
+    assert normalize_path("/study/api/study/7/") == "/study/api/study/{id}/"
+    assert normalize_path("/assessment/12/endpoints/v2/") == "/assessment/{id}/endpoints/v2/"
+
+
+def test_endpoint_latency():
+    df = endpoint_latency(parse_request_logs(logs))
+    assert df.endpoint.tolist() == ["/study/api/study/{id}/", "/study/{id}/"]
+    assert df.requests.tolist() == [1, 2]
+    assert df.p50_ms.tolist() == [300.1, 100.25]
+    assert df.mean_sql_count.tolist() == [5, 20]
+
+
+def test_slowest_requests():
+    df = slowest_requests(parse_request_logs(logs), n=2)
+    assert df.path.tolist() == ["/study/api/study/7/", "/study/7/"]